@@ -29,6 +29,10 @@ class Settings(BaseSettings):
     # Puerto (Railway/Heroku lo proporcionan automáticamente con $PORT)
     port: int = int(os.getenv("PORT", "8000"))
 
+    # Hilos para endpoints síncronos (def). Cada llamada a Firestore bloquea un hilo
+    # mientras espera la red; el valor por defecto de AnyIO (40) se queda corto.
+    threadpool_size: int = 100
+
     # Debug (automático: solo activo en desarrollo)
     @property
     def debug(self) -> bool:
@@ -197,12 +197,33 @@ class StructuredLogger:
         parts = [f"{key}={value}" for key, value in extra.items()]
         return f" | {' | '.join(parts)}"
 
-    def debug(self, message: str, **extra):
+    def isEnabledFor(self, level: int) -> bool:
+        """Indica si un nivel de log está habilitado.
+
+        Sirve para no calcular argumentos costosos que no se van a emitir.
+
+        Ejemplo:
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Partidas: %s", len(games))
+        """
+        return self.logger.isEnabledFor(level)
+
+    def debug(self, message: str, *args, **extra):
         """Log de debug (solo visible si LOG_LEVEL=DEBUG).
 
+        Si el nivel no está habilitado retorna sin formatear nada, así que
+        es seguro llamarlo en rutas calientes (escrituras a Firestore).
+        Igual que en logging, los args posicionales se interpolan con %
+        solo si el mensaje se va a emitir.
+
         Ejemplo:
             logger.debug("Consultando BD", player_id="123", query="SELECT")
+            logger.debug("Partida actualizada: %s", game_id)
         """
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
+        if args:
+            message = message % args
         if settings.log_format == "json" and extra:
             record = self._create_log_record(logging.DEBUG, message, extra)
             self.logger.handle(record)
@@ -210,12 +231,16 @@ class StructuredLogger:
             context = self._add_context(extra)
             self.logger.debug(f"{message}{context}")
 
-    def info(self, message: str, **extra):
+    def info(self, message: str, *args, **extra):
         """Log informativo normal.
 
         Ejemplo:
             logger.info("Jugador creado", player_id="123", username="player1")
         """
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        if args:
+            message = message % args
         if settings.log_format == "json" and extra:
             record = self._create_log_record(logging.INFO, message, extra)
             self.logger.handle(record)
@@ -223,12 +248,16 @@ class StructuredLogger:
             context = self._add_context(extra)
             self.logger.info(f"{message}{context}")
 
-    def warning(self, message: str, **extra):
+    def warning(self, message: str, *args, **extra):
         """Log de advertencia (algo inesperado pero no crítico).
 
         Ejemplo:
             logger.warning("Username casi duplicado", username="test")
         """
+        if not self.logger.isEnabledFor(logging.WARNING):
+            return
+        if args:
+            message = message % args
         if settings.log_format == "json" and extra:
             record = self._create_log_record(logging.WARNING, message, extra)
             self.logger.handle(record)
@@ -236,12 +265,16 @@ class StructuredLogger:
             context = self._add_context(extra)
             self.logger.warning(f"{message}{context}")
 
-    def error(self, message: str, **extra):
+    def error(self, message: str, *args, **extra):
         """Log de error (algo falló).
 
         Ejemplo:
             logger.error("No se pudo crear jugador", error=str(e))
         """
+        if not self.logger.isEnabledFor(logging.ERROR):
+            return
+        if args:
+            message = message % args
         if settings.log_format == "json" and extra:
             record = self._create_log_record(logging.ERROR, message, extra)
             self.logger.handle(record)
@@ -249,12 +282,16 @@ class StructuredLogger:
             context = self._add_context(extra)
             self.logger.error(f"{message}{context}")
 
-    def critical(self, message: str, **extra):
+    def critical(self, message: str, *args, **extra):
         """Log crítico (error grave).
 
         Ejemplo:
             logger.critical("Firebase no responde", error=str(e))
         """
+        if not self.logger.isEnabledFor(logging.CRITICAL):
+            return
+        if args:
+            message = message % args
         if settings.log_format == "json" and extra:
             record = self._create_log_record(logging.CRITICAL, message, extra)
             self.logger.handle(record)
@@ -7,10 +7,27 @@ Autor: Mandrágora
 """
 
 import re
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 from .exceptions import ValidationException
 
+# Los 5 niveles del juego, en orden (el texto se usa en el mensaje de error)
+VALID_LEVELS = (
+    "hub_central",
+    "senda_ebano",
+    "fortaleza_gigantes",
+    "aquelarre_sombras",
+    "claro_almas",
+)
+_VALID_LEVELS_STR = ", ".join(VALID_LEVELS)
+
+# Decisiones morales válidas por nivel (solo los niveles que tienen decisión)
+CHOICES_BY_LEVEL: Dict[str, Tuple[str, ...]] = {
+    "senda_ebano": ("forzar", "sanar"),
+    "fortaleza_gigantes": ("destruir", "construir"),
+    "aquelarre_sombras": ("ocultar", "revelar"),
+}
+
 
 def validate_username(username: str) -> None:
     """Valida que un username sea correcto.
@@ -87,16 +104,8 @@ def validate_level_name(level: str) -> None:
     Raises:
         ValidationException: Si el nivel no es válido.
     """
-    valid_levels = [
-        "hub_central",
-        "senda_ebano",
-        "fortaleza_gigantes",
-        "aquelarre_sombras",
-        "claro_almas",
-    ]
-
-    if level not in valid_levels:
-        raise ValidationException(f"Nivel '{level}' no válido. Válidos: {', '.join(valid_levels)}")
+    if level not in VALID_LEVELS:
+        raise ValidationException(f"Nivel '{level}' no válido. Válidos: {_VALID_LEVELS_STR}")
 
 
 def validate_choice(level: str, choice: str) -> None:
@@ -116,18 +125,12 @@ def validate_choice(level: str, choice: str) -> None:
     Raises:
         ValidationException: Si la decisión no es válida para el nivel.
     """
-    choices_by_level = {
-        "senda_ebano": ["forzar", "sanar"],
-        "fortaleza_gigantes": ["destruir", "construir"],
-        "aquelarre_sombras": ["ocultar", "revelar"],
-    }
+    valid_choices = CHOICES_BY_LEVEL.get(level)
 
     # Si el nivel no tiene elección, no validar
-    if level not in choices_by_level:
+    if valid_choices is None:
         return
 
-    valid_choices = choices_by_level[level]
-
     if choice not in valid_choices:
         raise ValidationException(
             f"Elección '{choice}' no válida para '{level}'. " f"Válidas: {', '.join(valid_choices)}"
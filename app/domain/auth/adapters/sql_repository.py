@@ -106,12 +106,12 @@ class SQLAuthRepository(IAuthRepository):
             self.session.commit()
             self.session.refresh(user)
 
-            logger.info(f"Admin creado: {user.username} (role: {user.role})")
+            logger.info("Admin creado: %s (role: %s)", user.username, user.role)
             return self._user_to_dict(user, include_password=False)
 
         except IntegrityError as e:
             self.session.rollback()
-            logger.error(f"Error creando admin (username/email duplicado): {e}")
+            logger.error("Error creando admin (username/email duplicado): %s", e)
             raise ValueError("Username o email ya existe")
 
     def get_user_by_id(self, user_id: int) -> Optional[Dict[str, Any]]:
@@ -148,7 +148,7 @@ class SQLAuthRepository(IAuthRepository):
         if user:
             user.last_login = datetime.now(timezone.utc)
             self.session.commit()
-            logger.debug(f"Last login actualizado para user {user_id}")
+            logger.debug("Last login actualizado para user %s", user_id)
 
     def update_user(
         self,
@@ -174,12 +174,12 @@ class SQLAuthRepository(IAuthRepository):
             self.session.commit()
             self.session.refresh(user)
 
-            logger.info(f"Admin actualizado: {user.username}")
+            logger.info("Admin actualizado: %s", user.username)
             return self._user_to_dict(user, include_password=False)
 
         except IntegrityError as e:
             self.session.rollback()
-            logger.error(f"Error actualizando admin (email duplicado): {e}")
+            logger.error("Error actualizando admin (email duplicado): %s", e)
             raise ValueError("Email ya existe")
 
     def update_password(self, user_id: int, new_password_hash: str) -> bool:
@@ -192,7 +192,7 @@ class SQLAuthRepository(IAuthRepository):
         user.password_hash = new_password_hash
         self.session.commit()
 
-        logger.info(f"Password actualizado para user {user_id}")
+        logger.info("Password actualizado para user %s", user_id)
         return True
 
     def deactivate_user(self, user_id: int) -> bool:
@@ -205,7 +205,7 @@ class SQLAuthRepository(IAuthRepository):
         user.is_active = False
         self.session.commit()
 
-        logger.info(f"Admin desactivado: {user.username}")
+        logger.info("Admin desactivado: %s", user.username)
         return True
 
     def list_users(
@@ -260,7 +260,7 @@ class SQLAuthRepository(IAuthRepository):
         self.session.commit()
         self.session.refresh(log)
 
-        logger.debug(f"Audit log creado: {action} por {username}")
+        logger.debug("Audit log creado: %s por %s", action, username)
         return self._log_to_dict(log)
 
     def get_audit_logs(
@@ -158,7 +158,8 @@ def login(
             )
         except Exception as audit_error:
             logger.error(
-                f"Error al registrar login_failed en audit log: {audit_error}",
+                "Error al registrar login_failed en audit log: %s",
+                audit_error,
                 extra={"username": login_data.username},
             )
 
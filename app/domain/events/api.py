@@ -14,14 +14,18 @@ Autor: Mandrágora
 """
 
 from datetime import datetime
+from functools import lru_cache
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from pydantic import TypeAdapter
 
+from app.middleware.auth import AuthCtx, get_auth_ctx, require_admin
 from app.middleware.rate_limit import EVENT_CREATE_LIMIT, limiter
 
 # Importar game repository para validar permisos de partida
 from ..games.adapters.firestore_repository import FirestoreGameRepository
+from ..games.ports import IGameRepository
 from .models import GameEvent
 from .repository import EventRepository
 from .schemas import EventBatchCreate, EventCreate
@@ -30,11 +34,14 @@ from .service import EventService
 # Router de FastAPI
 router = APIRouter(prefix="/v1/events", tags=["Events"])
 
+# Serializador de listas de eventos (se construye una vez por proceso)
+EVENTS_ADAPTER = TypeAdapter(List[GameEvent])
+
 
 # ==================== HELPERS ====================
 
 
-def check_event_creation_access(request: Request, event_data: EventCreate) -> None:
+def check_event_creation_access(auth: AuthCtx, event_data: EventCreate) -> None:
     """Verifica que el usuario tenga permisos para crear un evento.
 
     Reglas:
@@ -42,39 +49,36 @@ def check_event_creation_access(request: Request, event_data: EventCreate) -> No
     - Jugador autenticado: solo puede crear eventos para sí mismo.
 
     Args:
-        request (Request): Request de FastAPI con estado de autenticación.
+        auth (AuthCtx): Contexto de autenticación del request.
         event_data (EventCreate): Datos del evento a crear.
 
     Raises:
         HTTPException: Si no tiene permisos (403).
     """
-    is_admin = getattr(request.state, "is_admin", False)
-    authenticated_player_id = getattr(request.state, "player_id", None)
-
     # Admin puede crear eventos para cualquier jugador
-    if is_admin:
+    if auth.is_admin:
         return
 
     # Jugador solo puede crear eventos para sí mismo
-    if event_data.player_id != authenticated_player_id:
+    if event_data.player_id != auth.player_id:
         raise HTTPException(status_code=403, detail="Solo puedes crear eventos para ti mismo")
 
 
-def check_batch_creation_access(request: Request, batch_data: EventBatchCreate) -> None:
+def check_batch_creation_access(auth: AuthCtx, batch_data: EventBatchCreate) -> None:
     """Verifica permisos para crear batch de eventos.
 
     Args:
-        request (Request): Request de FastAPI.
+        auth (AuthCtx): Contexto de autenticación del request.
         batch_data (EventBatchCreate): Batch de eventos.
 
     Raises:
         HTTPException: Si algún evento no tiene permisos (403).
     """
     for event_data in batch_data.events:
-        check_event_creation_access(request, event_data)
+        check_event_creation_access(auth, event_data)
 
 
-def check_game_events_access(request: Request, game_id: str) -> None:
+def check_game_events_access(auth: AuthCtx, game_id: str) -> None:
     """Verifica permisos para ver eventos de una partida.
 
     Reglas:
@@ -82,35 +86,32 @@ def check_game_events_access(request: Request, game_id: str) -> None:
     - Jugador autenticado: solo puede ver eventos de sus partidas.
 
     Args:
-        request (Request): Request de FastAPI.
+        auth (AuthCtx): Contexto de autenticación del request.
         game_id (str): ID de la partida.
 
     Raises:
         HTTPException: Si no tiene permisos (403).
         HTTPException: Si la partida no existe (404).
     """
-    is_admin = getattr(request.state, "is_admin", False)
-    authenticated_player_id = getattr(request.state, "player_id", None)
-
     # Admin puede ver eventos de cualquier partida
-    if is_admin:
+    if auth.is_admin:
         return
 
     # Verificar que la partida existe y pertenece al jugador
-    game_repo = FirestoreGameRepository()
-    game = game_repo.get_by_id(game_id)
+    # (solo se lee el dueño, no la partida completa)
+    owner_id = get_game_repository().get_owner(game_id)
 
-    if not game:
+    if owner_id is None:
         raise HTTPException(status_code=404, detail="Partida no encontrada")
 
-    if game.player_id != authenticated_player_id:
+    if owner_id != auth.player_id:
         raise HTTPException(
             status_code=403,
             detail="No tienes permisos para ver eventos de esta partida",
         )
 
 
-def check_player_events_access(request: Request, player_id: str) -> None:
+def check_player_events_access(auth: AuthCtx, player_id: str) -> None:
     """Verifica permisos para ver eventos de un jugador.
 
     Reglas:
@@ -118,51 +119,81 @@ def check_player_events_access(request: Request, player_id: str) -> None:
     - Jugador autenticado: solo puede ver sus propios eventos.
 
     Args:
-        request (Request): Request de FastAPI.
+        auth (AuthCtx): Contexto de autenticación del request.
         player_id (str): ID del jugador.
 
     Raises:
         HTTPException: Si no tiene permisos (403).
     """
-    is_admin = getattr(request.state, "is_admin", False)
-    authenticated_player_id = getattr(request.state, "player_id", None)
-
     # Admin puede ver eventos de cualquier jugador
-    if is_admin:
+    if auth.is_admin:
         return
 
     # Jugador solo puede ver sus propios eventos
-    if player_id != authenticated_player_id:
+    if player_id != auth.player_id:
         raise HTTPException(
             status_code=403,
             detail="No tienes permisos para ver eventos de este jugador",
         )
 
 
+def events_response(events: List[GameEvent], status_code: int = 200) -> Response:
+    """Serializa una lista de eventos ya validados directamente a JSON.
+
+    Los eventos que devuelve el servicio ya son instancias de GameEvent, así
+    que no hace falta que FastAPI los vuelva a validar uno a uno con
+    response_model: el esquema se documenta con responses={...}.
+
+    Args:
+        events (List[GameEvent]): Eventos a devolver.
+        status_code (int): Código HTTP de la respuesta.
+
+    Returns:
+        Response: Respuesta JSON con la lista de eventos.
+    """
+    return Response(
+        content=EVENTS_ADAPTER.dump_json(events),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
 # ==================== DEPENDENCY INJECTION ====================
+# Repositorios y servicios no guardan estado por request: se construyen una vez
+# por proceso (lru_cache) y FastAPI reutiliza las mismas instancias.
 
 
+@lru_cache(maxsize=1)
 def get_event_repository() -> EventRepository:
     """Dependency que provee el repositorio de Events.
 
     Returns:
-        EventRepository: Repositorio instanciado.
+        EventRepository: Repositorio compartido.
     """
     return EventRepository()
 
 
-def get_event_service(
-    repository: EventRepository = Depends(get_event_repository),
-) -> EventService:
+@lru_cache(maxsize=1)
+def get_game_repository() -> IGameRepository:
+    """Provee el repositorio de Games para las comprobaciones de permisos.
+
+    Returns:
+        IGameRepository: Repositorio compartido.
+    """
+    return FirestoreGameRepository()
+
+
+@lru_cache(maxsize=1)
+def get_event_service() -> EventService:
     """Dependency que provee el servicio de Events.
 
-    Args:
-        repository (EventRepository): Repositorio inyectado.
+    Obtiene el repositorio del provider cacheado en lugar de con Depends:
+    FastAPI resuelve una sola función por request.
 
     Returns:
-        EventService: Servicio instanciado.
+        EventService: Servicio compartido.
     """
-    return EventService(repository=repository)
+    return EventService(repository=get_event_repository())
 
 
 # ==================== ENDPOINTS ====================
@@ -173,6 +204,7 @@ def get_event_service(
 def create_event(
     request: Request,
     event_data: EventCreate,
+    auth: AuthCtx = Depends(get_auth_ctx),
     service: EventService = Depends(get_event_service),
 ):
     """Crear un evento de gameplay.
@@ -181,7 +213,8 @@ def create_event(
 
     Args:
         event_data (EventCreate): Datos del evento.
-        request (Request): Request de FastAPI.
+        request (Request): Request de FastAPI (lo usa el rate limiter).
+        auth (AuthCtx): Contexto de autenticación del request.
         service (EventService): Servicio inyectado.
 
     Returns:
@@ -192,7 +225,7 @@ def create_event(
         HTTPException: Si el jugador no existe (404).
     """
     # Verificar permisos
-    check_event_creation_access(request, event_data)
+    check_event_creation_access(auth, event_data)
 
     try:
         return service.create_event(event_data)
@@ -200,11 +233,12 @@ def create_event(
         raise HTTPException(status_code=404, detail=str(e))
 
 
-@router.post("/batch", response_model=List[GameEvent], status_code=201)
+@router.post("/batch", status_code=201, responses={201: {"model": List[GameEvent]}})
 @limiter.limit(EVENT_CREATE_LIMIT)
 def create_batch(
     request: Request,
     batch_data: EventBatchCreate,
+    auth: AuthCtx = Depends(get_auth_ctx),
     service: EventService = Depends(get_event_service),
 ):
     """Crear múltiples eventos en una sola petición.
@@ -214,7 +248,8 @@ def create_batch(
 
     Args:
         batch_data (EventBatchCreate): Batch de eventos.
-        request (Request): Request de FastAPI.
+        request (Request): Request de FastAPI (lo usa el rate limiter).
+        auth (AuthCtx): Contexto de autenticación del request.
         service (EventService): Servicio inyectado.
 
     Returns:
@@ -225,17 +260,16 @@ def create_batch(
         HTTPException: Si algún jugador no existe (404).
     """
     # Verificar permisos para todos los eventos
-    check_batch_creation_access(request, batch_data)
+    check_batch_creation_access(auth, batch_data)
 
     try:
-        return service.create_batch(batch_data)
+        return events_response(service.create_batch(batch_data), status_code=201)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
 
 
-@router.get("", response_model=List[GameEvent])
+@router.get("", responses={200: {"model": List[GameEvent]}}, dependencies=[Depends(require_admin)])
 def get_all_events(
-    request: Request,
     limit: int = Query(default=100, ge=1, le=500, description="Máximo de eventos a retornar"),
     days: Optional[int] = Query(
         default=1, ge=1, le=30, description="Filtrar últimos N días (default: 1, máx: 30)"
@@ -258,7 +292,6 @@ def get_all_events(
         GET /events?since=2026-01-25&limit=200  → Desde fecha específica
 
     Args:
-        request (Request): Request de FastAPI.
         limit (int): Máximo de eventos (default: 100, máx: 500).
         days (int): Filtrar últimos N días (default: 1, máx: 30).
         since (str, optional): Filtrar desde fecha ISO 8601.
@@ -271,15 +304,6 @@ def get_all_events(
     Raises:
         HTTPException: Si no tiene permisos de admin (403) o formato de fecha inválido (400).
     """
-    # Verificar que es admin
-    is_admin = getattr(request.state, "is_admin", False)
-
-    if not is_admin:
-        raise HTTPException(
-            status_code=403,
-            detail="Este endpoint requiere permisos de administrador. Usa API Key o JWT token de admin.",
-        )
-
     # Parsear fechas si se proporcionaron
     since_date = None
     until_date = None
@@ -296,13 +320,15 @@ def get_all_events(
         except ValueError:
             raise HTTPException(status_code=400, detail="Formato de fecha 'until' inválido")
 
-    return service.get_all_events(limit=limit, days=days, since=since_date, until=until_date)
+    return events_response(
+        service.get_all_events(limit=limit, days=days, since=since_date, until=until_date)
+    )
 
 
-@router.get("/game/{game_id}", response_model=List[GameEvent])
+@router.get("/game/{game_id}", responses={200: {"model": List[GameEvent]}})
 def get_game_events(
     game_id: str,
-    request: Request,
+    auth: AuthCtx = Depends(get_auth_ctx),
     limit: int = Query(default=500, ge=1, le=1000, description="Máximo de eventos"),
     days: Optional[int] = Query(default=None, ge=1, le=90, description="Filtrar últimos N días"),
     since: Optional[str] = Query(default=None, description="Filtrar desde fecha ISO"),
@@ -320,7 +346,7 @@ def get_game_events(
 
     Args:
         game_id (str): ID de la partida.
-        request (Request): Request de FastAPI.
+        auth (AuthCtx): Contexto de autenticación del request.
         limit (int): Máximo de eventos (default: 500, máx: 1000).
         days (int, optional): Filtrar últimos N días.
         since (str, optional): Filtrar desde fecha ISO 8601.
@@ -335,7 +361,7 @@ def get_game_events(
         HTTPException: Si la partida no existe (404) o formato de fecha inválido (400).
     """
     # Verificar permisos
-    check_game_events_access(request, game_id)
+    check_game_events_access(auth, game_id)
 
     # Parsear fechas si se proporcionaron
     since_date = None
@@ -353,15 +379,15 @@ def get_game_events(
         except ValueError:
             raise HTTPException(status_code=400, detail="Formato de fecha 'until' inválido")
 
-    return service.get_game_events(
-        game_id, limit=limit, days=days, since=since_date, until=until_date
+    return events_response(
+        service.get_game_events(game_id, limit=limit, days=days, since=since_date, until=until_date)
     )
 
 
-@router.get("/player/{player_id}", response_model=List[GameEvent])
+@router.get("/player/{player_id}", responses={200: {"model": List[GameEvent]}})
 def get_player_events(
     player_id: str,
-    request: Request,
+    auth: AuthCtx = Depends(get_auth_ctx),
     limit: int = Query(default=200, ge=1, le=500, description="Máximo de eventos"),
     days: Optional[int] = Query(default=None, ge=1, le=90, description="Filtrar últimos N días"),
     since: Optional[str] = Query(default=None, description="Filtrar desde fecha ISO"),
@@ -379,7 +405,7 @@ def get_player_events(
 
     Args:
         player_id (str): ID del jugador.
-        request (Request): Request de FastAPI.
+        auth (AuthCtx): Contexto de autenticación del request.
         limit (int): Máximo de eventos (default: 200, máx: 500).
         days (int, optional): Filtrar últimos N días.
         since (str, optional): Filtrar desde fecha ISO 8601.
@@ -393,7 +419,7 @@ def get_player_events(
         HTTPException: Si intentas ver eventos de otro jugador (403) o formato inválido (400).
     """
     # Verificar permisos
-    check_player_events_access(request, player_id)
+    check_player_events_access(auth, player_id)
 
     # Parsear fechas si se proporcionaron
     since_date = None
@@ -411,16 +437,18 @@ def get_player_events(
         except ValueError:
             raise HTTPException(status_code=400, detail="Formato de fecha 'until' inválido")
 
-    return service.get_player_events(
-        player_id, limit=limit, days=days, since=since_date, until=until_date
+    return events_response(
+        service.get_player_events(
+            player_id, limit=limit, days=days, since=since_date, until=until_date
+        )
     )
 
 
-@router.get("/game/{game_id}/type/{event_type}", response_model=List[GameEvent])
+@router.get("/game/{game_id}/type/{event_type}", responses={200: {"model": List[GameEvent]}})
 def get_game_events_by_type(
     game_id: str,
     event_type: str,
-    request: Request,
+    auth: AuthCtx = Depends(get_auth_ctx),
     limit: int = 1000,
     service: EventService = Depends(get_event_service),
 ):
@@ -431,7 +459,7 @@ def get_game_events_by_type(
     Args:
         game_id (str): ID de la partida.
         event_type (str): Tipo de evento a filtrar.
-        request (Request): Request de FastAPI.
+        auth (AuthCtx): Contexto de autenticación del request.
         limit (int): Máximo número de eventos.
         service (EventService): Servicio inyectado.
 
@@ -443,14 +471,13 @@ def get_game_events_by_type(
         HTTPException: Si la partida no existe (404).
     """
     # Verificar permisos
-    check_game_events_access(request, game_id)
+    check_game_events_access(auth, game_id)
 
-    return service.get_events_by_type(event_type, game_id, limit)
+    return events_response(service.get_events_by_type(event_type, game_id, limit))
 
 
-@router.get("/count")
+@router.get("/count", dependencies=[Depends(require_admin)])
 def count_events(
-    request: Request,
     game_id: Optional[str] = Query(default=None, description="Filtrar por partida"),
     player_id: Optional[str] = Query(default=None, description="Filtrar por jugador"),
     event_type: Optional[str] = Query(default=None, description="Filtrar por tipo"),
@@ -473,7 +500,6 @@ def count_events(
         GET /events/count?player_id=xyz  → Eventos de un jugador
 
     Args:
-        request (Request): Request de FastAPI.
         game_id (str, optional): Filtrar por partida.
         player_id (str, optional): Filtrar por jugador.
         event_type (str, optional): Filtrar por tipo.
@@ -488,10 +514,6 @@ def count_events(
     Raises:
         HTTPException: Si no eres admin (403) o formato de fecha inválido (400).
     """
-    # Solo admin puede contar eventos globales
-    if not getattr(request.state, "is_admin", False):
-        raise HTTPException(status_code=403, detail="Requiere permisos de administrador")
-
     # Parsear fechas si se especificaron
     since_date = None
     until_date = None
@@ -7,10 +7,10 @@ Autor: Mandrágora
 """
 
 import uuid
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any, Dict
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, SkipValidation
 
 
 class GameEvent(BaseModel):
@@ -42,10 +42,10 @@ class GameEvent(BaseModel):
     event_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     game_id: str
     player_id: str
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     event_type: str
     level: str
-    data: Dict[str, Any] = Field(default_factory=dict)
+    data: SkipValidation[Dict[str, Any]] = Field(default_factory=dict)  # ya validado en EventCreate
 
     class Config:
         json_schema_extra = {
@@ -6,6 +6,7 @@ El repository accede directamente a Firestore.
 Autor: Mandrágora
 """
 
+import logging
 from datetime import datetime, timedelta, timezone
 from typing import List, Optional
 
@@ -18,6 +19,9 @@ from app.infrastructure.database.firebase_client import get_firestore_client
 from .models import GameEvent
 from .schemas import EventCreate
 
+# Máximo de documentos a recorrer si falla la count aggregation
+COUNT_FALLBACK_LIMIT = 10000
+
 
 class EventRepository:
     """Repositorio de eventos de gameplay usando Firestore.
@@ -58,7 +62,7 @@ class EventRepository:
         doc_ref = self.collection.document(event.event_id)
         doc_ref.set(event.to_dict())
 
-        logger.info(f"Evento creado: {event.event_type} en {event.level}")
+        logger.debug("Evento creado", event_type=event.event_type, level=event.level)
         return event
 
     def create_batch(self, events_data: List[EventCreate]) -> List[GameEvent]:
@@ -93,7 +97,7 @@ class EventRepository:
 
         # Ejecutar batch
         batch.commit()
-        logger.info(f"Batch de {len(created_events)} eventos creado")
+        logger.debug("Batch de eventos creado", count=len(created_events))
 
         return created_events
 
@@ -240,13 +244,14 @@ class EventRepository:
             data = doc.to_dict()
             events.append(GameEvent.from_dict(data))
 
-        filter_info = ""
-        if days:
-            filter_info = f" (últimos {days} días)"
-        elif since or until:
-            filter_info = " (filtrado por fecha)"
+        if logger.isEnabledFor(logging.INFO):
+            filter_info = ""
+            if days:
+                filter_info = f" (últimos {days} días)"
+            elif since or until:
+                filter_info = " (filtrado por fecha)"
 
-        logger.info(f"Fetched {len(events)} events{filter_info}")
+            logger.info("Fetched %s events%s", len(events), filter_info)
         return events
 
     def get_by_type(
@@ -279,7 +284,7 @@ class EventRepository:
             return events
         except Exception as e:
             # Si la query falla por índice compuesto faltante en Firestore
-            logger.warning(f"Query get_by_type falló: {e}")
+            logger.warning("Query get_by_type falló: %s", e)
             logger.warning("Puede que necesites crear un índice compuesto en Firestore")
             logger.warning("Índice requerido: event_type (ASC) + game_id (ASC) + timestamp (DESC)")
             return []
@@ -346,7 +351,7 @@ class EventRepository:
             return events
         except Exception as e:
             # Si la query falla por índice compuesto faltante en Firestore
-            logger.warning(f"Query compleja falló: {e}")
+            logger.warning("Query compleja falló: %s", e)
             logger.warning("Puede que necesites crear un índice compuesto en Firestore")
             return []
 
@@ -416,14 +421,12 @@ class EventRepository:
 
             # Extraer el count del resultado
             count_value = results[0][0].value
-            logger.debug(f"Counted {count_value} events (aggregation query)")
+            logger.debug("Counted %s events (aggregation query)", count_value)
             return count_value
 
         except Exception as e:
-            logger.error(f"Error en count aggregation: {e}")
-            # Fallback a método ineficiente si falla aggregation
-            logger.warning("Usando fallback ineficiente: get_all + len()")
-            events = self.get_all(
-                limit=10000, days=days, since=since, until=until  # Límite alto para fallback
-            )
-            return len(events)
+            logger.error("Error en count aggregation: %s", e)
+            # Fallback acotado: select([]) solo trae los IDs (sin cargar eventos)
+            logger.warning("Usando fallback de conteo por IDs", max_documents=COUNT_FALLBACK_LIMIT)
+            docs = query.select([]).limit(COUNT_FALLBACK_LIMIT).stream()
+            return sum(1 for _ in docs)
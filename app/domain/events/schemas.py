@@ -8,7 +8,7 @@ Autor: Mandrágora
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, SkipValidation, field_validator
 
 from app.core.exceptions import ValidationException
 from app.core.validators import validate_level_name
@@ -31,7 +31,8 @@ class EventCreate(BaseModel):
     player_id: str
     event_type: str
     level: str
-    data: Dict[str, Any] = Field(default_factory=dict)
+    # Payload opaco para la API: solo se comprueba que sea un objeto, sin validar ni copiar su contenido
+    data: SkipValidation[Dict[str, Any]] = Field(default_factory=dict)
 
     @field_validator("event_type")
     @classmethod
@@ -61,6 +62,14 @@ class EventCreate(BaseModel):
             raise ValueError(str(e))
         return v
 
+    @field_validator("data", mode="before")
+    @classmethod
+    def validate_data(cls, v: Any) -> Dict[str, Any]:
+        """Valida que data sea un objeto JSON y lo devuelve tal cual."""
+        if not isinstance(v, dict):
+            raise ValueError("El campo 'data' debe ser un objeto JSON")
+        return v
+
     class Config:
         json_schema_extra = {
             "example": {
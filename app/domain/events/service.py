@@ -6,6 +6,7 @@ Autor: Mandrágora
 """
 
 from datetime import datetime
+from operator import attrgetter
 from typing import List, Optional
 
 # Importar repositories de otros dominios para validación
@@ -15,6 +16,9 @@ from .models import GameEvent
 from .repository import EventRepository
 from .schemas import EventBatchCreate, EventCreate
 
+# Extractor de player_id (el acceso al atributo se resuelve en C)
+_get_pid = attrgetter("player_id")
+
 
 class EventService:
     """Servicio de eventos de gameplay.
@@ -39,8 +43,23 @@ class EventService:
             player_repo (Optional[FirestorePlayerRepository]): Repositorio de jugadores (opcional).
         """
         self.repository = repository
-        self.game_repo = game_repo or FirestoreGameRepository()
-        self.player_repo = player_repo or FirestorePlayerRepository()
+        # Los repositorios por defecto se crean al primer uso (ver properties)
+        self._game_repo = game_repo
+        self._player_repo = player_repo
+
+    @property
+    def game_repo(self) -> FirestoreGameRepository:
+        """Repositorio de juegos, instanciado solo si se llega a usar."""
+        if self._game_repo is None:
+            self._game_repo = FirestoreGameRepository()
+        return self._game_repo
+
+    @property
+    def player_repo(self) -> FirestorePlayerRepository:
+        """Repositorio de jugadores, instanciado solo si se llega a usar."""
+        if self._player_repo is None:
+            self._player_repo = FirestorePlayerRepository()
+        return self._player_repo
 
     def create_event(self, event_data: EventCreate) -> GameEvent:
         """Crea un nuevo evento.
@@ -87,13 +106,20 @@ class EventService:
             ValueError: Si algún jugador no existe.
         """
         # Extraer player_ids únicos
-        player_ids = set(e.player_id for e in batch_data.events)
+        player_ids = set(map(_get_pid, batch_data.events))
 
         # Validar que todos los jugadores existen
-        for player_id in player_ids:
-            player = self.player_repo.get_by_id(player_id)
-            if not player:
+        if len(player_ids) == 1:
+            # Caso habitual: todo el batch es del mismo jugador
+            (player_id,) = player_ids
+            if not self.player_repo.get_by_id(player_id):
                 raise ValueError(f"Jugador {player_id} no encontrado")
+        else:
+            # Varios jugadores: una sola lectura batch en lugar de N
+            ids = sorted(player_ids)
+            for player_id, player in zip(ids, self.player_repo.get_many(ids)):
+                if not player:
+                    raise ValueError(f"Jugador {player_id} no encontrado")
 
         # Crear todos los eventos
         return self.repository.create_batch(batch_data.events)
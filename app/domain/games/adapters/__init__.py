@@ -2,6 +2,12 @@
 
 Implementaciones concretas de los repositorios:
 - firestore_repository.py: Implementación con Firestore.
+- async_firestore_repository.py: Lecturas con el cliente asíncrono de Firestore.
 
 Autor: Mandrágora
 """
+
+from .async_firestore_repository import AsyncFirestoreGameRepository
+from .firestore_repository import FirestoreGameRepository
+
+__all__ = ["AsyncFirestoreGameRepository", "FirestoreGameRepository"]
@@ -0,0 +1,60 @@
+"""Adaptador Firestore asíncrono para Games.
+
+Variante de solo lectura sobre AsyncClient para el export de partidas
+(GET /v1/games/export): recorre la colección con stream() sin ocupar un hilo
+del thread pool mientras espera a Firestore.
+
+Las escrituras siguen en FirestoreGameRepository (transacciones síncronas).
+
+Autor: Mandrágora
+"""
+
+from datetime import datetime
+from typing import AsyncIterator, Optional
+
+from google.cloud.firestore_v1 import AsyncClient, Query
+
+from app.infrastructure.database.firebase_client import get_async_firestore_client
+
+from ..models import Game
+from .firestore_repository import _apply_date_filters
+
+
+class AsyncFirestoreGameRepository:
+    """Repositorio de Games de solo lectura usando el cliente asíncrono de Firestore.
+
+    Solo expone las lecturas que necesitan los handlers async (stream_all).
+    """
+
+    COLLECTION_NAME = "games"
+
+    def __init__(self, db: Optional[AsyncClient] = None):
+        """Inicializa el repositorio."""
+        self.db = db or get_async_firestore_client()
+        self.collection = self.db.collection(self.COLLECTION_NAME)
+
+    async def stream_all(
+        self,
+        days: Optional[int] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> AsyncIterator[Game]:
+        """Recorre las partidas de todos los jugadores documento a documento.
+
+        Usa stream() en lugar de get(): las partidas se entregan según llegan de
+        Firestore, así que la memoria no crece con el número de resultados.
+
+        Args:
+            days (Optional[int]): Si se especifica, solo partidas de últimos N días.
+            since (Optional[datetime]): Si se especifica, solo partidas después de esta fecha.
+            until (Optional[datetime]): Si se especifica, solo partidas antes de esta fecha.
+
+        Yields:
+            Game: Partidas ordenadas por fecha de inicio descendente.
+        """
+        query = _apply_date_filters(self.collection, days, since, until)
+        query = query.order_by("started_at", direction=Query.DESCENDING)
+
+        from_dict = Game.from_dict  # binding local: evita el lookup en cada iteración
+        async for doc in query.stream():
+            yield from_dict(doc.to_dict())
@@ -2,22 +2,180 @@
 
 Implementación concreta del repositorio usando Firestore.
 
+Índices compuestos que necesitan las consultas (declarados en firestore.indexes.json):
+- (player_id ASC, status ASC): get_active_game, create_replacing_active y count(player_id, status).
+- (player_id ASC, started_at DESC): get_by_player_page, stream_by_player y get_by_player_summary.
+- (status ASC, started_at ASC): count(status, days/since/until).
+get_all_page y get_all_summary_page solo usan started_at y les basta el
+índice simple que Firestore crea automáticamente.
+
 Autor: Mandrágora
 """
 
+import logging
+import threading
 from datetime import datetime, timedelta, timezone
-from typing import List, Optional
-
-from google.cloud.firestore_v1 import Client, Query
+from typing import Iterator, List, Optional, Tuple
+
+from cachetools import TTLCache
+from google.api_core.exceptions import NotFound
+from google.cloud.firestore_v1 import (
+    ArrayUnion,
+    Client,
+    Increment,
+    Query,
+    Transaction,
+    transactional,
+)
 from google.cloud.firestore_v1.base_query import FieldFilter
 
+from app.core.exceptions import AuthorizationException
 from app.core.logger import logger
 from app.infrastructure.database.firebase_client import get_firestore_client
 
-from ..models import Game
+from ..models import Game, GameSummary
 from ..ports import IGameRepository
 from ..schemas import GameCreate, GameUpdate, LevelComplete, LevelStart
 
+# Niveles totales del juego y porcentaje que aporta cada uno (aritmética entera)
+TOTAL_LEVELS = 5
+PERCENT_PER_LEVEL = 100 // TOTAL_LEVELS
+assert 100 % TOTAL_LEVELS == 0, "TOTAL_LEVELS debe dividir 100 exactamente"
+
+# Máximo de documentos a recorrer si falla la count aggregation
+COUNT_FALLBACK_LIMIT = 10000
+
+# Niveles con decisión moral: nivel -> (campo en choices, opciones válidas para el log)
+_CHOICE_FIELDS = {
+    "senda_ebano": ("choices.senda_ebano", "sanar/forzar"),
+    "fortaleza_gigantes": ("choices.fortaleza_gigantes", "construir/destruir"),
+    "aquelarre_sombras": ("choices.aquelarre_sombras", "revelar/ocultar"),
+}
+
+# Tipo moral de cada decisión (solo para logging)
+_MORAL_TYPES = {
+    "sanar": "BUENA",
+    "construir": "BUENA",
+    "revelar": "BUENA",
+    "forzar": "MALA",
+    "destruir": "MALA",
+    "ocultar": "MALA",
+}
+
+
+def _apply_field_path(data: dict, path: str, value) -> None:
+    """Aplica un valor sobre un dict anidado usando una ruta con puntos de Firestore.
+
+    Args:
+        data (dict): Diccionario del documento.
+        path (str): Ruta del campo (ej. "metrics.time_per_level.senda_ebano").
+        value: Valor a asignar.
+    """
+    *parents, leaf = path.split(".")
+    for key in parents:
+        data = data.setdefault(key, {})
+    data[leaf] = value
+
+
+def _check_preconditions(data: dict, owner_id: Optional[str], require_active: bool) -> None:
+    """Comprueba dueño y estado sobre el snapshot leído en una transacción.
+
+    Args:
+        data (dict): Documento de la partida.
+        owner_id (Optional[str]): Si se indica, la partida debe ser de este jugador.
+        require_active (bool): Si True, la partida debe estar en curso.
+
+    Raises:
+        AuthorizationException: Si la partida es de otro jugador.
+        ValueError: Si la partida no está activa.
+    """
+    if owner_id is not None and data.get("player_id") != owner_id:
+        raise AuthorizationException("No tienes permisos para acceder a esta partida")
+    if require_active and data.get("status") != "in_progress":
+        raise ValueError("La partida no está activa")
+
+
+def _apply_date_filters(
+    query,
+    days: Optional[int],
+    since: Optional[datetime],
+    until: Optional[datetime],
+):
+    """Aplica los filtros de fecha sobre started_at.
+
+    Args:
+        query: Query o colección de Firestore.
+        days (Optional[int]): Solo partidas de los últimos N días (tiene prioridad sobre since).
+        since (Optional[datetime]): Solo partidas después de esta fecha.
+        until (Optional[datetime]): Solo partidas antes de esta fecha.
+
+    Returns:
+        Query con los filtros aplicados.
+    """
+    if days is not None:
+        cutoff = datetime.now(timezone.utc) - timedelta(days=days)
+        query = query.where(filter=FieldFilter("started_at", ">=", cutoff))
+    elif since is not None:
+        query = query.where(filter=FieldFilter("started_at", ">=", since))
+
+    if until is not None:
+        query = query.where(filter=FieldFilter("started_at", "<=", until))
+
+    return query
+
+
+def _page_query(query, limit: int, cursor: Optional[dict]):
+    """Ordena por (started_at, ID) descendente y aplica el cursor de paginación.
+
+    Args:
+        query: Consulta de Firestore con los filtros ya aplicados.
+        limit (int): Tamaño de página.
+        cursor (Optional[dict]): Cursor devuelto por la página anterior.
+
+    Returns:
+        Query: Consulta lista para ejecutar.
+    """
+    query = query.order_by("started_at", direction=Query.DESCENDING).order_by(
+        "__name__", direction=Query.DESCENDING
+    )
+    if cursor:
+        query = query.start_after(cursor)
+    return query.limit(limit)
+
+
+def _next_cursor(docs: List[dict], limit: int) -> Optional[dict]:
+    """Cursor de la página siguiente a partir de los documentos de la actual.
+
+    Args:
+        docs (List[dict]): Documentos de la página.
+        limit (int): Tamaño de página.
+
+    Returns:
+        Optional[dict]: Cursor de la última partida, None si la página no está llena.
+    """
+    if len(docs) < limit:
+        return None
+    last = docs[-1]
+    return {"started_at": last["started_at"], "__name__": last["game_id"]}
+
+
+def _to_summary(data: dict) -> GameSummary:
+    """Construye un GameSummary desde un documento proyectado con select().
+
+    Args:
+        data (dict): Campos del documento.
+
+    Returns:
+        GameSummary: Resumen de la partida.
+    """
+    return {
+        "game_id": data["game_id"],
+        "player_id": data["player_id"],
+        "status": data["status"],
+        "completion_percentage": data["completion_percentage"],
+        "started_at": data["started_at"],
+    }
+
 
 class FirestoreGameRepository(IGameRepository):
     """Repositorio de Games usando Firestore.
@@ -27,10 +185,22 @@ class FirestoreGameRepository(IGameRepository):
 
     COLLECTION_NAME = "games"
 
+    # Campos leídos por get_by_player_summary (proyección en Firestore)
+    SUMMARY_FIELDS = ["game_id", "player_id", "status", "completion_percentage", "started_at"]
+
+    # Caché de dueños (game_id -> player_id) para get_owner, compartida por todas las
+    # instancias del proceso. Solo guarda player_id, que no cambia nunca: las lecturas
+    # de la partida completa siempre van a Firestore y ven la última escritura.
+    _owner_cache: TTLCache = TTLCache(maxsize=4096, ttl=300)
+    _cache_lock = threading.Lock()
+
     def __init__(self, db: Optional[Client] = None):
         """Inicializa el repositorio."""
         self.db = db or get_firestore_client()
         self.collection = self.db.collection(self.COLLECTION_NAME)
+        # Parte fija de la consulta de get_active_game (las Query son inmutables:
+        # cada where() devuelve una copia, así que se puede reutilizar)
+        self._in_progress = self.collection.where(filter=FieldFilter("status", "==", "in_progress"))
 
     def create(self, game_data: GameCreate) -> Game:
         """Crea una nueva partida en Firestore.
@@ -48,9 +218,48 @@ class FirestoreGameRepository(IGameRepository):
         doc_ref = self.collection.document(game.game_id)
         doc_ref.set(game.to_dict())
 
-        logger.info(f"Partida creada: {game.game_id}")
+        logger.debug("Partida creada", game_id=game.game_id)
         return game
 
+    def create_replacing_active(self, game_data: GameCreate) -> Tuple[Game, Optional[Game]]:
+        """Crea una partida cerrando antes la partida en curso del jugador, si la tiene.
+
+        La consulta de la partida activa, su cierre como "abandoned" y la creación
+        de la nueva van en una sola transacción: si otra petición toca la partida
+        activa entre medias, Firestore aborta y se reintenta.
+
+        Args:
+            game_data (GameCreate): Datos de la partida a crear.
+
+        Returns:
+            Tuple[Game, Optional[Game]]: Partida creada y partida cerrada (None si
+                el jugador no tenía ninguna en curso).
+        """
+        game = Game(player_id=game_data.player_id)
+        new_ref = self.collection.document(game.game_id)
+        active_query = self._in_progress.where(
+            filter=FieldFilter("player_id", "==", game_data.player_id)
+        ).limit(1)
+        close_update = {"status": "abandoned", "ended_at": datetime.now(timezone.utc)}
+
+        @transactional
+        def apply(transaction: Transaction) -> Optional[Game]:
+            # Todas las lecturas de la transacción antes de la primera escritura
+            active = list(transaction.get(active_query))
+            closed = None
+            for snap in active:
+                transaction.update(snap.reference, close_update)
+                closed = Game.from_dict({**snap.to_dict(), **close_update})
+            transaction.create(new_ref, game.to_dict())
+            return closed
+
+        closed_game = apply(self.db.transaction())
+        if closed_game is not None:
+            self._invalidate(closed_game.game_id)
+
+        logger.debug("Partida creada", game_id=game.game_id)
+        return game, closed_game
+
     def get_by_id(self, game_id: str) -> Optional[Game]:
         """Obtiene una partida por su ID.
 
@@ -67,51 +276,126 @@ class FirestoreGameRepository(IGameRepository):
             return None
 
         data = doc.to_dict()
-        return Game.from_dict(data)
+        game = Game.from_dict(data)
+        self._remember(game)
+        return game
+
+    def get_owner(self, game_id: str) -> Optional[str]:
+        """Obtiene solo el jugador dueño de una partida.
+
+        Para comprobar permisos basta con player_id: si el dueño no está en
+        caché se pide a Firestore solo ese campo en lugar del documento completo.
+
+        Args:
+            game_id (str): ID de la partida.
+
+        Returns:
+            Optional[str]: player_id del dueño si la partida existe, None si no.
+        """
+        with self._cache_lock:
+            cached = self._owner_cache.get(game_id)
+        if cached is not None:
+            return cached
 
-    def get_by_player(
+        doc = self.collection.document(game_id).get(field_paths=["player_id"])
+        if not doc.exists:
+            return None
+
+        owner = doc.get("player_id")
+        with self._cache_lock:
+            self._owner_cache[game_id] = owner
+        return owner
+
+    def _remember(self, game: Game) -> None:
+        """Guarda el dueño de la partida en la caché de get_owner.
+
+        Args:
+            game (Game): Partida recién leída de Firestore.
+        """
+        with self._cache_lock:
+            self._owner_cache[game.game_id] = game.player_id
+
+    def _invalidate(self, game_id: str) -> None:
+        """Elimina el dueño de una partida de la caché de get_owner tras escribirla.
+
+        Args:
+            game_id (str): ID de la partida.
+        """
+        with self._cache_lock:
+            self._owner_cache.pop(game_id, None)
+
+    def stream_by_player(self, player_id: str, limit: int = 100) -> Iterator[Game]:
+        """Recorre las partidas de un jugador de una en una, de la más reciente a la más antigua.
+
+        Usa stream() en lugar de get(): cada partida se construye cuando se pide,
+        y si el llamador deja de iterar se corta la respuesta de Firestore.
+
+        Args:
+            player_id (str): ID del jugador.
+            limit (int): Máximo número de partidas a recorrer.
+
+        Yields:
+            Game: Partidas del jugador ordenadas por fecha de inicio descendente.
+        """
+        query = self.collection.where(filter=FieldFilter("player_id", "==", player_id))
+        query = query.order_by("started_at", direction=Query.DESCENDING).limit(limit)
+
+        from_dict = Game.from_dict  # binding local: evita el lookup en cada iteración
+        for doc in query.stream():
+            yield from_dict(doc.to_dict())
+
+    def get_by_player_page(
         self,
         player_id: str,
         limit: int = 100,
+        cursor: Optional[dict] = None,
         days: Optional[int] = None,
         since: Optional[datetime] = None,
         until: Optional[datetime] = None,
-    ) -> List[Game]:
-        """Obtiene todas las partidas de un jugador con filtros opcionales.
+    ) -> Tuple[List[Game], Optional[dict]]:
+        """Obtiene una página de partidas de un jugador usando paginación por cursor.
+
+        Una sola consulta por página (WHERE player_id + filtros de fecha), con el
+        mismo orden y cursor que get_all_page.
 
         Args:
             player_id (str): ID del jugador.
-            limit (int): Máximo número de partidas.
+            limit (int): Tamaño de página.
+            cursor (Optional[dict]): Cursor devuelto por la página anterior
+                ({"started_at": datetime, "__name__": game_id}).
             days (Optional[int]): Si se especifica, solo partidas de últimos N días.
             since (Optional[datetime]): Si se especifica, solo partidas después de esta fecha.
             until (Optional[datetime]): Si se especifica, solo partidas antes de esta fecha.
 
         Returns:
-            List[Game]: Lista de partidas del jugador filtradas.
+            Tuple[List[Game], Optional[dict]]: Partidas de la página y cursor de la
+                siguiente (None si no hay más).
         """
-        # Base query: WHERE player_id == X
         query = self.collection.where(filter=FieldFilter("player_id", "==", player_id))
+        query = _apply_date_filters(query, days, since, until)
+        return self._get_page(query, limit, cursor)
 
-        # Aplicar filtro de fecha si se especificó
-        if days is not None:
-            cutoff = datetime.now(timezone.utc) - timedelta(days=days)
-            query = query.where(filter=FieldFilter("started_at", ">=", cutoff))
-        elif since is not None:
-            query = query.where(filter=FieldFilter("started_at", ">=", since))
+    def get_by_player_summary(self, player_id: str, limit: int = 100) -> List[GameSummary]:
+        """Obtiene un resumen ligero de las partidas de un jugador.
 
-        if until is not None:
-            query = query.where(filter=FieldFilter("started_at", "<=", until))
+        Usa select() para que Firestore solo envíe los campos del resumen
+        y construye los dicts sin hidratar ni validar un Game completo.
 
-        # Ordenar por fecha descendente y limitar
-        query = query.order_by("started_at", direction=Query.DESCENDING).limit(limit)
-        docs = query.stream()
+        Args:
+            player_id (str): ID del jugador.
+            limit (int): Máximo número de partidas.
 
-        games = []
-        for doc in docs:
-            data = doc.to_dict()
-            games.append(Game.from_dict(data))
+        Returns:
+            List[GameSummary]: Resúmenes ordenados por fecha de inicio descendente.
+        """
+        query = (
+            self.collection.where(filter=FieldFilter("player_id", "==", player_id))
+            .select(self.SUMMARY_FIELDS)
+            .order_by("started_at", direction=Query.DESCENDING)
+            .limit(limit)
+        )
 
-        return games
+        return [_to_summary(doc.to_dict()) for doc in query.get()]
 
     def get_active_game(self, player_id: str) -> Optional[Game]:
         """Obtiene la partida activa de un jugador.
@@ -124,150 +408,242 @@ class FirestoreGameRepository(IGameRepository):
         Returns:
             Optional[Game]: Partida activa si existe, None si no.
         """
-        # Query: WHERE player_id == X AND status == "in_progress" LIMIT 1
-        query = (
-            self.collection.where(filter=FieldFilter("player_id", "==", player_id))
-            .where(filter=FieldFilter("status", "==", "in_progress"))
-            .limit(1)
-        )
-        docs = query.stream()
-
-        for doc in docs:
-            data = doc.to_dict()
-            return Game.from_dict(data)
-
-        return None
-
-    def get_all(
+        # Query: WHERE status == "in_progress" AND player_id == X LIMIT 1
+        # (índice compuesto player_id + status: Firestore lee como mucho un documento)
+        query = self._in_progress.where(filter=FieldFilter("player_id", "==", player_id)).limit(1)
+        # limit(1) llega en una sola respuesta: get() no deja el stream abierto
+        snap = next(iter(query.get()), None)
+        return Game.from_dict(snap.to_dict()) if snap else None
+
+    def get_all_page(
         self,
         limit: int = 200,
+        cursor: Optional[dict] = None,
         days: Optional[int] = None,
         since: Optional[datetime] = None,
         until: Optional[datetime] = None,
-    ) -> List[Game]:
-        """Obtiene todas las partidas de todos los jugadores con filtros opcionales.
+    ) -> Tuple[List[Game], Optional[dict]]:
+        """Obtiene una página de partidas usando paginación por cursor.
 
-        OPTIMIZACIÓN: Usar filtros de fecha reduce significativamente los costos de Firestore
-        y mejora el rendimiento. Por defecto, limitar a 200 partidas.
+        Ordena por started_at y por ID de documento (desempate estable) y continúa
+        con start_after(cursor), así que el coste de cada página no depende de
+        cuántas páginas se hayan recorrido antes (no hay offset).
 
         Args:
-            limit (int): Máximo número de partidas a retornar (default: 200, antes: 1000).
+            limit (int): Tamaño de página.
+            cursor (Optional[dict]): Cursor devuelto por la página anterior
+                ({"started_at": datetime, "__name__": game_id}).
             days (Optional[int]): Si se especifica, solo partidas de últimos N días.
             since (Optional[datetime]): Si se especifica, solo partidas después de esta fecha.
             until (Optional[datetime]): Si se especifica, solo partidas antes de esta fecha.
 
         Returns:
-            List[Game]: Lista de partidas ordenadas por fecha de inicio descendente.
+            Tuple[List[Game], Optional[dict]]: Partidas de la página y cursor de la
+                siguiente (None si no hay más).
+        """
+        query = _apply_date_filters(self.collection, days, since, until)
+        return self._get_page(query, limit, cursor)
 
-        Examples:
-            # Últimos 7 días
-            repo.get_all(days=7, limit=100)
+    def _get_page(
+        self, query, limit: int, cursor: Optional[dict], convert=Game.from_dict
+    ) -> Tuple[list, Optional[dict]]:
+        """Ejecuta una consulta paginada por (started_at, ID) descendente.
 
-            # Rango específico
-            repo.get_all(since=datetime(2026, 1, 1), until=datetime(2026, 1, 31))
+        Args:
+            query: Consulta de Firestore con los filtros (y proyección) ya aplicados.
+            limit (int): Tamaño de página.
+            cursor (Optional[dict]): Cursor devuelto por la página anterior.
+            convert: Función que construye cada elemento desde el documento
+                (Game.from_dict por defecto).
 
-            # Solo límite (comportamiento legacy)
-            repo.get_all(limit=500)
+        Returns:
+            Tuple[list, Optional[dict]]: Elementos de la página y cursor de la
+                siguiente (None si no hay más).
         """
-        query = self.collection
-
-        # Aplicar filtros de fecha si se especificaron
-        if days is not None:
-            cutoff = datetime.now(timezone.utc) - timedelta(days=days)
-            query = query.where(filter=FieldFilter("started_at", ">=", cutoff))
-        elif since is not None:
-            query = query.where(filter=FieldFilter("started_at", ">=", since))
-
-        if until is not None:
-            query = query.where(filter=FieldFilter("started_at", "<=", until))
+        docs = [doc.to_dict() for doc in _page_query(query, limit, cursor).get()]
+        return [convert(data) for data in docs], _next_cursor(docs, limit)
 
-        # Ordenar por fecha descendente y limitar
-        query = query.order_by("started_at", direction=Query.DESCENDING).limit(limit)
-        docs = query.stream()
+    def get_all_summary_page(
+        self,
+        limit: int = 200,
+        cursor: Optional[dict] = None,
+        days: Optional[int] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> Tuple[List[GameSummary], Optional[dict]]:
+        """Obtiene una página de resúmenes ligeros de todas las partidas.
 
-        games = []
-        for doc in docs:
-            data = doc.to_dict()
-            games.append(Game.from_dict(data))
+        Mismos filtros y cursor que get_all_page, pero con select() para que
+        Firestore solo envíe los campos del resumen (sin metrics, choices, relics...).
 
-        filter_info = ""
-        if days:
-            filter_info = f" (últimos {days} días)"
-        elif since or until:
-            filter_info = " (filtrado por fecha)"
+        Args:
+            limit (int): Tamaño de página.
+            cursor (Optional[dict]): Cursor devuelto por la página anterior.
+            days (Optional[int]): Si se especifica, solo partidas de últimos N días.
+            since (Optional[datetime]): Si se especifica, solo partidas después de esta fecha.
+            until (Optional[datetime]): Si se especifica, solo partidas antes de esta fecha.
 
-        logger.info(f"Fetched {len(games)} games{filter_info}")
-        return games
+        Returns:
+            Tuple[List[GameSummary], Optional[dict]]: Resúmenes de la página y cursor
+                de la siguiente (None si no hay más).
+        """
+        query = _apply_date_filters(self.collection, days, since, until)
+        return self._get_page(query.select(self.SUMMARY_FIELDS), limit, cursor, _to_summary)
 
-    def update(self, game_id: str, game_update: GameUpdate) -> Optional[Game]:
+    def update(
+        self, game_id: str, game_update: GameUpdate, owner_id: Optional[str] = None
+    ) -> Optional[Game]:
         """Actualiza una partida existente.
 
+        La lectura, la comprobación del dueño (si se indica) y la escritura van
+        en una misma transacción.
+
         Args:
             game_id (str): ID de la partida.
             game_update (GameUpdate): Campos a actualizar.
+            owner_id (Optional[str]): Si se indica, la partida debe ser de este jugador.
 
         Returns:
             Optional[Game]: Partida actualizada si existe, None si no.
+
+        Raises:
+            AuthorizationException: Si la partida es de otro jugador.
         """
-        doc_ref = self.collection.document(game_id)
-        doc = doc_ref.get()
+        game, _ = self.update_with_previous_status(game_id, game_update, owner_id=owner_id)
+        return game
 
-        if not doc.exists:
-            return None
+    def update_with_previous_status(
+        self, game_id: str, game_update: GameUpdate, owner_id: Optional[str] = None
+    ) -> Tuple[Optional[Game], Optional[str]]:
+        """Actualiza una partida y devuelve también el estado que tenía antes.
+
+        El estado anterior se lee en la misma transacción que la escritura, así
+        que dos actualizaciones concurrentes nunca ven el mismo estado anterior.
+
+        Args:
+            game_id (str): ID de la partida.
+            game_update (GameUpdate): Campos a actualizar.
+            owner_id (Optional[str]): Si se indica, la partida debe ser de este jugador.
 
+        Returns:
+            Tuple[Optional[Game], Optional[str]]: Partida actualizada (None si no
+                existe) y su estado antes de la escritura.
+
+        Raises:
+            AuthorizationException: Si la partida es de otro jugador.
+        """
         # Obtener solo los campos que no son None
         update_data = game_update.model_dump(exclude_none=True)
 
         if not update_data:
-            # No hay nada que actualizar
-            return self.get_by_id(game_id)
-
-        # Actualizar en Firestore
-        doc_ref.update(update_data)
-        logger.info(f"Partida actualizada: {game_id}")
-
-        return self.get_by_id(game_id)
+            # No hay nada que actualizar: sin escritura, basta con leer la partida
+            game = self.get_by_id(game_id)
+            if game and owner_id is not None and game.player_id != owner_id:
+                raise AuthorizationException("No tienes permisos para acceder a esta partida")
+            return game, game.status if game else None
+
+        game, previous_status = self._update_owned(
+            game_id, update_data, owner_id, require_active=False
+        )
+        if game is not None:
+            logger.debug("Partida actualizada", game_id=game_id)
+        return game, previous_status
 
-    def start_level(self, game_id: str, level_data: LevelStart) -> Optional[Game]:
+    def start_level(
+        self, game_id: str, level_data: LevelStart, owner_id: Optional[str] = None
+    ) -> Optional[Game]:
         """Registra el inicio de un nivel.
 
         Guarda el timestamp de inicio para calcular duración automáticamente.
+        La partida debe estar activa; dueño y estado se comprueban en la misma
+        transacción que la escritura.
 
         Args:
             game_id (str): ID de la partida.
             level_data (LevelStart): Datos del nivel.
+            owner_id (Optional[str]): Si se indica, la partida debe ser de este jugador.
 
         Returns:
             Optional[Game]: Partida actualizada si existe, None si no.
+
+        Raises:
+            AuthorizationException: Si la partida es de otro jugador.
+            ValueError: Si la partida no está activa.
         """
-        doc_ref = self.collection.document(game_id)
-        doc = doc_ref.get()
+        # Guardar timestamp de inicio del nivel para cálculo automático.
+        # update() parcial: solo se envían los dos campos que cambian
+        start_timestamp = datetime.now(timezone.utc)
+        game, _ = self._update_owned(
+            game_id,
+            {
+                f"metrics.level_start_times.{level_data.level}": start_timestamp,
+                "current_level": level_data.level,
+            },
+            owner_id,
+            require_active=True,
+        )
 
-        if not doc.exists:
-            return None
+        if game:
+            logger.debug(
+                "Nivel iniciado",
+                game_id=game_id,
+                level=level_data.level,
+                started_at=start_timestamp,
+            )
+        return game
 
-        # Obtener el game actual para actualizar metrics
-        game = Game.from_dict(doc.to_dict())
+    def _update_owned(
+        self, game_id: str, updates: dict, owner_id: Optional[str], require_active: bool
+    ) -> Tuple[Optional[Game], Optional[str]]:
+        """Lee, comprueba precondiciones y escribe una partida en una sola transacción.
 
-        # Guardar timestamp de inicio del nivel para cálculo automático
-        start_timestamp = datetime.now(timezone.utc)
-        game.metrics.level_start_times[level_data.level] = start_timestamp
-        game.current_level = level_data.level
+        La partida devuelta se construye aplicando los cambios al snapshot leído,
+        sin volver a pedirla a Firestore.
 
-        # Guardar cambios
-        doc_ref.set(game.to_dict())
+        Args:
+            game_id (str): ID de la partida.
+            updates (dict): Campos a escribir (rutas con puntos de Firestore).
+            owner_id (Optional[str]): Si se indica, la partida debe ser de este jugador.
+            require_active (bool): Si True, la partida debe estar en curso.
 
-        logger.info(
-            f"⏱️  Timestamp de INICIO guardado para nivel '{level_data.level}': {start_timestamp} "
-            f"[Partida: {game_id[:8]}...]"
-        )
-        logger.info(
-            f"⏱️  Nivel iniciado: {level_data.level} en partida {game_id[:8]}... "
-            f"[Timestamp guardado: {game.metrics.level_start_times[level_data.level]}]"
-        )
-        return game
+        Returns:
+            Tuple[Optional[Game], Optional[str]]: Partida actualizada (None si no
+                existe) y el estado leído en la transacción antes de escribir.
+
+        Raises:
+            AuthorizationException: Si la partida es de otro jugador.
+            ValueError: Si require_active y la partida no está activa.
+        """
+        doc_ref = self.collection.document(game_id)
 
-    def complete_level(self, game_id: str, level_data: LevelComplete) -> Optional[Game]:
+        @transactional
+        def apply(transaction: Transaction) -> Tuple[Optional[Game], Optional[str]]:
+            doc = doc_ref.get(transaction=transaction)
+            if not doc.exists:
+                return None, None
+
+            data = doc.to_dict()
+            _check_preconditions(data, owner_id, require_active)
+            previous_status = data.get("status")
+            transaction.update(doc_ref, updates)
+
+            for path, value in updates.items():
+                _apply_field_path(data, path, value)
+            return Game.from_dict(data), previous_status
+
+        try:
+            game, previous_status = apply(self.db.transaction())
+        finally:
+            self._invalidate(game_id)
+        return game, previous_status
+
+    def complete_level(
+        self,
+        game_id: str,
+        level_data: LevelComplete,
+        extra_update: Optional[GameUpdate] = None,
+        owner_id: Optional[str] = None,
+    ) -> Optional[Game]:
         """Registra la completación de un nivel.
 
         Actualiza múltiples campos:
@@ -277,37 +653,105 @@ class FirestoreGameRepository(IGameRepository):
         - Añade reliquia si aplica.
         - Calcula porcentaje de completado.
 
+        La lectura y la escritura van dentro de una transacción: si otra petición
+        modifica la partida entre medias, Firestore aborta y se reintenta. El dueño
+        y el estado se comprueban sobre esa misma lectura, sin leer la partida antes.
+
         Args:
             game_id (str): ID de la partida.
             level_data (LevelComplete): Datos del nivel completado.
+            extra_update (Optional[GameUpdate]): Campos adicionales que se escriben
+                en la misma transacción (ej. boss_defeated al completar el último nivel).
+            owner_id (Optional[str]): Si se indica, la partida debe ser de este jugador.
 
         Returns:
             Optional[Game]: Partida actualizada si existe, None si no.
+
+        Raises:
+            AuthorizationException: Si la partida es de otro jugador.
+            ValueError: Si la partida no está activa.
         """
         doc_ref = self.collection.document(game_id)
-        doc = doc_ref.get()
+        apply = transactional(self._complete_level_in_transaction)
+        try:
+            game = apply(
+                self.db.transaction(), doc_ref, game_id, level_data, extra_update, owner_id
+            )
+        finally:
+            self._invalidate(game_id)
+        return game
+
+    def _complete_level_in_transaction(
+        self,
+        transaction: Transaction,
+        doc_ref,
+        game_id: str,
+        level_data: LevelComplete,
+        extra_update: Optional[GameUpdate] = None,
+        owner_id: Optional[str] = None,
+    ) -> Optional[Game]:
+        """Lee la partida y aplica la completación del nivel dentro de una transacción.
+
+        Args:
+            transaction (Transaction): Transacción en curso.
+            doc_ref: Referencia al documento de la partida.
+            game_id (str): ID de la partida.
+            level_data (LevelComplete): Datos del nivel completado.
+            extra_update (Optional[GameUpdate]): Campos adicionales a escribir.
+            owner_id (Optional[str]): Si se indica, la partida debe ser de este jugador.
+
+        Returns:
+            Optional[Game]: Partida actualizada si existe, None si no.
+
+        Raises:
+            AuthorizationException: Si la partida es de otro jugador.
+            ValueError: Si la partida no está activa.
+        """
+        doc = doc_ref.get(transaction=transaction)
 
         if not doc.exists:
             return None
 
-        # Obtener el game actual
-        game = Game.from_dict(doc.to_dict())
+        # Trabajar directamente sobre el dict del snapshot (sin hidratar el modelo)
+        data = doc.to_dict()
+
+        # Precondiciones sobre la lectura de la transacción (si fallan no se escribe nada)
+        _check_preconditions(data, owner_id, require_active=True)
+        metrics = data.get("metrics") or {}
+        level_start_times = metrics.get("level_start_times") or {}
+        level = level_data.level
+
+        # Los mensajes INFO de este método solo se formatean si se van a emitir
+        info_enabled = logger.isEnabledFor(logging.INFO)
+
+        # Solo se envían a Firestore los campos que cambian (rutas con puntos).
+        # updates guarda los valores resultantes (para devolver la partida) y
+        # transforms las operaciones atómicas que se envían para los campos acumulativos
+        updates = {}
+        transforms = {}
 
         # Añadir a niveles completados (evitar duplicados)
-        if level_data.level not in game.levels_completed:
-            game.levels_completed.append(level_data.level)
+        levels_completed = data.get("levels_completed") or []
+        if level not in levels_completed:
+            levels_completed = levels_completed + [level]
+            updates["levels_completed"] = levels_completed
+            transforms["levels_completed"] = ArrayUnion([level])
 
         # CALCULAR TIEMPO AUTOMÁTICAMENTE si no se proporciona
         time_seconds = level_data.time_seconds
 
         if time_seconds is None:
             # Calcular desde timestamp guardado en start_level
-            logger.info(
-                f"🔍 Buscando timestamp de inicio para '{level_data.level}' | "
-                f"Timestamps guardados: {list(game.metrics.level_start_times.keys())} "
-                f"[Partida: {game_id[:8]}...]"
-            )
-            level_start_time = game.metrics.level_start_times.get(level_data.level)
+            if info_enabled:
+                logger.info(
+                    "🔍 Buscando timestamp de inicio para '%s' | "
+                    "Timestamps guardados: %s "
+                    "[Partida: %s...]",
+                    level,
+                    list(level_start_times.keys()),
+                    game_id[:8],
+                )
+            level_start_time = level_start_times.get(level)
 
             if level_start_time:
                 now = datetime.now(timezone.utc)
@@ -320,97 +764,124 @@ class FirestoreGameRepository(IGameRepository):
 
                 if time_seconds < MIN_LEVEL_TIME:
                     logger.warning(
-                        f"⚠️  Tiempo calculado es {time_seconds}s (muy rápido o error de clock). "
-                        f"Forzando a {MIN_LEVEL_TIME}s. [Nivel: {level_data.level}, Partida: {game_id[:8]}...]"
+                        "⚠️  Tiempo calculado es %ss (muy rápido o error de clock). "
+                        "Forzando a %ss. [Nivel: %s, Partida: %s...]",
+                        time_seconds,
+                        MIN_LEVEL_TIME,
+                        level,
+                        game_id[:8],
                     )
                     time_seconds = MIN_LEVEL_TIME
                 elif time_seconds > MAX_LEVEL_TIME:
                     # Posible pérdida de conexión o juego pausado
                     logger.warning(
-                        f"⚠️  Tiempo calculado es {time_seconds}s ({time_seconds // 60} min) - excede límite razonable. "
-                        f"Posible pérdida de conexión. Forzando a {MAX_LEVEL_TIME}s (1 hora). "
-                        f"[Nivel: {level_data.level}, Partida: {game_id[:8]}...]"
+                        "⚠️  Tiempo calculado es %ss (%s min) - excede límite razonable. "
+                        "Posible pérdida de conexión. Forzando a %ss (1 hora). "
+                        "[Nivel: %s, Partida: %s...]",
+                        time_seconds,
+                        time_seconds // 60,
+                        MAX_LEVEL_TIME,
+                        level,
+                        game_id[:8],
                     )
                     time_seconds = MAX_LEVEL_TIME
-                else:
+                elif info_enabled:
                     logger.info(
-                        f"⏱️  Tiempo calculado automáticamente: {time_seconds}s ({time_seconds // 60} min) "
-                        f"para nivel '{level_data.level}' "
-                        f"[Inicio: {level_start_time}, Fin: {now}] [Partida: {game_id[:8]}...]"
+                        "⏱️  Tiempo calculado automáticamente: %ss (%s min) "
+                        "para nivel '%s' "
+                        "[Inicio: %s, Fin: %s] [Partida: %s...]",
+                        time_seconds,
+                        time_seconds // 60,
+                        level,
+                        level_start_time,
+                        now,
+                        game_id[:8],
                     )
             else:
                 # No hay timestamp de inicio, usar 1 segundo como fallback
                 time_seconds = 1
                 logger.error(
-                    f"❌ ERROR: No se encontró timestamp de inicio para '{level_data.level}'! "
-                    f"Timestamps disponibles: {list(game.metrics.level_start_times.keys())} | "
-                    f"Unity debe llamar start_level() ANTES de complete_level(). "
-                    f"Usando fallback de 1s. [Partida: {game_id[:8]}...]"
+                    "❌ ERROR: No se encontró timestamp de inicio para '%s'! "
+                    "Timestamps disponibles: %s | "
+                    "Unity debe llamar start_level() ANTES de complete_level(). "
+                    "Usando fallback de 1s. [Partida: %s...]",
+                    level,
+                    list(level_start_times.keys()),
+                    game_id[:8],
                 )
-        else:
+        elif info_enabled:
             logger.info(
-                f"⏱️  Tiempo proporcionado por cliente: {time_seconds}s para nivel '{level_data.level}'"
+                "⏱️  Tiempo proporcionado por cliente: %ss para nivel '%s'", time_seconds, level
             )
 
         # Actualizar métricas del nivel
-        game.metrics.time_per_level[level_data.level] = time_seconds
-        game.metrics.deaths_per_level[level_data.level] = level_data.deaths
-        game.metrics.total_deaths += level_data.deaths
+        updates[f"metrics.time_per_level.{level}"] = time_seconds
+        updates[f"metrics.deaths_per_level.{level}"] = level_data.deaths
+        updates["metrics.total_deaths"] = metrics.get("total_deaths", 0) + level_data.deaths
+        transforms["metrics.total_deaths"] = Increment(level_data.deaths)
 
         # Actualizar tiempo total de juego
-        game.total_time_seconds += time_seconds
+        updates["total_time_seconds"] = data.get("total_time_seconds", 0) + time_seconds
+        transforms["total_time_seconds"] = Increment(time_seconds)
 
         # Registrar decisión moral si el nivel tiene una
-        levels_with_choices = {
-            "senda_ebano": "sanar/forzar",
-            "fortaleza_gigantes": "construir/destruir",
-            "aquelarre_sombras": "revelar/ocultar",
-        }
+        choice_field = _CHOICE_FIELDS.get(level)
 
         if level_data.choice:
-            # Determinar si es buena o mala decisión
-            good_choices = {"sanar", "construir", "revelar"}
-            bad_choices = {"forzar", "destruir", "ocultar"}
-
-            moral_type = (
-                "BUENA"
-                if level_data.choice in good_choices
-                else "MALA" if level_data.choice in bad_choices else "DESCONOCIDA"
-            )
-
-            # Log detallado de la decisión moral
-            logger.info(
-                f"🎭 DECISIÓN MORAL: Jugador {game.player_id[:8]}... "
-                f"eligió '{level_data.choice}' ({moral_type}) en nivel '{level_data.level}' "
-                f"[Partida: {game_id[:8]}...]"
-            )
+            if info_enabled:
+                # Determinar si es buena o mala decisión
+                moral_type = _MORAL_TYPES.get(level_data.choice, "DESCONOCIDA")
+
+                # Log detallado de la decisión moral
+                logger.info(
+                    "🎭 DECISIÓN MORAL: Jugador %s... "
+                    "eligió '%s' (%s) en nivel '%s' "
+                    "[Partida: %s...]",
+                    data["player_id"][:8],
+                    level_data.choice,
+                    moral_type,
+                    level,
+                    game_id[:8],
+                )
 
-            if level_data.level == "senda_ebano":
-                game.choices.senda_ebano = level_data.choice
-            elif level_data.level == "fortaleza_gigantes":
-                game.choices.fortaleza_gigantes = level_data.choice
-            elif level_data.level == "aquelarre_sombras":
-                game.choices.aquelarre_sombras = level_data.choice
-        elif level_data.level in levels_with_choices:
+            if choice_field:
+                updates[choice_field[0]] = level_data.choice
+        elif choice_field:
             # El nivel requiere decisión moral pero no se envió
             logger.warning(
-                f"⚠️  DECISIÓN MORAL FALTANTE: El nivel '{level_data.level}' requiere una decisión moral "
-                f"pero no se recibió el campo 'choice'. Decisiones válidas: {levels_with_choices[level_data.level]} "
-                f"[Jugador: {game.player_id[:8]}..., Partida: {game_id[:8]}...]"
+                "⚠️  DECISIÓN MORAL FALTANTE: El nivel '%s' requiere una decisión moral "
+                "pero no se recibió el campo 'choice'. Decisiones válidas: %s "
+                "[Jugador: %s..., Partida: %s...]",
+                level,
+                choice_field[1],
+                data["player_id"][:8],
+                game_id[:8],
             )
 
         # Añadir reliquia obtenida (evitar duplicados)
-        if level_data.relic and level_data.relic not in game.relics:
-            game.relics.append(level_data.relic)
+        relics = data.get("relics") or []
+        if level_data.relic and level_data.relic not in relics:
+            updates["relics"] = relics + [level_data.relic]
+            transforms["relics"] = ArrayUnion([level_data.relic])
 
         # Calcular porcentaje de completado (5 niveles totales en el juego)
-        game.completion_percentage = (len(game.levels_completed) / 5) * 100
+        updates["completion_percentage"] = len(levels_completed) * PERCENT_PER_LEVEL
 
-        # Guardar todos los cambios
-        doc_ref.set(game.to_dict())
+        # Campos extra del servicio: van en el mismo update en lugar de otra escritura
+        if extra_update is not None:
+            updates.update(extra_update.model_dump(exclude_none=True))
 
-        logger.info(f"Nivel completado: {level_data.level} en partida {game_id}")
-        return game
+        # Guardar solo los campos modificados (los acumulativos con transformaciones
+        # atómicas para no perder escrituras concurrentes)
+        transaction.update(doc_ref, {**updates, **transforms})
+
+        # Aplicar los mismos cambios al snapshot local para devolver la partida
+        # actualizada sin volver a leerla de Firestore
+        for path, value in updates.items():
+            _apply_field_path(data, path, value)
+
+        logger.debug("Nivel completado", game_id=game_id, level=level)
+        return Game.from_dict(data)
 
     def delete(self, game_id: str) -> bool:
         """Elimina una partida.
@@ -421,14 +892,15 @@ class FirestoreGameRepository(IGameRepository):
         Returns:
             bool: True si se eliminó, False si no existía.
         """
-        doc_ref = self.collection.document(game_id)
-        doc = doc_ref.get()
-
-        if not doc.exists:
+        # Precondición exists=True: Firestore rechaza el borrado si no existe
+        try:
+            self.collection.document(game_id).delete(option=self.db.write_option(exists=True))
+        except NotFound:
             return False
+        finally:
+            self._invalidate(game_id)
 
-        doc_ref.delete()
-        logger.info(f"Partida eliminada: {game_id}")
+        logger.debug("Partida eliminada", game_id=game_id)
         return True
 
     def count(
@@ -475,14 +947,7 @@ class FirestoreGameRepository(IGameRepository):
             query = query.where(filter=FieldFilter("status", "==", status))
 
         # Filtros de fecha
-        if days is not None:
-            cutoff = datetime.now(timezone.utc) - timedelta(days=days)
-            query = query.where(filter=FieldFilter("started_at", ">=", cutoff))
-        elif since is not None:
-            query = query.where(filter=FieldFilter("started_at", ">=", since))
-
-        if until is not None:
-            query = query.where(filter=FieldFilter("started_at", "<=", until))
+        query = _apply_date_filters(query, days, since, until)
 
         # Ejecutar count aggregation
         try:
@@ -490,12 +955,12 @@ class FirestoreGameRepository(IGameRepository):
             results = aggregate_query.get()
 
             count_value = results[0][0].value
-            logger.debug(f"Counted {count_value} games (aggregation query)")
+            logger.debug("Counted %s games (aggregation query)", count_value)
             return count_value
 
         except Exception as e:
-            logger.error(f"Error en count aggregation: {e}")
-            # Fallback a método ineficiente si falla
-            logger.warning("Usando fallback ineficiente: get_all + len()")
-            games = self.get_all(limit=10000, days=days, since=since, until=until)
-            return len(games)
+            logger.error("Error en count aggregation: %s", e)
+            # Fallback acotado: select([]) solo trae los IDs (sin cargar partidas)
+            logger.warning("Usando fallback de conteo por IDs", max_documents=COUNT_FALLBACK_LIMIT)
+            docs = query.select([]).limit(COUNT_FALLBACK_LIMIT).stream()
+            return sum(1 for _ in docs)
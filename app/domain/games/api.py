@@ -13,32 +13,70 @@ Reglas de acceso:
 Autor: Mandrágora
 """
 
+import base64
+import json
 from datetime import datetime
-from typing import List, Optional
+from functools import lru_cache
+from typing import Annotated, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Request
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import TypeAdapter
 
-from app.middleware.rate_limit import GAME_CREATE_LIMIT, limiter
+from app.core.exceptions import AuthorizationException, NotFoundException
+from app.middleware.auth import AuthCtx, get_auth_ctx, require_admin
+from app.middleware.rate_limit import GAME_CREATE_LIMIT, get_player_key, limiter
 
 from ..players.adapters.firestore_repository import FirestorePlayerRepository
 
 # Importar dependencies de Players (Games depende de Players)
 from ..players.ports import IPlayerRepository
 from ..players.service import PlayerService
-from .adapters.firestore_repository import FirestoreGameRepository
-from .models import Game
+from .adapters import AsyncFirestoreGameRepository, FirestoreGameRepository
+from .models import Game, GameSummary
 from .ports import IGameRepository
 from .schemas import GameCreate, GameUpdate, LevelComplete, LevelStart
 from .service import GameService
 
-# Router de FastAPI
-router = APIRouter(prefix="/v1/games", tags=["Games"])
+# Parser ISO 8601 en C (opcional): si no está instalado se usa datetime.fromisoformat
+try:
+    from ciso8601 import parse_datetime as _parse_iso
+except ImportError:
+    _parse_iso = datetime.fromisoformat
+
+# Router de FastAPI (respuestas serializadas con orjson)
+router = APIRouter(prefix="/v1/games", tags=["Games"], default_response_class=ORJSONResponse)
+
+# Parámetros de query compartidos por los endpoints de listado (el default va en la firma)
+AdminLimit = Annotated[int, Query(ge=1, le=500, description="Máximo de partidas a retornar")]
+PlayerLimit = Annotated[int, Query(ge=1, le=200, description="Máximo de partidas a retornar")]
+DaysFilter = Annotated[
+    Optional[int], Query(ge=1, le=90, description="Filtrar últimos N días (máx 90)")
+]
+SinceFilter = Annotated[
+    Optional[str], Query(description="Filtrar desde fecha ISO (ej: 2026-01-25)")
+]
+UntilFilter = Annotated[Optional[str], Query(description="Filtrar hasta fecha ISO")]
+PageCursor = Annotated[
+    Optional[str], Query(description="Cursor de la página anterior (cabecera X-Next-Cursor)")
+]
+
+# Serializadores precompilados: convierten las partidas a JSON en una sola pasada
+# del núcleo de Pydantic (Rust), sin dicts intermedios
+GAME_ADAPTER = TypeAdapter(Game)
+GAMES_ADAPTER = TypeAdapter(List[Game])
+SUMMARIES_ADAPTER = TypeAdapter(List[GameSummary])
+
+
+# Cuerpo del 404 más habitual, serializado una sola vez
+_GAME_NOT_FOUND_BODY = orjson.dumps({"detail": "Partida no encontrada"})
 
 
 # ==================== HELPERS ====================
 
 
-def check_game_access(request: Request, game: Game, service: GameService) -> None:
+def check_game_access(auth: AuthCtx, game: Game, service: GameService) -> None:
     """Verifica que el usuario tenga permisos para acceder a la partida especificada.
 
     Reglas:
@@ -46,28 +84,115 @@ def check_game_access(request: Request, game: Game, service: GameService) -> Non
     - Jugador autenticado: solo puede acceder a sus propias partidas.
 
     Args:
-        request (Request): Request de FastAPI con estado de autenticación.
+        auth (AuthCtx): Contexto de autenticación del request.
         game (Game): Partida a la que se quiere acceder.
         service (GameService): Servicio de games (no usado pero mantenido para consistencia).
 
     Raises:
         HTTPException: Si no tiene permisos (403).
     """
-    is_admin = getattr(request.state, "is_admin", False)
-    authenticated_player_id = getattr(request.state, "player_id", None)
-
     # Admin puede acceder a cualquier partida
-    if is_admin:
+    if auth.is_admin:
         return
 
     # Jugador solo puede acceder a sus propias partidas
-    if game.player_id != authenticated_player_id:
+    if game.player_id != auth.player_id:
+        raise HTTPException(
+            status_code=403, detail="No tienes permisos para acceder a esta partida"
+        )
+
+
+def game_response(game: Game, status_code: int = 200) -> Response:
+    """Serializa una partida ya validada directamente a JSON.
+
+    Las partidas que devuelve el servicio ya son instancias de Game, así que
+    no hace falta que FastAPI las vuelva a validar con response_model: el
+    esquema se documenta con responses={...: {"model": Game}}.
+
+    Args:
+        game (Game): Partida a devolver.
+        status_code (int): Código HTTP de la respuesta.
+
+    Returns:
+        Response: Respuesta JSON con la partida.
+    """
+    return Response(
+        content=GAME_ADAPTER.dump_json(game), status_code=status_code, media_type="application/json"
+    )
+
+
+def game_not_found() -> Response:
+    """Respuesta 404 "Partida no encontrada" con el cuerpo precalculado.
+
+    Se devuelve en lugar de lanzar HTTPException: evita crear y capturar la
+    excepción y volver a serializar el detalle en cada petición.
+
+    Returns:
+        Response: Respuesta 404 en JSON.
+    """
+    return Response(content=_GAME_NOT_FOUND_BODY, status_code=404, media_type="application/json")
+
+
+def get_owner_filter(auth: AuthCtx) -> Optional[str]:
+    """Devuelve el jugador que debe ser dueño de la partida a modificar.
+
+    El servicio comprueba el dueño con la misma lectura que usa para la
+    operación, así que el endpoint no necesita pedir la partida antes.
+
+    Args:
+        auth (AuthCtx): Contexto de autenticación del request.
+
+    Returns:
+        Optional[str]: None si es admin (sin restricción), el ID del jugador si no.
+
+    Raises:
+        HTTPException: Si no es admin ni jugador autenticado (403).
+    """
+    if auth.is_admin:
+        return None
+
+    if auth.player_id is None:
         raise HTTPException(
             status_code=403, detail="No tienes permisos para acceder a esta partida"
         )
+    return auth.player_id
+
+
+@lru_cache(maxsize=1024)
+def _fromisoformat(value: str) -> datetime:
+    """Parseo ISO 8601 cacheado: los dashboards repiten las mismas fechas."""
+    return _parse_iso(value)
+
+
+def parse_iso_date(name: str, value: Optional[str]) -> Optional[datetime]:
+    """Parsea un filtro de fecha ISO 8601 de la query string.
+
+    Usa ciso8601 si está instalado. Tanto ciso8601 como fromisoformat
+    (Python 3.11+) aceptan el sufijo "Z", así que no hace falta reemplazarlo
+    por "+00:00".
+
+    Args:
+        name (str): Nombre del parámetro (para el mensaje de error).
+        value (Optional[str]): Fecha recibida.
+
+    Returns:
+        Optional[datetime]: Fecha parseada, o None si no se envió.
+
+    Raises:
+        HTTPException: Si el formato no es ISO 8601 (400).
+    """
+    if not value:
+        return None
+    try:
+        return _fromisoformat(value)
+    except ValueError:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Formato de fecha '{name}' inválido. Usa ISO 8601: YYYY-MM-DD o YYYY-MM-DDTHH:MM:SS",
+        )
 
 
-def check_player_games_access(request: Request, target_player_id: str) -> None:
+def check_player_games_access(auth: AuthCtx, target_player_id: str) -> None:
     """Verifica que el usuario tenga permisos para ver las partidas de un jugador.
 
     Reglas:
@@ -75,96 +200,135 @@ def check_player_games_access(request: Request, target_player_id: str) -> None:
     - Jugador autenticado: solo puede ver sus propias partidas.
 
     Args:
-        request (Request): Request de FastAPI con estado de autenticación.
+        auth (AuthCtx): Contexto de autenticación del request.
         target_player_id (str): ID del jugador cuyas partidas se quieren ver.
 
     Raises:
         HTTPException: Si no tiene permisos (403).
     """
-    is_admin = getattr(request.state, "is_admin", False)
-    authenticated_player_id = getattr(request.state, "player_id", None)
-
     # Admin puede ver partidas de cualquier jugador
-    if is_admin:
+    if auth.is_admin:
         return
 
     # Jugador solo puede ver sus propias partidas
-    if authenticated_player_id != target_player_id:
+    if auth.player_id != target_player_id:
         raise HTTPException(
             status_code=403,
             detail="No tienes permisos para ver las partidas de este jugador",
         )
 
 
+def encode_cursor(cursor: dict) -> str:
+    """Serializa el cursor de paginación a un token opaco (base64 URL-safe).
+
+    Args:
+        cursor (dict): Cursor del repositorio ({"started_at": datetime, "__name__": game_id}).
+
+    Returns:
+        str: Token para enviar al cliente en la cabecera X-Next-Cursor.
+    """
+    payload = {"started_at": cursor["started_at"].isoformat(), "game_id": cursor["__name__"]}
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+
+def decode_cursor(token: str) -> dict:
+    """Reconstruye el cursor de paginación a partir del token del cliente.
+
+    Args:
+        token (str): Token recibido en el parámetro cursor.
+
+    Returns:
+        dict: Cursor para el repositorio.
+
+    Raises:
+        HTTPException: Si el token no es válido (400).
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(token.encode()))
+        return {
+            "started_at": datetime.fromisoformat(payload["started_at"]),
+            "__name__": payload["game_id"],
+        }
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(status_code=400, detail="Cursor de paginación inválido")
+
+
 # ==================== DEPENDENCY INJECTION ====================
+# Repositorios y servicios no guardan estado por request: el grafo se construye
+# una vez por proceso (lru_cache). Los endpoints solo dependen de get_game_service,
+# que no tiene sub-dependencias, así que FastAPI resuelve una única función por request.
 
 
+@lru_cache(maxsize=1)
 def get_game_repository() -> IGameRepository:
-    """Dependency que provee el repositorio de Games.
+    """Provee el repositorio de Games.
 
     Returns:
-        IGameRepository: Repositorio instanciado.
+        IGameRepository: Repositorio compartido.
     """
     return FirestoreGameRepository()
 
 
+@lru_cache(maxsize=1)
+def get_async_game_repository() -> AsyncFirestoreGameRepository:
+    """Dependency que provee el repositorio asíncrono (solo lectura) de Games.
+
+    Returns:
+        AsyncFirestoreGameRepository: Repositorio compartido.
+    """
+    return AsyncFirestoreGameRepository()
+
+
+@lru_cache(maxsize=1)
 def get_player_repository() -> IPlayerRepository:
-    """Dependency que provee el repositorio de Players.
+    """Provee el repositorio de Players.
 
     Returns:
-        IPlayerRepository: Repositorio instanciado.
+        IPlayerRepository: Repositorio compartido.
     """
     return FirestorePlayerRepository()
 
 
-def get_player_service(
-    player_repository: IPlayerRepository = Depends(get_player_repository),
-) -> PlayerService:
-    """Dependency que provee el servicio de Players.
-
-    Args:
-        player_repository (IPlayerRepository): Repositorio inyectado.
+@lru_cache(maxsize=1)
+def get_player_service() -> PlayerService:
+    """Provee el servicio de Players.
 
     Returns:
-        PlayerService: Servicio instanciado.
+        PlayerService: Servicio compartido.
     """
-    return PlayerService(repository=player_repository)
+    return PlayerService(repository=get_player_repository())
 
 
-def get_game_service(
-    game_repository: IGameRepository = Depends(get_game_repository),
-    player_repository: IPlayerRepository = Depends(get_player_repository),
-    player_service: PlayerService = Depends(get_player_service),
-) -> GameService:
+@lru_cache(maxsize=1)
+def get_game_service() -> GameService:
     """Dependency que provee el servicio de Games.
 
     Games depende de Players para:
     - Verificar que el jugador existe al crear partida.
     - Actualizar stats del jugador al terminar partida.
 
-    Args:
-        game_repository (IGameRepository): Repositorio de juegos.
-        player_repository (IPlayerRepository): Repositorio de jugadores.
-        player_service (PlayerService): Servicio de jugadores.
+    Las dependencias se obtienen de los providers cacheados en lugar de con
+    Depends: así FastAPI no recorre la cadena de sub-dependencias en cada request.
 
     Returns:
-        GameService: Servicio instanciado.
+        GameService: Servicio compartido.
     """
     return GameService(
-        game_repository=game_repository,
-        player_repository=player_repository,
-        player_service=player_service,
+        game_repository=get_game_repository(),
+        player_repository=get_player_repository(),
+        player_service=get_player_service(),
     )
 
 
 # ==================== ENDPOINTS ====================
 
 
-@router.post("", response_model=Game, status_code=201)
-@limiter.limit(GAME_CREATE_LIMIT)
+@router.post("", status_code=201, responses={201: {"model": Game}})
+@limiter.limit(GAME_CREATE_LIMIT, key_func=get_player_key)
 def create_game(
     request: Request,
     game_data: GameCreate,
+    auth: AuthCtx = Depends(get_auth_ctx),
     service: GameService = Depends(get_game_service),
 ):
     """Iniciar una nueva partida.
@@ -176,7 +340,8 @@ def create_game(
 
     Args:
         game_data (GameCreate): Datos de la partida (player_id opcional, se usa el autenticado).
-        request (Request): Request de FastAPI.
+        request (Request): Request de FastAPI (lo usa el rate limiter).
+        auth (AuthCtx): Contexto de autenticación del request.
         service (GameService): Servicio inyectado.
 
     Returns:
@@ -187,38 +352,29 @@ def create_game(
         HTTPException: Si el jugador no existe (404).
         HTTPException: Si ya tiene partida activa (409).
     """
-    is_admin = getattr(request.state, "is_admin", False)
-    authenticated_player_id = getattr(request.state, "player_id", None)
-
     # Si no se envía player_id, usar el del jugador autenticado
     if game_data.player_id is None:
-        game_data.player_id = authenticated_player_id
+        game_data.player_id = auth.player_id
 
     # Verificar que el jugador autenticado puede crear partida para este player_id
-    if not is_admin and game_data.player_id != authenticated_player_id:
+    if not auth.is_admin and game_data.player_id != auth.player_id:
         raise HTTPException(status_code=403, detail="Solo puedes crear partidas para ti mismo")
 
     try:
-        return service.create_game(game_data)
+        return game_response(service.create_game(game_data), status_code=201)
+    except NotFoundException as e:
+        raise HTTPException(status_code=404, detail=e.message)
     except ValueError as e:
-        # Distinguir tipo de error
-        if "no encontrado" in str(e):
-            raise HTTPException(status_code=404, detail=str(e))
-        else:
-            raise HTTPException(status_code=409, detail=str(e))
+        raise HTTPException(status_code=409, detail=str(e))
 
 
-@router.get("", response_model=List[Game])
+@router.get("", responses={200: {"model": List[Game]}}, dependencies=[Depends(require_admin)])
 def get_all_games(
-    request: Request,
-    limit: int = Query(default=100, ge=1, le=500, description="Máximo de partidas a retornar"),
-    days: Optional[int] = Query(
-        default=None, ge=1, le=90, description="Filtrar últimos N días (máx 90)"
-    ),
-    since: Optional[str] = Query(
-        default=None, description="Filtrar desde fecha ISO (ej: 2026-01-25)"
-    ),
-    until: Optional[str] = Query(default=None, description="Filtrar hasta fecha ISO"),
+    limit: AdminLimit = 100,
+    days: DaysFilter = None,
+    since: SinceFilter = None,
+    until: UntilFilter = None,
+    cursor: PageCursor = None,
     service: GameService = Depends(get_game_service),
 ):
     """Obtener todas las partidas de todos los jugadores (ADMIN ONLY).
@@ -233,13 +389,21 @@ def get_all_games(
         GET /games?days=7              → Últimos 7 días
         GET /games?days=30&limit=50    → Últimos 30 días, máx 50
         GET /games?since=2026-01-01    → Desde 1 de enero
+        GET /games?cursor=<X-Next-Cursor>  → Siguiente página
+
+    Paginación: si hay más resultados, la respuesta incluye la cabecera
+    X-Next-Cursor con el token para pedir la siguiente página. El cuerpo
+    sigue siendo una lista de partidas.
+
+    Las partidas ya vienen validadas del repositorio, así que se serializan
+    directamente (sin response_model ni jsonable_encoder).
 
     Args:
-        request (Request): Request de FastAPI.
         limit (int): Máximo número de partidas a retornar (default: 100, máx: 500).
         days (int, optional): Filtrar últimos N días (1-90).
         since (str, optional): Filtrar desde fecha ISO 8601.
         until (str, optional): Filtrar hasta fecha ISO 8601.
+        cursor (str, optional): Cursor de paginación de la página anterior.
         service (GameService): Servicio inyectado.
 
     Returns:
@@ -248,49 +412,210 @@ def get_all_games(
     Raises:
         HTTPException: Si no tiene permisos de admin (403) o formato de fecha inválido (400).
     """
-    # Verificar que es admin
-    is_admin = getattr(request.state, "is_admin", False)
+    # Parsear fechas si se proporcionaron
+    since_date = parse_iso_date("since", since)
+    until_date = parse_iso_date("until", until)
 
-    if not is_admin:
-        raise HTTPException(
-            status_code=403,
-            detail="Este endpoint requiere permisos de administrador. Usa API Key o JWT token de admin.",
-        )
+    games, next_cursor = service.get_all_games_page(
+        limit=limit,
+        cursor=decode_cursor(cursor) if cursor else None,
+        days=days,
+        since=since_date,
+        until=until_date,
+    )
+
+    headers = {"X-Next-Cursor": encode_cursor(next_cursor)} if next_cursor else None
+
+    return Response(
+        content=GAMES_ADAPTER.dump_json(games), media_type="application/json", headers=headers
+    )
+
+
+@router.get(
+    "/summary",
+    responses={200: {"model": List[GameSummary]}},
+    dependencies=[Depends(require_admin)],
+)
+def get_all_games_summary(
+    limit: AdminLimit = 100,
+    days: DaysFilter = None,
+    since: SinceFilter = None,
+    until: UntilFilter = None,
+    cursor: PageCursor = None,
+    service: GameService = Depends(get_game_service),
+):
+    """Obtener un resumen ligero de todas las partidas (ADMIN ONLY).
+
+    Devuelve solo id, jugador, estado, porcentaje completado y fecha de inicio.
+    Firestore solo envía esos campos, así que es mucho más barato que GET /games
+    para listados que no necesitan métricas ni decisiones.
+
+    Paginación: igual que GET /games, la cabecera X-Next-Cursor trae el
+    token de la siguiente página si hay más resultados.
+
+    Args:
+        limit (int): Máximo número de partidas a retornar (default: 100, máx: 500).
+        days (int, optional): Filtrar últimos N días (1-90).
+        since (str, optional): Filtrar desde fecha ISO 8601.
+        until (str, optional): Filtrar hasta fecha ISO 8601.
+        cursor (str, optional): Cursor de paginación de la página anterior.
+        service (GameService): Servicio inyectado.
+
+    Returns:
+        List[GameSummary]: Resúmenes de las partidas filtradas.
+
+    Raises:
+        HTTPException: Si no tiene permisos de admin (403) o formato de fecha inválido (400).
+    """
+    # Parsear fechas si se proporcionaron
+    since_date = parse_iso_date("since", since)
+    until_date = parse_iso_date("until", until)
+
+    summaries, next_cursor = service.get_all_games_summary_page(
+        limit=limit,
+        cursor=decode_cursor(cursor) if cursor else None,
+        days=days,
+        since=since_date,
+        until=until_date,
+    )
+
+    headers = {"X-Next-Cursor": encode_cursor(next_cursor)} if next_cursor else None
+
+    return Response(
+        content=SUMMARIES_ADAPTER.dump_json(summaries),
+        media_type="application/json",
+        headers=headers,
+    )
+
+
+@router.get(
+    "/export", responses={200: {"model": List[Game]}}, dependencies=[Depends(require_admin)]
+)
+async def export_games(
+    days: DaysFilter = None,
+    since: SinceFilter = None,
+    until: UntilFilter = None,
+    repository: AsyncFirestoreGameRepository = Depends(get_async_game_repository),
+):
+    """Exportar todas las partidas filtradas como JSON en streaming (ADMIN ONLY).
+
+    Pensado para analytics: a diferencia de GET /games no tiene límite ni
+    paginación. Cada partida se serializa y se envía según llega de Firestore,
+    así que el primer byte sale con el primer documento y la memoria no crece
+    con el número de partidas. El cuerpo es la misma lista JSON que GET /games.
+
+    Examples:
+        GET /games/export?days=30          → Partidas de los últimos 30 días
+        GET /games/export?since=2026-01-01 → Desde 1 de enero
+
+    Args:
+        days (int, optional): Filtrar últimos N días (1-90).
+        since (str, optional): Filtrar desde fecha ISO 8601.
+        until (str, optional): Filtrar hasta fecha ISO 8601.
+        repository (AsyncFirestoreGameRepository): Repositorio asíncrono inyectado.
+
+    Returns:
+        StreamingResponse: Lista JSON de partidas.
+
+    Raises:
+        HTTPException: Si no tiene permisos de admin (403) o formato de fecha inválido (400).
+    """
+    # Parsear fechas antes de empezar a enviar: un error debe ser un 400, no un cuerpo cortado
+    since_date = parse_iso_date("since", since)
+    until_date = parse_iso_date("until", until)
+
+    async def body():
+        yield b"["
+        separator = b""
+        async for game in repository.stream_all(days=days, since=since_date, until=until_date):
+            yield separator + GAME_ADAPTER.dump_json(game)
+            separator = b","
+        yield b"]"
+
+    return StreamingResponse(body(), media_type="application/json")
+
+
+# Debe declararse antes de /{game_id}: si no, "count" se toma como ID de partida
+@router.get("/count", dependencies=[Depends(require_admin)])
+def count_games(
+    player_id: Optional[str] = Query(default=None, description="Filtrar por jugador"),
+    status: Optional[str] = Query(
+        default=None, description="Filtrar por estado (in_progress, completed, abandoned)"
+    ),
+    days: Optional[int] = Query(default=None, ge=1, le=365, description="Filtrar últimos N días"),
+    since: SinceFilter = None,
+    until: UntilFilter = None,
+    service: GameService = Depends(get_game_service),
+):
+    """Cuenta partidas de forma eficiente usando Firestore aggregation.
+
+    Este endpoint usa count aggregation de Firestore en lugar de traer
+    todos los documentos, lo que lo hace mucho más eficiente y económico.
+
+    REQUIERE API KEY (admin only).
+
+    Examples:
+        GET /games/count                    → Total de partidas
+        GET /games/count?days=30            → Partidas de últimos 30 días
+        GET /games/count?player_id=abc      → Partidas de un jugador
+        GET /games/count?status=completed   → Partidas completadas
+
+    Args:
+        player_id (str, optional): Filtrar por jugador.
+        status (str, optional): Filtrar por estado.
+        days (int, optional): Filtrar últimos N días.
+        since (str, optional): Filtrar desde fecha ISO 8601.
+        until (str, optional): Filtrar hasta fecha ISO 8601.
+        service (GameService): Servicio inyectado.
+
+    Returns:
+        JSON: {"count": int, "filters": dict}
 
+    Raises:
+        HTTPException: Si no eres admin (403) o formato de fecha inválido (400).
+    """
     # Parsear fechas si se proporcionaron
-    since_date = None
-    until_date = None
-
-    if since:
-        try:
-            since_date = datetime.fromisoformat(since.replace("Z", "+00:00"))
-        except ValueError:
-            raise HTTPException(
-                status_code=400,
-                detail="Formato de fecha 'since' inválido. Usa ISO 8601: YYYY-MM-DD o YYYY-MM-DDTHH:MM:SS",
-            )
-
-    if until:
-        try:
-            until_date = datetime.fromisoformat(until.replace("Z", "+00:00"))
-        except ValueError:
-            raise HTTPException(
-                status_code=400,
-                detail="Formato de fecha 'until' inválido. Usa ISO 8601: YYYY-MM-DD o YYYY-MM-DDTHH:MM:SS",
-            )
-
-    return service.get_all_games(limit=limit, days=days, since=since_date, until=until_date)
-
-
-@router.get("/{game_id}", response_model=Game)
-def get_game(game_id: str, request: Request, service: GameService = Depends(get_game_service)):
+    since_date = parse_iso_date("since", since)
+    until_date = parse_iso_date("until", until)
+
+    # Contar partidas con filtros
+    count = service.count_games(
+        player_id=player_id,
+        status=status,
+        days=days,
+        since=since_date,
+        until=until_date,
+    )
+
+    # Retornar count con información de filtros aplicados. Se devuelve el
+    # ORJSONResponse directamente: solo hay ints y strings, sin jsonable_encoder
+    return ORJSONResponse(
+        {
+            "count": count,
+            "filters": {
+                "player_id": player_id,
+                "status": status,
+                "days": days,
+                "since": since,
+                "until": until,
+            },
+        }
+    )
+
+
+@router.get("/{game_id}", responses={200: {"model": Game}})
+def get_game(
+    game_id: str,
+    auth: AuthCtx = Depends(get_auth_ctx),
+    service: GameService = Depends(get_game_service),
+):
     """Obtener una partida por ID.
 
     Solo puedes ver tus propias partidas, a menos que uses API Key (admin).
 
     Args:
         game_id (str): ID de la partida.
-        request (Request): Request de FastAPI.
+        auth (AuthCtx): Contexto de autenticación del request.
         service (GameService): Servicio inyectado.
 
     Returns:
@@ -303,22 +628,23 @@ def get_game(game_id: str, request: Request, service: GameService = Depends(get_
     game = service.get_game(game_id)
 
     if not game:
-        raise HTTPException(status_code=404, detail="Partida no encontrada")
+        return game_not_found()
 
     # Verificar permisos (admin o propia partida)
-    check_game_access(request, game, service)
+    check_game_access(auth, game, service)
 
-    return game
+    return game_response(game)
 
 
-@router.get("/player/{player_id}", response_model=List[Game])
+@router.get("/player/{player_id}", responses={200: {"model": List[Game]}})
 def get_player_games(
     player_id: str,
-    request: Request,
-    limit: int = Query(default=50, ge=1, le=200, description="Máximo de partidas a retornar"),
-    days: Optional[int] = Query(default=None, ge=1, le=90, description="Filtrar últimos N días"),
-    since: Optional[str] = Query(default=None, description="Filtrar desde fecha ISO"),
-    until: Optional[str] = Query(default=None, description="Filtrar hasta fecha ISO"),
+    auth: AuthCtx = Depends(get_auth_ctx),
+    limit: PlayerLimit = 50,
+    days: DaysFilter = None,
+    since: SinceFilter = None,
+    until: UntilFilter = None,
+    cursor: PageCursor = None,
     service: GameService = Depends(get_game_service),
 ):
     """Obtener todas las partidas de un jugador con filtros opcionales.
@@ -329,14 +655,19 @@ def get_player_games(
         GET /games/player/{id}?days=7      → Últimos 7 días
         GET /games/player/{id}?days=30     → Último mes
         GET /games/player/{id}?since=2026-01-01  → Desde enero
+        GET /games/player/{id}?cursor=<X-Next-Cursor>  → Siguiente página
+
+    Paginación: igual que GET /games, la cabecera X-Next-Cursor trae el
+    token de la siguiente página si hay más resultados.
 
     Args:
         player_id (str): ID del jugador.
-        request (Request): Request de FastAPI.
+        auth (AuthCtx): Contexto de autenticación del request.
         limit (int): Máximo número de partidas a retornar (default: 50, máx: 200).
         days (int, optional): Filtrar últimos N días (1-90).
         since (str, optional): Filtrar desde fecha ISO 8601.
         until (str, optional): Filtrar hasta fecha ISO 8601.
+        cursor (str, optional): Cursor de paginación de la página anterior.
         service (GameService): Servicio inyectado.
 
     Returns:
@@ -346,34 +677,62 @@ def get_player_games(
         HTTPException: Si intentas ver partidas de otro jugador (403) o formato inválido (400).
     """
     # Verificar permisos (admin o propio jugador)
-    check_player_games_access(request, player_id)
+    check_player_games_access(auth, player_id)
 
     # Parsear fechas si se proporcionaron
-    since_date = None
-    until_date = None
-
-    if since:
-        try:
-            since_date = datetime.fromisoformat(since.replace("Z", "+00:00"))
-        except ValueError:
-            raise HTTPException(status_code=400, detail="Formato de fecha 'since' inválido")
-
-    if until:
-        try:
-            until_date = datetime.fromisoformat(until.replace("Z", "+00:00"))
-        except ValueError:
-            raise HTTPException(status_code=400, detail="Formato de fecha 'until' inválido")
-
-    return service.get_player_games(
-        player_id, limit=limit, days=days, since=since_date, until=until_date
+    since_date = parse_iso_date("since", since)
+    until_date = parse_iso_date("until", until)
+
+    games, next_cursor = service.get_player_games_page(
+        player_id,
+        limit=limit,
+        cursor=decode_cursor(cursor) if cursor else None,
+        days=days,
+        since=since_date,
+        until=until_date,
     )
 
+    headers = {"X-Next-Cursor": encode_cursor(next_cursor)} if next_cursor else None
+
+    return Response(
+        content=GAMES_ADAPTER.dump_json(games), media_type="application/json", headers=headers
+    )
+
+
+@router.get("/player/{player_id}/summary", responses={200: {"model": List[GameSummary]}})
+def get_player_games_summary(
+    player_id: str,
+    auth: AuthCtx = Depends(get_auth_ctx),
+    limit: PlayerLimit = 50,
+    service: GameService = Depends(get_game_service),
+):
+    """Obtener un resumen ligero de las partidas de un jugador.
+
+    Devuelve solo id, estado, porcentaje completado y fecha de inicio.
+    Pensado para listados ("mis partidas") donde no hace falta la partida completa.
+
+    Args:
+        player_id (str): ID del jugador.
+        auth (AuthCtx): Contexto de autenticación del request.
+        limit (int): Máximo número de partidas a retornar (default: 50, máx: 200).
+        service (GameService): Servicio inyectado.
+
+    Returns:
+        List[GameSummary]: Resúmenes de las partidas.
+
+    Raises:
+        HTTPException: Si intentas ver partidas de otro jugador (403).
+    """
+    check_player_games_access(auth, player_id)
+    summaries = service.get_player_games_summary(player_id, limit=limit)
+    return Response(content=SUMMARIES_ADAPTER.dump_json(summaries), media_type="application/json")
+
 
-@router.patch("/{game_id}", response_model=Game)
+@router.patch("/{game_id}", responses={200: {"model": Game}})
 def update_game(
     game_id: str,
     game_update: GameUpdate,
-    request: Request,
+    auth: AuthCtx = Depends(get_auth_ctx),
     service: GameService = Depends(get_game_service),
 ):
     """Actualizar una partida.
@@ -383,7 +742,7 @@ def update_game(
     Args:
         game_id (str): ID de la partida.
         game_update (GameUpdate): Campos a actualizar.
-        request (Request): Request de FastAPI.
+        auth (AuthCtx): Contexto de autenticación del request.
         service (GameService): Servicio inyectado.
 
     Returns:
@@ -393,26 +752,23 @@ def update_game(
         HTTPException: Si intentas actualizar la partida de otro jugador (403).
         HTTPException: Si la partida no existe (404).
     """
-    # Primero obtener la partida para verificar permisos
-    game = service.get_game(game_id)
-
-    if not game:
-        raise HTTPException(status_code=404, detail="Partida no encontrada")
-
-    # Verificar permisos (admin o propia partida)
-    check_game_access(request, game, service)
+    # El servicio verifica permisos (admin o propia partida) con la misma lectura
+    try:
+        updated_game = service.update_game(game_id, game_update, owner_id=get_owner_filter(auth))
+    except AuthorizationException as e:
+        raise HTTPException(status_code=403, detail=e.message)
 
-    # Proceder con la actualización
-    updated_game = service.update_game(game_id, game_update)
+    if not updated_game:
+        return game_not_found()
 
-    return updated_game
+    return game_response(updated_game)
 
 
-@router.post("/{game_id}/level/start", response_model=Game)
+@router.post("/{game_id}/level/start", responses={200: {"model": Game}})
 def start_level(
     game_id: str,
     level_data: LevelStart,
-    request: Request,
+    auth: AuthCtx = Depends(get_auth_ctx),
     service: GameService = Depends(get_game_service),
 ):
     """Registrar inicio de un nivel.
@@ -422,7 +778,7 @@ def start_level(
     Args:
         game_id (str): ID de la partida.
         level_data (LevelStart): Datos del nivel a iniciar.
-        request (Request): Request de FastAPI.
+        auth (AuthCtx): Contexto de autenticación del request.
         service (GameService): Servicio inyectado.
 
     Returns:
@@ -433,28 +789,25 @@ def start_level(
         HTTPException: Si la partida no existe (404).
         HTTPException: Si la partida no está activa (400).
     """
-    # Primero obtener la partida para verificar permisos
-    game = service.get_game(game_id)
-
-    if not game:
-        raise HTTPException(status_code=404, detail="Partida no encontrada")
-
-    # Verificar permisos (admin o propia partida)
-    check_game_access(request, game, service)
-
-    # Proceder con iniciar el nivel
+    # El servicio verifica permisos (admin o propia partida) con la misma lectura
     try:
-        updated_game = service.start_level(game_id, level_data)
-        return updated_game
+        updated_game = service.start_level(game_id, level_data, owner_id=get_owner_filter(auth))
+    except AuthorizationException as e:
+        raise HTTPException(status_code=403, detail=e.message)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+    if not updated_game:
+        return game_not_found()
+
+    return game_response(updated_game)
+
 
-@router.post("/{game_id}/level/complete", response_model=Game)
+@router.post("/{game_id}/level/complete", responses={200: {"model": Game}})
 def complete_level(
     game_id: str,
     level_data: LevelComplete,
-    request: Request,
+    auth: AuthCtx = Depends(get_auth_ctx),
     service: GameService = Depends(get_game_service),
 ):
     """Registrar completado de un nivel.
@@ -471,7 +824,7 @@ def complete_level(
     Args:
         game_id (str): ID de la partida.
         level_data (LevelComplete): Datos del nivel completado.
-        request (Request): Request de FastAPI.
+        auth (AuthCtx): Contexto de autenticación del request.
         service (GameService): Servicio inyectado.
 
     Returns:
@@ -482,27 +835,24 @@ def complete_level(
         HTTPException: Si la partida no existe (404).
         HTTPException: Si la partida no está activa (400).
     """
-    # Primero obtener la partida para verificar permisos
-    game = service.get_game(game_id)
-
-    if not game:
-        raise HTTPException(status_code=404, detail="Partida no encontrada")
-
-    # Verificar permisos (admin o propia partida)
-    check_game_access(request, game, service)
-
-    # Proceder con completar el nivel
+    # El servicio verifica permisos (admin o propia partida) con la misma lectura
     try:
-        updated_game = service.complete_level(game_id, level_data)
-        return updated_game
+        updated_game = service.complete_level(game_id, level_data, owner_id=get_owner_filter(auth))
+    except AuthorizationException as e:
+        raise HTTPException(status_code=403, detail=e.message)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+    if not updated_game:
+        return game_not_found()
+
+    return game_response(updated_game)
 
-@router.post("/{game_id}/complete", response_model=Game)
+
+@router.post("/{game_id}/complete", responses={200: {"model": Game}})
 def complete_game(
     game_id: str,
-    request: Request,
+    auth: AuthCtx = Depends(get_auth_ctx),
     service: GameService = Depends(get_game_service),
 ):
     """Finalizar una partida (marcarla como completada).
@@ -511,7 +861,7 @@ def complete_game(
 
     Args:
         game_id (str): ID de la partida.
-        request (Request): Request de FastAPI.
+        auth (AuthCtx): Contexto de autenticación del request.
         service (GameService): Servicio inyectado.
 
     Returns:
@@ -521,26 +871,30 @@ def complete_game(
         HTTPException: Si intentas finalizar la partida de otro jugador (403).
         HTTPException: Si la partida no existe (404).
     """
-    game = service.get_game(game_id)
-
-    if not game:
-        raise HTTPException(status_code=404, detail="Partida no encontrada")
+    try:
+        updated_game = service.finish_game(game_id, completed=True, owner_id=get_owner_filter(auth))
+    except AuthorizationException as e:
+        raise HTTPException(status_code=403, detail=e.message)
 
-    check_game_access(request, game, service)
+    if not updated_game:
+        return game_not_found()
 
-    updated_game = service.finish_game(game_id, completed=True)
-    return updated_game
+    return game_response(updated_game)
 
 
 @router.delete("/{game_id}")
-def delete_game(game_id: str, request: Request, service: GameService = Depends(get_game_service)):
+def delete_game(
+    game_id: str,
+    auth: AuthCtx = Depends(get_auth_ctx),
+    service: GameService = Depends(get_game_service),
+):
     """Eliminar una partida.
 
     Solo puedes eliminar tus propias partidas, a menos que uses API Key (admin).
 
     Args:
         game_id (str): ID de la partida.
-        request (Request): Request de FastAPI.
+        auth (AuthCtx): Contexto de autenticación del request.
         service (GameService): Servicio inyectado.
 
     Returns:
@@ -550,98 +904,13 @@ def delete_game(game_id: str, request: Request, service: GameService = Depends(g
         HTTPException: Si intentas eliminar la partida de otro jugador (403).
         HTTPException: Si la partida no existe (404).
     """
-    # Primero obtener la partida para verificar permisos
-    game = service.get_game(game_id)
-
-    if not game:
-        raise HTTPException(status_code=404, detail="Partida no encontrada")
-
-    # Verificar permisos (admin o propia partida)
-    check_game_access(request, game, service)
+    # El servicio verifica permisos (admin o propia partida) antes de borrar
+    try:
+        deleted = service.delete_game(game_id, owner_id=get_owner_filter(auth))
+    except AuthorizationException as e:
+        raise HTTPException(status_code=403, detail=e.message)
 
-    # Proceder con la eliminación
-    service.delete_game(game_id)
+    if not deleted:
+        return game_not_found()
 
     return {"message": "Partida eliminada correctamente"}
-
-
-@router.get("/count")
-def count_games(
-    request: Request,
-    player_id: Optional[str] = Query(default=None, description="Filtrar por jugador"),
-    status: Optional[str] = Query(
-        default=None, description="Filtrar por estado (in_progress, completed, abandoned)"
-    ),
-    days: Optional[int] = Query(default=None, ge=1, le=365, description="Filtrar últimos N días"),
-    since: Optional[str] = Query(default=None, description="Filtrar desde fecha ISO"),
-    until: Optional[str] = Query(default=None, description="Filtrar hasta fecha ISO"),
-    service: GameService = Depends(get_game_service),
-):
-    """Cuenta partidas de forma eficiente usando Firestore aggregation.
-
-    Este endpoint usa count aggregation de Firestore en lugar de traer
-    todos los documentos, lo que lo hace mucho más eficiente y económico.
-
-    REQUIERE API KEY (admin only).
-
-    Examples:
-        GET /games/count                    → Total de partidas
-        GET /games/count?days=30            → Partidas de últimos 30 días
-        GET /games/count?player_id=abc      → Partidas de un jugador
-        GET /games/count?status=completed   → Partidas completadas
-
-    Args:
-        request (Request): Request de FastAPI.
-        player_id (str, optional): Filtrar por jugador.
-        status (str, optional): Filtrar por estado.
-        days (int, optional): Filtrar últimos N días.
-        since (str, optional): Filtrar desde fecha ISO 8601.
-        until (str, optional): Filtrar hasta fecha ISO 8601.
-        service (GameService): Servicio inyectado.
-
-    Returns:
-        JSON: {"count": int, "filters": dict}
-
-    Raises:
-        HTTPException: Si no eres admin (403) o formato de fecha inválido (400).
-    """
-    # Solo admin puede contar partidas globales
-    if not getattr(request.state, "is_admin", False):
-        raise HTTPException(status_code=403, detail="Requiere permisos de administrador")
-
-    # Parsear fechas si se especificaron
-    since_date = None
-    until_date = None
-
-    if since:
-        try:
-            since_date = datetime.fromisoformat(since.replace("Z", "+00:00"))
-        except ValueError:
-            raise HTTPException(status_code=400, detail="Formato de fecha 'since' inválido")
-
-    if until:
-        try:
-            until_date = datetime.fromisoformat(until.replace("Z", "+00:00"))
-        except ValueError:
-            raise HTTPException(status_code=400, detail="Formato de fecha 'until' inválido")
-
-    # Contar partidas con filtros
-    count = service.count_games(
-        player_id=player_id,
-        status=status,
-        days=days,
-        since=since_date,
-        until=until_date,
-    )
-
-    # Retornar count con información de filtros aplicados
-    return {
-        "count": count,
-        "filters": {
-            "player_id": player_id,
-            "status": status,
-            "days": days,
-            "since": since,
-            "until": until,
-        },
-    }
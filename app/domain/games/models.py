@@ -5,11 +5,12 @@ Estas son las entidades de negocio que representan partidas del juego.
 Autor: Mandrágora
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Dict, List, Optional
 from uuid import uuid4
 
 from pydantic import BaseModel, Field
+from typing_extensions import TypedDict
 
 
 class GameChoices(BaseModel):
@@ -75,7 +76,7 @@ class Game(BaseModel):
     player_id: str  # FK al jugador
 
     # Timestamps
-    started_at: datetime = Field(default_factory=datetime.utcnow)
+    started_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     ended_at: Optional[datetime] = None
 
     # Estado
@@ -101,24 +102,70 @@ class Game(BaseModel):
     def to_dict(self) -> dict:
         """Convierte el Game a diccionario para guardar en Firestore.
 
+        Se construye campo a campo en lugar de con model_dump(): los valores ya
+        están validados y Firestore los serializa tal cual (datetime incluidos).
+        Las listas y diccionarios se copian, igual que en model_dump(), para que
+        modificar el resultado no cambie la partida.
+
         Returns:
             dict: Representación de la partida para la BD.
         """
-        data = self.model_dump()
-        # Los datetime se guardan tal cual
-        data["started_at"] = self.started_at
-        if self.ended_at:
-            data["ended_at"] = self.ended_at
-        return data
+        metrics = self.metrics
+        return {
+            "game_id": self.game_id,
+            "player_id": self.player_id,
+            "started_at": self.started_at,
+            "ended_at": self.ended_at,
+            "status": self.status,
+            "completion_percentage": self.completion_percentage,
+            "total_time_seconds": self.total_time_seconds,
+            "levels_completed": list(self.levels_completed),
+            "current_level": self.current_level,
+            "choices": dict(self.choices.__dict__),
+            "relics": list(self.relics),
+            "boss_defeated": self.boss_defeated,
+            "npcs_helped": list(self.npcs_helped),
+            "metrics": {
+                "total_deaths": metrics.total_deaths,
+                "time_per_level": dict(metrics.time_per_level),
+                "deaths_per_level": dict(metrics.deaths_per_level),
+                "level_start_times": dict(metrics.level_start_times),
+            },
+        }
 
     @classmethod
     def from_dict(cls, data: dict) -> "Game":
         """Crea un Game desde un diccionario de Firestore.
 
+        model_validate recibe el dict tal cual (sin desempaquetarlo en kwargs).
+        Se mantiene la validación: con pydantic-core es más rápida que
+        model_construct, que rellena los campos en Python.
+
         Args:
             data (dict): Diccionario con los datos de la partida.
 
         Returns:
             Game: Instancia de la partida.
         """
-        return cls(**data)
+        return cls.model_validate(data)
+
+
+class GameSummary(TypedDict):
+    """Resumen ligero de una partida para listados.
+
+    Se construye directamente desde el documento de Firestore, sin pasar
+    por Game.from_dict ni por la validación de Pydantic.
+
+    Attributes:
+        game_id (str): ID de la partida.
+        player_id (str): ID del jugador.
+        status (str): Estado de la partida.
+        completion_percentage (float): Porcentaje completado (0-100).
+        started_at (datetime): Fecha de inicio.
+    """
+
+    game_id: str
+    player_id: str
+    status: str
+    completion_percentage: float
+    started_at: datetime
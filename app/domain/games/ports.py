@@ -7,9 +7,9 @@ Autor: Mandrágora
 
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple
 
-from .models import Game
+from .models import Game, GameSummary
 from .schemas import GameCreate, GameUpdate, LevelComplete, LevelStart
 
 
@@ -32,6 +32,21 @@ class IGameRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def create_replacing_active(self, game_data: GameCreate) -> Tuple[Game, Optional[Game]]:
+        """Crea una partida cerrando antes como "abandoned" la partida en curso del jugador.
+
+        El cierre y la creación se hacen de forma atómica.
+
+        Args:
+            game_data (GameCreate): Datos de la partida a crear.
+
+        Returns:
+            Tuple[Game, Optional[Game]]: Partida creada y partida cerrada (None si
+                el jugador no tenía ninguna en curso).
+        """
+        pass
+
     @abstractmethod
     def get_by_id(self, game_id: str) -> Optional[Game]:
         """Busca una partida por su ID.
@@ -45,52 +60,114 @@ class IGameRepository(ABC):
         pass
 
     @abstractmethod
-    def get_by_player(
+    def get_owner(self, game_id: str) -> Optional[str]:
+        """Obtiene solo el jugador dueño de una partida.
+
+        Args:
+            game_id (str): ID de la partida.
+
+        Returns:
+            Optional[str]: player_id del dueño si la partida existe, None si no.
+        """
+        pass
+
+    @abstractmethod
+    def stream_by_player(self, player_id: str, limit: int = 100) -> Iterator[Game]:
+        """Recorre las partidas de un jugador de una en una, de la más reciente a la más antigua.
+
+        Para quien busca la primera partida que cumple una condición: al dejar
+        de iterar no se descargan ni se construyen las partidas restantes.
+
+        Args:
+            player_id (str): ID del jugador.
+            limit (int): Máximo número de partidas a recorrer.
+
+        Yields:
+            Game: Partidas del jugador ordenadas por fecha de inicio descendente.
+        """
+        pass
+
+    @abstractmethod
+    def get_by_player_page(
         self,
         player_id: str,
         limit: int = 100,
+        cursor: Optional[dict] = None,
         days: Optional[int] = None,
         since: Optional[datetime] = None,
         until: Optional[datetime] = None,
-    ) -> List[Game]:
-        """Obtiene todas las partidas de un jugador con filtros opcionales.
+    ) -> Tuple[List[Game], Optional[dict]]:
+        """Obtiene una página de partidas de un jugador con paginación por cursor.
 
         Args:
             player_id (str): ID del jugador.
-            limit (int): Máximo número de partidas a retornar.
+            limit (int): Tamaño de página.
+            cursor (Optional[dict]): Cursor devuelto por la página anterior.
             days (Optional[int]): Si se especifica, solo partidas de últimos N días.
             since (Optional[datetime]): Si se especifica, solo partidas después de esta fecha.
             until (Optional[datetime]): Si se especifica, solo partidas antes de esta fecha.
 
         Returns:
-            List[Game]: Lista de partidas del jugador filtradas.
+            Tuple[List[Game], Optional[dict]]: Partidas y cursor de la siguiente página.
+        """
+        pass
+
+    @abstractmethod
+    def get_by_player_summary(self, player_id: str, limit: int = 100) -> List[GameSummary]:
+        """Obtiene un resumen ligero de las partidas de un jugador.
+
+        Args:
+            player_id (str): ID del jugador.
+            limit (int): Máximo número de partidas a retornar.
+
+        Returns:
+            List[GameSummary]: Resúmenes ordenados por fecha de inicio descendente.
         """
         pass
 
     @abstractmethod
-    def get_all(
+    def get_all_page(
         self,
         limit: int = 200,
+        cursor: Optional[dict] = None,
         days: Optional[int] = None,
         since: Optional[datetime] = None,
         until: Optional[datetime] = None,
-    ) -> List[Game]:
-        """Obtiene todas las partidas de todos los jugadores con filtros opcionales (admin only).
+    ) -> Tuple[List[Game], Optional[dict]]:
+        """Obtiene una página de partidas con paginación por cursor (admin only).
+
+        Args:
+            limit (int): Tamaño de página.
+            cursor (Optional[dict]): Cursor devuelto por la página anterior.
+            days (Optional[int]): Si se especifica, solo partidas de últimos N días.
+            since (Optional[datetime]): Si se especifica, solo partidas después de esta fecha.
+            until (Optional[datetime]): Si se especifica, solo partidas antes de esta fecha.
 
-        Este método está diseñado para uso exclusivo de administradores
-        y herramientas de análisis. No debe ser expuesto a jugadores normales.
+        Returns:
+            Tuple[List[Game], Optional[dict]]: Partidas y cursor de la siguiente página.
+        """
+        pass
 
-        OPTIMIZACIÓN: Usar filtros de fecha reduce significativamente los costos.
-        Límite por defecto reducido de 1000 → 200 para mejor rendimiento.
+    @abstractmethod
+    def get_all_summary_page(
+        self,
+        limit: int = 200,
+        cursor: Optional[dict] = None,
+        days: Optional[int] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> Tuple[List[GameSummary], Optional[dict]]:
+        """Obtiene una página de resúmenes ligeros de todas las partidas (admin only).
 
         Args:
-            limit (int): Máximo número de partidas a retornar (default: 200).
+            limit (int): Tamaño de página.
+            cursor (Optional[dict]): Cursor devuelto por la página anterior.
             days (Optional[int]): Si se especifica, solo partidas de últimos N días.
             since (Optional[datetime]): Si se especifica, solo partidas después de esta fecha.
             until (Optional[datetime]): Si se especifica, solo partidas antes de esta fecha.
 
         Returns:
-            List[Game]: Lista de todas las partidas ordenadas por fecha de inicio (desc).
+            Tuple[List[GameSummary], Optional[dict]]: Resúmenes y cursor de la siguiente página.
         """
         pass
 
@@ -110,35 +187,79 @@ class IGameRepository(ABC):
         pass
 
     @abstractmethod
-    def update(self, game_id: str, game_update: GameUpdate) -> Optional[Game]:
+    def update(
+        self, game_id: str, game_update: GameUpdate, owner_id: Optional[str] = None
+    ) -> Optional[Game]:
         """Actualiza una partida existente.
 
         Args:
             game_id (str): ID de la partida.
             game_update (GameUpdate): Campos a actualizar.
+            owner_id (Optional[str]): Si se indica, la partida debe ser de este jugador
+                (comprobado junto con la escritura).
 
         Returns:
             Optional[Game]: Game actualizado si existe, None si no.
+
+        Raises:
+            AuthorizationException: Si la partida es de otro jugador.
         """
         pass
 
     @abstractmethod
-    def start_level(self, game_id: str, level_data: LevelStart) -> Optional[Game]:
+    def update_with_previous_status(
+        self, game_id: str, game_update: GameUpdate, owner_id: Optional[str] = None
+    ) -> Tuple[Optional[Game], Optional[str]]:
+        """Actualiza una partida y devuelve también el estado que tenía antes.
+
+        El estado anterior se lee de forma atómica con la escritura.
+
+        Args:
+            game_id (str): ID de la partida.
+            game_update (GameUpdate): Campos a actualizar.
+            owner_id (Optional[str]): Si se indica, la partida debe ser de este jugador
+                (comprobado junto con la escritura).
+
+        Returns:
+            Tuple[Optional[Game], Optional[str]]: Game actualizado (None si no existe)
+                y su estado antes de la escritura.
+
+        Raises:
+            AuthorizationException: Si la partida es de otro jugador.
+        """
+        pass
+
+    @abstractmethod
+    def start_level(
+        self, game_id: str, level_data: LevelStart, owner_id: Optional[str] = None
+    ) -> Optional[Game]:
         """Registra el inicio de un nivel.
 
-        Actualiza el campo current_level.
+        Actualiza el campo current_level. La partida debe estar activa.
 
         Args:
             game_id (str): ID de la partida.
             level_data (LevelStart): Datos del nivel iniciado.
+            owner_id (Optional[str]): Si se indica, la partida debe ser de este jugador
+                (comprobado junto con la escritura).
 
         Returns:
             Optional[Game]: Game actualizado si existe, None si no.
+
+        Raises:
+            AuthorizationException: Si la partida es de otro jugador.
+            ValueError: Si la partida no está activa.
         """
         pass
 
     @abstractmethod
-    def complete_level(self, game_id: str, level_data: LevelComplete) -> Optional[Game]:
+    def complete_level(
+        self,
+        game_id: str,
+        level_data: LevelComplete,
+        extra_update: Optional[GameUpdate] = None,
+        owner_id: Optional[str] = None,
+    ) -> Optional[Game]:
         """Registra la completación de un nivel.
 
         Actualiza:
@@ -147,13 +268,23 @@ class IGameRepository(ABC):
         - choices (decisión moral si aplica)
         - relics (reliquia obtenida si aplica)
         - completion_percentage
+        - los campos de extra_update, en la misma escritura
+
+        El dueño y que la partida esté activa se comprueban de forma atómica
+        con la escritura.
 
         Args:
             game_id (str): ID de la partida.
             level_data (LevelComplete): Datos del nivel completado.
+            extra_update (Optional[GameUpdate]): Campos adicionales a escribir junto al nivel.
+            owner_id (Optional[str]): Si se indica, la partida debe ser de este jugador.
 
         Returns:
             Optional[Game]: Game actualizado si existe, None si no.
+
+        Raises:
+            AuthorizationException: Si la partida es de otro jugador.
+            ValueError: Si la partida no está activa.
         """
         pass
 
@@ -8,10 +8,51 @@ Autor: Mandrágora
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, ValidationInfo, field_validator
 
 from app.core.exceptions import ValidationException
-from app.core.validators import validate_choice, validate_level_name, validate_relic
+from app.core.validators import (
+    VALID_LEVELS,
+    validate_choice,
+    validate_level_name,
+    validate_relic,
+)
+
+# Estados válidos de una partida (frozenset para la comprobación, texto para el error)
+_VALID_STATUSES = frozenset(("in_progress", "completed", "abandoned"))
+_VALID_STATUSES_STR = "in_progress, completed, abandoned"
+
+# Niveles válidos: el caso normal (nivel correcto) se resuelve con una búsqueda
+# en el set, sin pasar por el validador del core
+_LEVELS = frozenset(VALID_LEVELS)
+
+
+def _as_value_error(check):
+    """Adapta un validador de app.core.validators para usarlo en un field_validator.
+
+    Los validadores del core lanzan ValidationException; Pydantic espera ValueError.
+
+    Args:
+        check (Callable[..., None]): Validador que lanza ValidationException. El valor
+            a validar es su último argumento (ej. validate_choice(level, choice)).
+
+    Returns:
+        Callable[..., str]: Función que valida y devuelve el valor (último argumento).
+    """
+
+    def wrapper(*args: str) -> str:
+        try:
+            check(*args)
+        except ValidationException as e:
+            raise ValueError(str(e)) from None
+        return args[-1]
+
+    return wrapper
+
+
+_check_level = _as_value_error(validate_level_name)
+_check_relic = _as_value_error(validate_relic)
+_check_choice = _as_value_error(validate_choice)
 
 
 class GameCreate(BaseModel):
@@ -54,11 +95,8 @@ class GameUpdate(BaseModel):
     @classmethod
     def validate_status(cls, v: Optional[str]) -> Optional[str]:
         """Valida que el status sea uno de los válidos."""
-        if v is None:
-            return v
-        valid_statuses = ["in_progress", "completed", "abandoned"]
-        if v not in valid_statuses:
-            raise ValueError(f"Status '{v}' no válido. Válidos: {', '.join(valid_statuses)}")
+        if v is not None and v not in _VALID_STATUSES:
+            raise ValueError(f"Status '{v}' no válido. Válidos: {_VALID_STATUSES_STR}")
         return v
 
     @field_validator("completion_percentage")
@@ -85,15 +123,11 @@ class GameUpdate(BaseModel):
     @classmethod
     def validate_current_level(cls, v: Optional[str]) -> Optional[str]:
         """Valida que el nivel actual sea válido."""
-        if v is None:
-            return v
-        try:
-            validate_level_name(v)
-        except ValidationException as e:
-            raise ValueError(str(e))
-        return v
+        return v if v is None or v in _LEVELS else _check_level(v)
 
     class Config:
+        # Inmutable: una misma instancia se puede reutilizar entre llamadas
+        frozen = True
         json_schema_extra = {
             "example": {
                 "status": "completed",
@@ -118,11 +152,7 @@ class LevelStart(BaseModel):
     @classmethod
     def validate_level(cls, v: str) -> str:
         """Valida que el nivel sea uno de los 5 niveles válidos."""
-        try:
-            validate_level_name(v)
-        except ValidationException as e:
-            raise ValueError(str(e))
-        return v
+        return v if v in _LEVELS else _check_level(v)
 
     class Config:
         json_schema_extra = {"example": {"level": "senda_ebano"}}
@@ -151,11 +181,7 @@ class LevelComplete(BaseModel):
     @classmethod
     def validate_level(cls, v: str) -> str:
         """Valida que el nivel sea uno de los 5 niveles válidos."""
-        try:
-            validate_level_name(v)
-        except ValidationException as e:
-            raise ValueError(str(e))
-        return v
+        return v if v in _LEVELS else _check_level(v)
 
     @field_validator("time_seconds")
     @classmethod
@@ -183,30 +209,19 @@ class LevelComplete(BaseModel):
 
     @field_validator("choice")
     @classmethod
-    def validate_choice_value(cls, v: Optional[str], info) -> Optional[str]:
-        """Valida que la decisión moral sea válida para el nivel."""
-        if v is None:
-            return v
-        # Obtener el nivel del contexto de validación
+    def validate_choice_value(cls, v: Optional[str], info: ValidationInfo) -> Optional[str]:
+        """Valida que la decisión moral sea válida para el nivel.
+
+        Si level no pasó su validación no está en info.data y no se comprueba.
+        """
         level = info.data.get("level")
-        if level:
-            try:
-                validate_choice(level, v)
-            except ValidationException as e:
-                raise ValueError(str(e))
-        return v
+        return v if v is None or level is None else _check_choice(level, v)
 
     @field_validator("relic")
     @classmethod
     def validate_relic_value(cls, v: Optional[str]) -> Optional[str]:
         """Valida que la reliquia sea una de las 3 válidas."""
-        if v is None:
-            return v
-        try:
-            validate_relic(v)
-        except ValidationException as e:
-            raise ValueError(str(e))
-        return v
+        return v if v is None else _check_relic(v)
 
     class Config:
         json_schema_extra = {
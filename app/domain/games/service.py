@@ -7,16 +7,23 @@ Autor: Mandrágora
 """
 
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
+from app.core.exceptions import AuthorizationException, NotFoundException
 from app.core.logger import logger
 
 from ..players.ports import IPlayerRepository
 from ..players.service import PlayerService
-from .models import Game
+from .models import Game, GameSummary
 from .ports import IGameRepository
 from .schemas import GameCreate, GameUpdate, LevelComplete, LevelStart
 
+# GameUpdate es inmutable, así que la actualización del jefe se construye una sola vez
+_BOSS_DEFEATED_UPDATE = GameUpdate(boss_defeated=True)
+
+# Estados que cierran una partida (y disparan la actualización de stats)
+_FINISHED_STATUSES = frozenset(("completed", "abandoned"))
+
 
 class GameService:
     """Servicio de lógica de negocio para partidas.
@@ -58,27 +65,23 @@ class GameService:
             Game: Partida creada.
 
         Raises:
-            ValueError: Si el jugador no existe.
+            NotFoundException: Si el jugador no existe.
         """
-        # Verificar que el jugador existe
-        player = self.player_repository.get_by_id(game_data.player_id)
-        if not player:
-            raise ValueError("Jugador no encontrado")
-
-        # Si tiene partida activa, cerrarla automáticamente
-        active_game = self.game_repository.get_active_game(game_data.player_id)
-        if active_game:
-            close_update = GameUpdate(status="abandoned", ended_at=datetime.now(timezone.utc))
-            closed_game = self.game_repository.update(active_game.game_id, close_update)
+        # Verificar que el jugador existe (sin descargar el jugador completo)
+        if not self.player_repository.exists(game_data.player_id):
+            raise NotFoundException("Jugador", game_data.player_id)
+
+        # Crear la partida; si tenía otra activa, el repositorio la cierra en la misma transacción
+        game, closed_game = self.game_repository.create_replacing_active(game_data)
+
+        if closed_game:
             # Actualizar stats del jugador con la partida abandonada
-            if closed_game:
-                self.player_service.update_player_stats_after_game(game_data.player_id, closed_game)
+            self.player_service.update_player_stats_after_game(game_data.player_id, closed_game)
             logger.warning(
-                f"Partida anterior {active_game.game_id} cerrada automáticamente como 'abandoned'"
+                "Partida anterior %s cerrada automáticamente como 'abandoned'", closed_game.game_id
             )
 
-        # Crear y retornar la nueva partida
-        return self.game_repository.create(game_data)
+        return game
 
     def get_game(self, game_id: str) -> Optional[Game]:
         """Obtiene una partida por ID.
@@ -91,86 +94,152 @@ class GameService:
         """
         return self.game_repository.get_by_id(game_id)
 
-    def get_player_games(
+    def get_player_games_page(
         self,
         player_id: str,
         limit: int = 100,
+        cursor: Optional[dict] = None,
         days: Optional[int] = None,
         since: Optional[datetime] = None,
         until: Optional[datetime] = None,
-    ) -> List[Game]:
-        """Obtiene todas las partidas de un jugador con filtros opcionales.
+    ) -> Tuple[List[Game], Optional[dict]]:
+        """Obtiene una página de partidas de un jugador con filtros opcionales.
 
         Args:
             player_id (str): ID del jugador.
-            limit (int): Máximo número de partidas a retornar.
+            limit (int): Tamaño de página.
+            cursor (Optional[dict]): Cursor devuelto por la página anterior.
             days (Optional[int]): Si se especifica, solo partidas de últimos N días.
             since (Optional[datetime]): Si se especifica, solo partidas después de esta fecha.
             until (Optional[datetime]): Si se especifica, solo partidas antes de esta fecha.
 
         Returns:
-            List[Game]: Lista de partidas filtradas.
+            Tuple[List[Game], Optional[dict]]: Partidas y cursor de la siguiente página.
         """
-        return self.game_repository.get_by_player(
-            player_id, limit=limit, days=days, since=since, until=until
+        return self.game_repository.get_by_player_page(
+            player_id, limit=limit, cursor=cursor, days=days, since=since, until=until
         )
 
-    def get_all_games(
+    def get_player_games_summary(self, player_id: str, limit: int = 100) -> List[GameSummary]:
+        """Obtiene un resumen ligero de las partidas de un jugador.
+
+        Args:
+            player_id (str): ID del jugador.
+            limit (int): Máximo número de partidas a retornar.
+
+        Returns:
+            List[GameSummary]: Resúmenes de las partidas.
+        """
+        return self.game_repository.get_by_player_summary(player_id, limit=limit)
+
+    def get_all_games_page(
         self,
         limit: int = 200,
+        cursor: Optional[dict] = None,
         days: Optional[int] = None,
         since: Optional[datetime] = None,
         until: Optional[datetime] = None,
-    ) -> List[Game]:
-        """Obtiene todas las partidas de todos los jugadores con filtros opcionales.
+    ) -> Tuple[List[Game], Optional[dict]]:
+        """Obtiene una página de partidas de todos los jugadores.
 
         ADMIN ONLY: Este método no debe ser expuesto a jugadores normales.
-        OPTIMIZACIÓN: Límite reducido de 1000 → 200. Usa filtros de fecha para mejor rendimiento.
 
         Args:
-            limit (int): Máximo número de partidas a retornar (default: 200).
+            limit (int): Tamaño de página.
+            cursor (Optional[dict]): Cursor devuelto por la página anterior.
             days (Optional[int]): Si se especifica, solo partidas de últimos N días.
             since (Optional[datetime]): Si se especifica, solo partidas después de esta fecha.
             until (Optional[datetime]): Si se especifica, solo partidas antes de esta fecha.
 
         Returns:
-            List[Game]: Lista de todas las partidas filtradas.
+            Tuple[List[Game], Optional[dict]]: Partidas y cursor de la siguiente página.
         """
-        return self.game_repository.get_all(limit=limit, days=days, since=since, until=until)
+        return self.game_repository.get_all_page(
+            limit=limit, cursor=cursor, days=days, since=since, until=until
+        )
+
+    def get_all_games_summary_page(
+        self,
+        limit: int = 200,
+        cursor: Optional[dict] = None,
+        days: Optional[int] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> Tuple[List[GameSummary], Optional[dict]]:
+        """Obtiene una página de resúmenes ligeros de todas las partidas.
+
+        ADMIN ONLY: Igual que get_all_games_page pero sin descargar las partidas completas.
+
+        Args:
+            limit (int): Tamaño de página (default: 200).
+            cursor (Optional[dict]): Cursor devuelto por la página anterior.
+            days (Optional[int]): Si se especifica, solo partidas de últimos N días.
+            since (Optional[datetime]): Si se especifica, solo partidas después de esta fecha.
+            until (Optional[datetime]): Si se especifica, solo partidas antes de esta fecha.
 
-    def update_game(self, game_id: str, game_update: GameUpdate) -> Optional[Game]:
+        Returns:
+            Tuple[List[GameSummary], Optional[dict]]: Resúmenes y cursor de la siguiente página.
+        """
+        return self.game_repository.get_all_summary_page(
+            limit=limit, cursor=cursor, days=days, since=since, until=until
+        )
+
+    def update_game(
+        self, game_id: str, game_update: GameUpdate, owner_id: Optional[str] = None
+    ) -> Optional[Game]:
         """Actualiza una partida.
 
         Regla de negocio:
-        - Si la partida se completa o abandona, actualiza stats del jugador.
+        - Si la partida se completa o abandona, actualiza stats del jugador
+          (solo si no estaba ya en ese estado, para no contarla dos veces).
 
         Args:
             game_id (str): ID de la partida.
             game_update (GameUpdate): Campos a actualizar.
+            owner_id (Optional[str]): Si se indica, la partida debe ser de este jugador.
 
         Returns:
             Optional[Game]: Game actualizado si existe, None si no.
+
+        Raises:
+            AuthorizationException: Si la partida es de otro jugador.
         """
-        game = self.game_repository.get_by_id(game_id)
-        if not game:
+        # Actualizar la partida. El repositorio comprueba el dueño y lee el estado
+        # anterior en la misma transacción que la escritura
+        updated_game, previous_status = self.game_repository.update_with_previous_status(
+            game_id, game_update, owner_id=owner_id
+        )
+        if not updated_game:
             return None
 
-        # Actualizar la partida
-        updated_game = self.game_repository.update(game_id, game_update)
+        finishing = game_update.status in _FINISHED_STATUSES
+
+        # Reintento: la partida ya estaba en ese estado y sus stats ya se contaron
+        if finishing and previous_status == game_update.status:
+            logger.info(
+                "Partida %s... ya estaba en estado %s, no se recalculan stats",
+                game_id[:8],
+                game_update.status,
+            )
+            return updated_game
 
         # Si la partida terminó, actualizar stats del jugador
-        if game_update.status in ["completed", "abandoned"]:
+        if finishing:
             logger.warning(
-                f"⚠️  update_game() está finalizando partida {game_id[:8]}... | "
-                f"Status: {game_update.status} | "
-                f"⚠️  RECOMENDACIÓN: Usar finish_game() en lugar de update_game() "
-                f"para finalizar partidas y evitar duplicación de stats."
+                "⚠️  update_game() está finalizando partida %s... | "
+                "Status: %s | "
+                "⚠️  RECOMENDACIÓN: Usar finish_game() en lugar de update_game() "
+                "para finalizar partidas y evitar duplicación de stats.",
+                game_id[:8],
+                game_update.status,
             )
-            self.player_service.update_player_stats_after_game(game.player_id, updated_game)
+            self.player_service.update_player_stats_after_game(updated_game.player_id, updated_game)
 
         return updated_game
 
-    def start_level(self, game_id: str, level_data: LevelStart) -> Optional[Game]:
+    def start_level(
+        self, game_id: str, level_data: LevelStart, owner_id: Optional[str] = None
+    ) -> Optional[Game]:
         """Inicia un nivel.
 
         Regla de negocio:
@@ -179,24 +248,21 @@ class GameService:
         Args:
             game_id (str): ID de la partida.
             level_data (LevelStart): Datos del nivel a iniciar.
+            owner_id (Optional[str]): Si se indica, la partida debe ser de este jugador.
 
         Returns:
             Optional[Game]: Game actualizado si existe, None si no.
 
         Raises:
+            AuthorizationException: Si la partida es de otro jugador.
             ValueError: Si la partida no está activa.
         """
-        game = self.game_repository.get_by_id(game_id)
-        if not game:
-            return None
-
-        # Verificar que está activa
-        if game.status != "in_progress":
-            raise ValueError("La partida no está activa")
-
-        return self.game_repository.start_level(game_id, level_data)
+        # Dueño y estado se comprueban en el repositorio, en la misma transacción que la escritura
+        return self.game_repository.start_level(game_id, level_data, owner_id=owner_id)
 
-    def complete_level(self, game_id: str, level_data: LevelComplete) -> Optional[Game]:
+    def complete_level(
+        self, game_id: str, level_data: LevelComplete, owner_id: Optional[str] = None
+    ) -> Optional[Game]:
         """Completa un nivel.
 
         Reglas de negocio:
@@ -206,43 +272,49 @@ class GameService:
         Args:
             game_id (str): ID de la partida.
             level_data (LevelComplete): Datos del nivel completado.
+            owner_id (Optional[str]): Si se indica, la partida debe ser de este jugador.
 
         Returns:
             Optional[Game]: Game actualizado si existe, None si no.
 
         Raises:
+            AuthorizationException: Si la partida es de otro jugador.
             ValueError: Si la partida no está activa.
         """
-        game = self.game_repository.get_by_id(game_id)
-        if not game:
-            return None
-
-        # Verificar que está activa
-        if game.status != "in_progress":
-            raise ValueError("La partida no está activa")
-
-        # Completar el nivel
-        updated_game = self.game_repository.complete_level(game_id, level_data)
+        # Si completa el nivel final (boss), boss_defeated va en la misma escritura
+        extra_update = _BOSS_DEFEATED_UPDATE if level_data.level == "claro_almas" else None
 
-        # Si completó el nivel final (boss), marcarlo
-        if level_data.level == "claro_almas":
-            boss_update = GameUpdate(boss_defeated=True)
-            updated_game = self.game_repository.update(game_id, boss_update)
-
-        return updated_game
+        # El repositorio comprueba dueño y estado dentro de su transacción,
+        # así que no hace falta leer la partida antes
+        return self.game_repository.complete_level(
+            game_id, level_data, extra_update, owner_id=owner_id
+        )
 
-    def delete_game(self, game_id: str) -> bool:
+    def delete_game(self, game_id: str, owner_id: Optional[str] = None) -> bool:
         """Elimina una partida.
 
         Args:
             game_id (str): ID de la partida.
+            owner_id (Optional[str]): Si se indica, la partida debe ser de este jugador.
 
         Returns:
             bool: True si se eliminó, False si no existía.
+
+        Raises:
+            AuthorizationException: Si la partida es de otro jugador.
         """
+        # Sin dueño que comprobar (admin) se borra directamente, sin leer la partida
+        if owner_id is not None:
+            game_owner = self.game_repository.get_owner(game_id)
+            if game_owner is None:
+                return False
+            if game_owner != owner_id:
+                raise AuthorizationException("No tienes permisos para acceder a esta partida")
         return self.game_repository.delete(game_id)
 
-    def finish_game(self, game_id: str, completed: bool = True) -> Optional[Game]:
+    def finish_game(
+        self, game_id: str, completed: bool = True, owner_id: Optional[str] = None
+    ) -> Optional[Game]:
         """Finaliza una partida.
 
         Marca la partida como completed o abandoned y actualiza stats del jugador.
@@ -250,44 +322,52 @@ class GameService:
         Args:
             game_id (str): ID de la partida.
             completed (bool): True si completó, False si abandonó.
+            owner_id (Optional[str]): Si se indica, la partida debe ser de este jugador.
 
         Returns:
             Optional[Game]: Game actualizado si existe, None si no.
-        """
-        game = self.game_repository.get_by_id(game_id)
-        if not game:
-            return None
 
+        Raises:
+            AuthorizationException: Si la partida es de otro jugador.
+        """
         # Preparar actualización
         status = "completed" if completed else "abandoned"
         update_data = GameUpdate(status=status, ended_at=datetime.now(timezone.utc))
 
         # Actualizar partida en la BD
-        updated_game = self.game_repository.update(game_id, update_data)
+        updated_game = self.game_repository.update(game_id, update_data, owner_id=owner_id)
 
-        # IMPORTANTE: updated_game contiene TODOS los datos frescos de Firestore
+        # IMPORTANTE: updated_game contiene TODOS los datos de la partida
         # (total_time_seconds, decisiones, reliquias, métricas, etc.)
-        # porque repository.update() hace get_by_id() después de actualizar.
+        # porque repository.update() la devuelve completa tras actualizar.
         # Usar este objeto completo para calcular stats del jugador.
         if updated_game:
             logger.info(
-                f"🏁 Finalizando partida: {game_id[:8]}... | "
-                f"Status: {updated_game.status} | "
-                f"Tiempo total: {updated_game.total_time_seconds}s ({updated_game.total_time_seconds/60:.1f} min) | "
-                f"Decisiones: {updated_game.choices.model_dump(exclude_none=True)} | "
-                f"Reliquias: {updated_game.relics} | "
-                f"Muertes: {updated_game.metrics.total_deaths}"
+                "🏁 Finalizando partida: %s... | "
+                "Status: %s | "
+                "Tiempo total: %ss (%.1f min) | "
+                "Decisiones: %s | "
+                "Reliquias: %s | "
+                "Muertes: %s",
+                game_id[:8],
+                updated_game.status,
+                updated_game.total_time_seconds,
+                updated_game.total_time_seconds / 60,
+                updated_game.choices.model_dump(exclude_none=True),
+                updated_game.relics,
+                updated_game.metrics.total_deaths,
             )
 
             # ADVERTENCIA: Si el tiempo es 0, probablemente finish_game se llamó antes de complete_level
             if updated_game.total_time_seconds == 0:
                 logger.error(
-                    f"❌ ERROR: Partida {game_id[:8]}... tiene total_time_seconds=0! "
-                    f"Esto indica que finish_game se llamó ANTES de que se completaran los niveles. "
-                    f"Unity debe llamar complete_level para TODOS los niveles ANTES de llamar finish_game."
+                    "❌ ERROR: Partida %s... tiene total_time_seconds=0! "
+                    "Esto indica que finish_game se llamó ANTES de que se completaran los niveles. "
+                    "Unity debe llamar complete_level para TODOS los niveles ANTES de llamar finish_game.",
+                    game_id[:8],
                 )
 
-            self.player_service.update_player_stats_after_game(game.player_id, updated_game)
+            self.player_service.update_player_stats_after_game(updated_game.player_id, updated_game)
 
         return updated_game
 
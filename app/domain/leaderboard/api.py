@@ -11,8 +11,11 @@ Autor: Mandrágora
 """
 
 from datetime import datetime, timezone
+from functools import lru_cache
 
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException
+
+from app.middleware.auth import require_admin
 
 from .models import LeaderboardType
 from .repository import LeaderboardRepository
@@ -27,29 +30,31 @@ admin_router = APIRouter(prefix="/v1/admin/leaderboard", tags=["Admin - Leaderbo
 
 
 # ==================== DEPENDENCY INJECTION ====================
+# Repositorios y servicios no guardan estado por request: se construyen una vez
+# por proceso (lru_cache) y FastAPI reutiliza las mismas instancias.
 
 
+@lru_cache(maxsize=1)
 def get_leaderboard_repository() -> LeaderboardRepository:
     """Dependency que provee el repositorio de Leaderboard.
 
     Returns:
-        LeaderboardRepository: Repositorio instanciado.
+        LeaderboardRepository: Repositorio compartido.
     """
     return LeaderboardRepository()
 
 
-def get_leaderboard_service(
-    repository: LeaderboardRepository = Depends(get_leaderboard_repository),
-) -> LeaderboardService:
+@lru_cache(maxsize=1)
+def get_leaderboard_service() -> LeaderboardService:
     """Dependency que provee el servicio de Leaderboard.
 
-    Args:
-        repository (LeaderboardRepository): Repositorio inyectado.
+    Obtiene el repositorio del provider cacheado en lugar de con Depends:
+    FastAPI resuelve una sola función por request.
 
     Returns:
-        LeaderboardService: Servicio instanciado.
+        LeaderboardService: Servicio compartido.
     """
-    return LeaderboardService(repository=repository)
+    return LeaderboardService(repository=get_leaderboard_repository())
 
 
 # ==================== ENDPOINTS PUBLICOS ====================
@@ -124,9 +129,10 @@ def get_leaderboard(
 # ==================== ENDPOINTS ADMIN ====================
 
 
-@admin_router.post("/refresh", response_model=RefreshResponse)
+@admin_router.post(
+    "/refresh", response_model=RefreshResponse, dependencies=[Depends(require_admin)]
+)
 def refresh_leaderboards(
-    request: Request,
     service: LeaderboardService = Depends(get_leaderboard_service),
 ):
     """Forzar recálculo de todos los leaderboards.
@@ -139,7 +145,6 @@ def refresh_leaderboards(
     - Recuperación de errores del scheduler.
 
     Args:
-        request (Request): Request de FastAPI.
         service (LeaderboardService): Servicio inyectado.
 
     Returns:
@@ -148,14 +153,6 @@ def refresh_leaderboards(
     Raises:
         HTTPException: Si no es admin (403).
     """
-    is_admin = getattr(request.state, "is_admin", False)
-
-    if not is_admin:
-        raise HTTPException(
-            status_code=403,
-            detail="Este endpoint solo esta disponible para administradores",
-        )
-
     updated = service.refresh_all_leaderboards()
 
     return RefreshResponse(
@@ -5,8 +5,10 @@ Cada leaderboard es un documento con el ID igual a su tipo.
 Autor: Mandrágora
 """
 
+import threading
 from typing import List, Optional
 
+from cachetools import TTLCache
 from google.cloud.firestore_v1 import Client
 
 from app.core.logger import logger
@@ -25,6 +27,13 @@ class LeaderboardRepository:
 
     COLLECTION_NAME = "leaderboards"
 
+    # Caché de get_by_type compartida por todas las instancias del proceso.
+    # Los leaderboards solo cambian al recalcularse (cada 6 horas), así que
+    # GET /v1/leaderboard/{type} casi nunca necesita ir a Firestore. save() la
+    # actualiza; el TTL cubre los recálculos hechos por otros workers.
+    _cache: TTLCache = TTLCache(maxsize=len(LeaderboardType), ttl=180)
+    _cache_lock = threading.Lock()
+
     def __init__(self, db: Optional[Client] = None):
         """Inicializa el repositorio."""
         self.db = db or get_firestore_client()
@@ -39,13 +48,22 @@ class LeaderboardRepository:
         Returns:
             Optional[Leaderboard]: Leaderboard o None si no existe.
         """
+        with self._cache_lock:
+            cached = self._cache.get(leaderboard_type)
+        if cached is not None:
+            # Sin copia: nadie modifica los leaderboards leídos, cada recálculo crea uno nuevo
+            return cached
+
         doc_ref = self.collection.document(leaderboard_type.value)
         doc = doc_ref.get()
 
         if not doc.exists:
             return None
 
-        return Leaderboard.from_dict(doc.to_dict())
+        leaderboard = Leaderboard.from_dict(doc.to_dict())
+        with self._cache_lock:
+            self._cache[leaderboard_type] = leaderboard
+        return leaderboard
 
     def get_all(self) -> List[Leaderboard]:
         """Obtiene todos los leaderboards.
@@ -72,10 +90,13 @@ class LeaderboardRepository:
         """
         doc_ref = self.collection.document(leaderboard.leaderboard_id.value)
         doc_ref.set(leaderboard.to_dict())
+        with self._cache_lock:
+            self._cache[leaderboard.leaderboard_id] = leaderboard
 
         logger.info(
-            f"Leaderboard {leaderboard.leaderboard_id.value} actualizado "
-            f"con {len(leaderboard.entries)} entradas"
+            "Leaderboard %s actualizado con %s entradas",
+            leaderboard.leaderboard_id.value,
+            len(leaderboard.entries),
         )
         return leaderboard
 
@@ -88,4 +109,4 @@ class LeaderboardRepository:
             if not self.get_by_type(lb_type):
                 empty_lb = Leaderboard(leaderboard_id=lb_type, entries=[])
                 self.save(empty_lb)
-                logger.info(f"Leaderboard {lb_type.value} inicializado")
+                logger.info("Leaderboard %s inicializado", lb_type.value)
@@ -87,7 +87,7 @@ class LeaderboardService:
         players = self.player_repo.get_all(limit=1000)
         eligible_players = [p for p in players if p.games_completed > 0]
 
-        logger.info(f"Procesando {len(eligible_players)} jugadores con partidas completadas")
+        logger.info("Procesando %s jugadores con partidas completadas", len(eligible_players))
 
         # Calcular cada leaderboard
         self._refresh_speedrun(eligible_players)
@@ -102,7 +102,7 @@ class LeaderboardService:
         self._refresh_completions(eligible_players)
         updated.append("completions")
 
-        logger.info(f"Leaderboards actualizados: {updated}")
+        logger.info("Leaderboards actualizados: %s", updated)
         return updated
 
     def _refresh_speedrun(self, players) -> None:
@@ -118,8 +118,9 @@ class LeaderboardService:
 
         entries = []
         for rank, player in enumerate(speedrun_players[: self.MAX_ENTRIES], 1):
-            # Buscar la partida donde logro este tiempo
-            games = self.game_repo.get_by_player(player.player_id)
+            # Buscar la partida donde logro este tiempo (en streaming: next() deja
+            # de leer partidas en cuanto la encuentra)
+            games = self.game_repo.stream_by_player(player.player_id)
             best_game = next(
                 (
                     g
@@ -163,7 +164,7 @@ class LeaderboardService:
         entries = []
         for rank, player in enumerate(sorted_players[: self.MAX_ENTRIES], 1):
             # Buscar ultima partida completada
-            games = self.game_repo.get_by_player(player.player_id)
+            games = self.game_repo.stream_by_player(player.player_id)
             last_completed = next((g for g in games if g.status == "completed"), None)
 
             entries.append(
@@ -198,7 +199,7 @@ class LeaderboardService:
         entries = []
         for rank, player in enumerate(sorted_players[: self.MAX_ENTRIES], 1):
             # Buscar ultima partida completada
-            games = self.game_repo.get_by_player(player.player_id)
+            games = self.game_repo.stream_by_player(player.player_id)
             last_completed = next((g for g in games if g.status == "completed"), None)
 
             entries.append(
@@ -230,7 +231,7 @@ class LeaderboardService:
         entries = []
         for rank, player in enumerate(sorted_players[: self.MAX_ENTRIES], 1):
             # Buscar ultima partida completada
-            games = self.game_repo.get_by_player(player.player_id)
+            games = self.game_repo.stream_by_player(player.player_id)
             last_completed = next((g for g in games if g.status == "completed"), None)
 
             entries.append(
@@ -48,6 +48,19 @@ class FirestorePlayerRepository(IPlayerRepository):
         data = doc.to_dict()
         return Player.from_dict(data)
 
+    def get_many(self, player_ids: List[str]) -> List[Optional[Player]]:
+        """Obtiene varios jugadores en una sola llamada a Firestore (get_all).
+
+        Firestore no garantiza el orden de la respuesta, así que se reordena por ID.
+        """
+        refs = [self.collection.document(player_id) for player_id in player_ids]
+        found = {
+            snap.id: Player.from_dict(snap.to_dict())
+            for snap in self.db.get_all(refs)
+            if snap.exists
+        }
+        return [found.get(player_id) for player_id in player_ids]
+
     def get_by_username(self, username: str) -> Optional[Player]:
         """Obtiene un jugador por su username."""
         # Query en Firestore: WHERE username == X LIMIT 1
@@ -89,14 +102,16 @@ class FirestorePlayerRepository(IPlayerRepository):
             doc_ref = self.collection.document(player_id)
             doc_ref.update(update_data)
 
-            logger.info(f"Jugador actualizado: {player_id} - {list(update_data.keys())}")
+            logger.debug(
+                "Jugador actualizado", player_id=player_id, fields=list(update_data.keys())
+            )
 
             # Retornar el jugador actualizado
             return self.get_by_id(player_id)
 
         except Exception as e:
             # Si el documento no existe, update() lanza excepción
-            logger.warning(f"Error actualizando jugador {player_id}: {e}")
+            logger.warning("Error actualizando jugador %s: %s", player_id, e)
             return None
 
     def delete(self, player_id: str) -> bool:
@@ -109,17 +124,21 @@ class FirestorePlayerRepository(IPlayerRepository):
         doc = doc_ref.get()
 
         if not doc.exists:
-            logger.warning(f"Intento de eliminar jugador inexistente: {player_id}")
+            logger.warning("Intento de eliminar jugador inexistente: %s", player_id)
             return False
 
         doc_ref.delete()
-        logger.info(f"Jugador eliminado: {player_id}")
+        logger.debug("Jugador eliminado", player_id=player_id)
         return True
 
     def exists(self, player_id: str) -> bool:
-        """Verifica si existe un jugador."""
+        """Verifica si existe un jugador.
+
+        Solo pide el campo player_id: para saber si existe no hace falta
+        descargar el documento completo.
+        """
         doc_ref = self.collection.document(player_id)
-        return doc_ref.get().exists
+        return doc_ref.get(field_paths=["player_id"]).exists
 
     def count(self) -> int:
         """Cuenta el total de jugadores."""
@@ -135,5 +154,5 @@ class FirestorePlayerRepository(IPlayerRepository):
         doc_ref = self.collection.document(player.player_id)
         doc_ref.set(player.to_dict())
 
-        logger.info(f"Jugador guardado: {player.player_id} - {player.username}")
+        logger.debug("Jugador guardado", player_id=player.player_id, username=player.username)
         return player
@@ -14,12 +14,14 @@ Reglas de acceso:
 Autor: Mandrágora
 """
 
+from functools import lru_cache
 from typing import List
 
 from fastapi import APIRouter, Depends, HTTPException, Request
 
 from app.domain.games.adapters.firestore_repository import FirestoreGameRepository
 from app.domain.games.ports import IGameRepository
+from app.middleware.auth import AuthCtx, get_auth_ctx, require_admin
 from app.middleware.rate_limit import PLAYER_CREATE_LIMIT, limiter
 
 from .adapters.firestore_repository import FirestorePlayerRepository
@@ -41,7 +43,7 @@ router = APIRouter(prefix="/v1/players", tags=["Players"])
 # ==================== HELPERS ====================
 
 
-def check_player_access(request: Request, target_player_id: str) -> None:
+def check_player_access(auth: AuthCtx, target_player_id: str) -> None:
     """Verifica que el usuario tenga permisos para acceder al jugador especificado.
 
     Reglas:
@@ -49,29 +51,29 @@ def check_player_access(request: Request, target_player_id: str) -> None:
     - Jugador autenticado: solo puede acceder a su propio ID.
 
     Args:
-        request (Request): Request de FastAPI con estado de autenticación.
+        auth (AuthCtx): Contexto de autenticación del request.
         target_player_id (str): ID del jugador al que se quiere acceder.
 
     Raises:
         HTTPException: Si no tiene permisos (403).
     """
-    is_admin = getattr(request.state, "is_admin", False)
-    authenticated_player_id = getattr(request.state, "player_id", None)
-
     # Admin puede acceder a cualquier jugador
-    if is_admin:
+    if auth.is_admin:
         return
 
     # Jugador solo puede acceder a su propio ID
-    if authenticated_player_id != target_player_id:
+    if auth.player_id != target_player_id:
         raise HTTPException(
             status_code=403, detail="No tienes permisos para acceder a este jugador"
         )
 
 
 # ==================== DEPENDENCY INJECTION ====================
+# Repositorios y servicios no guardan estado por request: se construyen una vez
+# por proceso (lru_cache) y FastAPI reutiliza las mismas instancias.
 
 
+@lru_cache(maxsize=1)
 def get_player_repository() -> IPlayerRepository:
     """Dependency que provee el repositorio de Players.
 
@@ -84,22 +86,20 @@ def get_player_repository() -> IPlayerRepository:
     return FirestorePlayerRepository()
 
 
-def get_player_service(
-    repository: IPlayerRepository = Depends(get_player_repository),
-) -> PlayerService:
+@lru_cache(maxsize=1)
+def get_player_service() -> PlayerService:
     """Dependency que provee el servicio de Players.
 
-    Recibe el repository por inyección automática.
-
-    Args:
-        repository (IPlayerRepository): Repositorio inyectado por FastAPI.
+    Obtiene el repositorio del provider cacheado en lugar de con Depends:
+    FastAPI resuelve una sola función por request.
 
     Returns:
-        PlayerService: Servicio configurado.
+        PlayerService: Servicio compartido.
     """
-    return PlayerService(repository=repository)
+    return PlayerService(repository=get_player_repository())
 
 
+@lru_cache(maxsize=1)
 def get_game_repository() -> IGameRepository:
     """Dependency que provee el repositorio de Games.
 
@@ -217,7 +217,7 @@ def get_my_profile(request: Request):
 @router.get("/{player_id}", response_model=Player)
 def get_player(
     player_id: str,
-    request: Request,
+    auth: AuthCtx = Depends(get_auth_ctx),
     service: PlayerService = Depends(get_player_service),
 ):
     """Obtener un jugador por ID.
@@ -226,7 +226,7 @@ def get_player(
 
     Args:
         player_id (str): ID único del jugador.
-        request (Request): Request de FastAPI.
+        auth (AuthCtx): Contexto de autenticación del request.
         service (PlayerService): Servicio inyectado.
 
     Returns:
@@ -237,7 +237,7 @@ def get_player(
         HTTPException: Si el jugador no existe (404).
     """
     # Verificar permisos (admin o propio jugador)
-    check_player_access(request, player_id)
+    check_player_access(auth, player_id)
 
     player = service.get_player(player_id)
     if not player:
@@ -246,9 +246,8 @@ def get_player(
     return player
 
 
-@router.get("", response_model=List[Player])
+@router.get("", response_model=List[Player], dependencies=[Depends(require_admin)])
 def get_all_players(
-    request: Request,
     limit: int = 100,
     service: PlayerService = Depends(get_player_service),
 ):
@@ -257,7 +256,6 @@ def get_all_players(
     SOLO ADMIN: Requiere API Key (X-API-Key).
 
     Args:
-        request (Request): Request de FastAPI.
         limit (int): Máximo número de jugadores a retornar (default: 100).
         service (PlayerService): Servicio inyectado.
 
@@ -267,15 +265,6 @@ def get_all_players(
     Raises:
         HTTPException: Si no eres admin (403).
     """
-    # Solo admin puede listar todos los jugadores
-    is_admin = getattr(request.state, "is_admin", False)
-
-    if not is_admin:
-        raise HTTPException(
-            status_code=403,
-            detail="Este endpoint solo está disponible para administradores (requiere X-API-Key)",
-        )
-
     return service.get_all_players(limit=limit)
 
 
@@ -283,7 +272,7 @@ def get_all_players(
 def update_player(
     player_id: str,
     player_update: PlayerUpdate,
-    request: Request,
+    auth: AuthCtx = Depends(get_auth_ctx),
     service: PlayerService = Depends(get_player_service),
 ):
     """Actualizar un jugador.
@@ -294,7 +283,7 @@ def update_player(
     Args:
         player_id (str): ID del jugador.
         player_update (PlayerUpdate): Campos a actualizar.
-        request (Request): Request de FastAPI.
+        auth (AuthCtx): Contexto de autenticación del request.
         service (PlayerService): Servicio inyectado.
 
     Returns:
@@ -305,7 +294,7 @@ def update_player(
         HTTPException: Si el jugador no existe (404).
     """
     # Verificar permisos (admin o propio jugador)
-    check_player_access(request, player_id)
+    check_player_access(auth, player_id)
 
     player = service.update_player(player_id, player_update)
     if not player:
@@ -317,7 +306,7 @@ def update_player(
 @router.delete("/{player_id}")
 def delete_player(
     player_id: str,
-    request: Request,
+    auth: AuthCtx = Depends(get_auth_ctx),
     service: PlayerService = Depends(get_player_service),
 ):
     """Eliminar un jugador.
@@ -326,7 +315,7 @@ def delete_player(
 
     Args:
         player_id (str): ID del jugador.
-        request (Request): Request de FastAPI.
+        auth (AuthCtx): Contexto de autenticación del request.
         service (PlayerService): Servicio inyectado.
 
     Returns:
@@ -337,7 +326,7 @@ def delete_player(
         HTTPException: Si el jugador no existe (404).
     """
     # Verificar permisos (admin o propio jugador)
-    check_player_access(request, player_id)
+    check_player_access(auth, player_id)
 
     deleted = service.delete_player(player_id)
     if not deleted:
@@ -37,6 +37,19 @@ class IPlayerRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_many(self, player_ids: List[str]) -> List[Optional[Player]]:
+        """Busca varios jugadores por ID en una sola operación.
+
+        Args:
+            player_ids (List[str]): IDs de los jugadores.
+
+        Returns:
+            List[Optional[Player]]: Jugadores en el mismo orden que player_ids
+                (None en la posición de los que no existen).
+        """
+        pass
+
     @abstractmethod
     def get_by_username(self, username: str) -> Optional[Player]:
         """Busca un jugador por su username.
@@ -198,19 +198,29 @@ class PlayerService:
             return None
 
         logger.info(
-            f"📥 Actualizando stats del jugador {player_id[:8]}... | "
-            f"Partida: {game.game_id[:8]}... | "
-            f"Recibido: time={game.total_time_seconds}s, status={game.status}, "
-            f"muertes={game.metrics.total_deaths}"
+            "📥 Actualizando stats del jugador %s... | "
+            "Partida: %s... | "
+            "Recibido: time=%ss, status=%s, "
+            "muertes=%s",
+            player_id[:8],
+            game.game_id[:8],
+            game.total_time_seconds,
+            game.status,
+            game.metrics.total_deaths,
         )
 
         # ADVERTENCIA: Esta función incrementa contadores cada vez que se llama
         # Si se llama múltiples veces para la misma partida, los datos se duplicarán
         logger.warning(
-            f"⚠️  ANTES de actualizar → Player: {player_id[:8]}... | "
-            f"games_played={player.games_played}, "
-            f"games_completed={player.games_completed}, "
-            f"total_playtime={player.total_playtime_seconds}s ({player.total_playtime_seconds/60:.1f} min)"
+            "⚠️  ANTES de actualizar → Player: %s... | "
+            "games_played=%s, "
+            "games_completed=%s, "
+            "total_playtime=%ss (%.1f min)",
+            player_id[:8],
+            player.games_played,
+            player.games_completed,
+            player.total_playtime_seconds,
+            player.total_playtime_seconds / 60,
         )
 
         # 1. CONTADORES DE PARTIDAS
@@ -222,8 +232,11 @@ class PlayerService:
         old_playtime = player.total_playtime_seconds
         player.total_playtime_seconds += game.total_time_seconds
         logger.info(
-            f"⏱️  Tiempo actualizado: {old_playtime}s + {game.total_time_seconds}s = "
-            f"{player.total_playtime_seconds}s ({player.total_playtime_seconds/60:.1f} min)"
+            "⏱️  Tiempo actualizado: %ss + %ss = %ss (%.1f min)",
+            old_playtime,
+            game.total_time_seconds,
+            player.total_playtime_seconds,
+            player.total_playtime_seconds / 60,
         )
 
         # 3. MUERTES TOTALES
@@ -248,14 +261,18 @@ class PlayerService:
             if player_choice == choices["good"]:
                 good_choices += 1
                 logger.info(
-                    f"✅ Decisión BUENA detectada: {player_choice} en {level} "
-                    f"[Jugador: {player_id[:8]}...]"
+                    "✅ Decisión BUENA detectada: %s en %s [Jugador: %s...]",
+                    player_choice,
+                    level,
+                    player_id[:8],
                 )
             elif player_choice == choices["bad"]:
                 bad_choices += 1
                 logger.info(
-                    f"❌ Decisión MALA detectada: {player_choice} en {level} "
-                    f"[Jugador: {player_id[:8]}...]"
+                    "❌ Decisión MALA detectada: %s en %s [Jugador: %s...]",
+                    player_choice,
+                    level,
+                    player_id[:8],
                 )
             # Si es None, el jugador no tomó decisión en este nivel
 
@@ -265,10 +282,16 @@ class PlayerService:
 
         if good_choices > 0 or bad_choices > 0:
             logger.info(
-                f"📊 Resumen partida {game.game_id[:8]}...: "
-                f"{good_choices} buenas, {bad_choices} malas | "
-                f"Total histórico: {player.stats.total_good_choices} buenas, "
-                f"{player.stats.total_bad_choices} malas [Jugador: {player_id[:8]}...]"
+                "📊 Resumen partida %s...: "
+                "%s buenas, %s malas | "
+                "Total histórico: %s buenas, "
+                "%s malas [Jugador: %s...]",
+                game.game_id[:8],
+                good_choices,
+                bad_choices,
+                player.stats.total_good_choices,
+                player.stats.total_bad_choices,
+                player_id[:8],
             )
 
         # 5. CALCULAR ALINEACIÓN MORAL
@@ -288,10 +311,13 @@ class PlayerService:
             change_symbol = "📈" if alignment_change > 0 else "📉" if alignment_change < 0 else "➡️"
 
             logger.info(
-                f"{change_symbol} ALINEACIÓN MORAL actualizada: "
-                f"{old_alignment:.2f} → {player.stats.moral_alignment:.2f} "
-                f"({'+'if alignment_change >= 0 else ''}{alignment_change:.2f}) "
-                f"[Jugador: {player_id[:8]}...]"
+                "%s ALINEACIÓN MORAL actualizada: %.2f → %.2f (%s%.2f) [Jugador: %s...]",
+                change_symbol,
+                old_alignment,
+                player.stats.moral_alignment,
+                "+" if alignment_change >= 0 else "",
+                alignment_change,
+                player_id[:8],
             )
         # Si total_choices == 0, moral_alignment se queda en 0.0 (neutral)
 
@@ -320,19 +346,29 @@ class PlayerService:
         updated_player = self.repository.update(player_id, update_data)
 
         logger.info(
-            f"✅ DESPUÉS de actualizar → Player: {player_id[:8]}... | "
-            f"games_played={player.games_played}, "
-            f"games_completed={player.games_completed}, "
-            f"total_playtime={player.total_playtime_seconds}s ({player.total_playtime_seconds/60:.1f} min) | "
-            f"Guardado exitoso: {updated_player is not None}"
+            "✅ DESPUÉS de actualizar → Player: %s... | "
+            "games_played=%s, "
+            "games_completed=%s, "
+            "total_playtime=%ss (%.1f min) | "
+            "Guardado exitoso: %s",
+            player_id[:8],
+            player.games_played,
+            player.games_completed,
+            player.total_playtime_seconds,
+            player.total_playtime_seconds / 60,
+            updated_player is not None,
         )
 
         # Log detallado de stats morales guardados
         logger.info(
-            f"📊 STATS MORALES GUARDADOS → Player: {player_id[:8]}... | "
-            f"total_good_choices={player.stats.total_good_choices}, "
-            f"total_bad_choices={player.stats.total_bad_choices}, "
-            f"moral_alignment={player.stats.moral_alignment:.2f}"
+            "📊 STATS MORALES GUARDADOS → Player: %s... | "
+            "total_good_choices=%s, "
+            "total_bad_choices=%s, "
+            "moral_alignment=%.2f",
+            player_id[:8],
+            player.stats.total_good_choices,
+            player.stats.total_bad_choices,
+            player.stats.moral_alignment,
         )
 
         return updated_player
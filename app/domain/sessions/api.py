@@ -11,11 +11,15 @@ Reglas de acceso:
 Autor: Mandrágora
 """
 
+from functools import lru_cache
 from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException
+
+from app.middleware.auth import AuthCtx, get_auth_ctx
 
 from ..games.adapters.firestore_repository import FirestoreGameRepository
+from ..games.ports import IGameRepository
 from .models import GameSession
 from .repository import SessionRepository
 from .schemas import SessionCreate, SessionResponse
@@ -28,37 +32,31 @@ router = APIRouter(prefix="/v1/sessions", tags=["Sessions"])
 # ==================== HELPERS ====================
 
 
-def check_player_access(request: Request, target_player_id: str) -> None:
+def check_player_access(auth: AuthCtx, target_player_id: str) -> None:
     """Verifica permisos para acceder a datos de un jugador."""
-    is_admin = getattr(request.state, "is_admin", False)
-    authenticated_player_id = getattr(request.state, "player_id", None)
-
-    if is_admin:
+    if auth.is_admin:
         return
 
-    if authenticated_player_id != target_player_id:
+    if auth.player_id != target_player_id:
         raise HTTPException(
             status_code=403,
             detail="No tienes permisos para acceder a las sesiones de este jugador",
         )
 
 
-def check_game_access(request: Request, game_id: str) -> None:
+def check_game_access(auth: AuthCtx, game_id: str) -> None:
     """Verifica permisos para acceder a datos de una partida."""
-    is_admin = getattr(request.state, "is_admin", False)
-    authenticated_player_id = getattr(request.state, "player_id", None)
-
-    if is_admin:
+    if auth.is_admin:
         return
 
     # Verificar que la partida pertenece al jugador
-    game_repo = FirestoreGameRepository()
-    game = game_repo.get_by_id(game_id)
+    # (solo se lee el dueño, no la partida completa)
+    owner_id = get_game_repository().get_owner(game_id)
 
-    if not game:
+    if owner_id is None:
         raise HTTPException(status_code=404, detail="Partida no encontrada")
 
-    if game.player_id != authenticated_player_id:
+    if owner_id != auth.player_id:
         raise HTTPException(
             status_code=403,
             detail="No tienes permisos para ver sesiones de esta partida",
@@ -80,18 +78,26 @@ def session_to_response(session: GameSession) -> SessionResponse:
 
 
 # ==================== DEPENDENCY INJECTION ====================
+# Repositorios y servicios no guardan estado por request: se construyen una vez
+# por proceso (lru_cache) y FastAPI reutiliza las mismas instancias.
 
 
+@lru_cache(maxsize=1)
 def get_session_repository() -> SessionRepository:
     """Dependency que provee el repositorio de Sessions."""
     return SessionRepository()
 
 
-def get_session_service(
-    repository: SessionRepository = Depends(get_session_repository),
-) -> SessionService:
-    """Dependency que provee el servicio de Sessions."""
-    return SessionService(repository=repository)
+@lru_cache(maxsize=1)
+def get_game_repository() -> IGameRepository:
+    """Provee el repositorio de Games para las comprobaciones de permisos."""
+    return FirestoreGameRepository()
+
+
+@lru_cache(maxsize=1)
+def get_session_service() -> SessionService:
+    """Dependency que provee el servicio de Sessions (sin sub-dependencias)."""
+    return SessionService(repository=get_session_repository())
 
 
 # ==================== ENDPOINTS ====================
@@ -100,7 +106,7 @@ def get_session_service(
 @router.post("", response_model=SessionResponse, status_code=201)
 def start_session(
     session_data: SessionCreate,
-    request: Request,
+    auth: AuthCtx = Depends(get_auth_ctx),
     service: SessionService = Depends(get_session_service),
 ):
     """Iniciar una nueva sesión de juego.
@@ -110,7 +116,7 @@ def start_session(
 
     Args:
         session_data (SessionCreate): Datos de la sesión (game_id, platform).
-        request (Request): Request de FastAPI.
+        auth (AuthCtx): Contexto de autenticación del request.
         service (SessionService): Servicio inyectado.
 
     Returns:
@@ -120,7 +126,7 @@ def start_session(
         HTTPException: Si la partida no existe o no pertenece al jugador (400).
         HTTPException: Si no está autenticado (401).
     """
-    player_id = getattr(request.state, "player_id", None)
+    player_id = auth.player_id
 
     if not player_id:
         raise HTTPException(status_code=401, detail="Autenticacion de jugador requerida")
@@ -135,7 +141,7 @@ def start_session(
 @router.patch("/{session_id}/end", response_model=SessionResponse)
 def end_session(
     session_id: str,
-    request: Request,
+    auth: AuthCtx = Depends(get_auth_ctx),
     service: SessionService = Depends(get_session_service),
 ):
     """Terminar una sesión de juego activa.
@@ -144,7 +150,7 @@ def end_session(
 
     Args:
         session_id (str): ID de la sesión a terminar.
-        request (Request): Request de FastAPI.
+        auth (AuthCtx): Contexto de autenticación del request.
         service (SessionService): Servicio inyectado.
 
     Returns:
@@ -154,11 +160,10 @@ def end_session(
         HTTPException: Si la sesión ya está cerrada o no te pertenece (400).
         HTTPException: Si la sesión no existe (404).
     """
-    player_id = getattr(request.state, "player_id", None)
-    is_admin = getattr(request.state, "is_admin", False)
+    player_id = auth.player_id
 
     # Admin puede cerrar cualquier sesion
-    if is_admin:
+    if auth.is_admin:
         session = service.get_session(session_id)
         if not session:
             raise HTTPException(status_code=404, detail="Sesion no encontrada")
@@ -179,7 +184,7 @@ def end_session(
 @router.get("/player/{player_id}", response_model=List[SessionResponse])
 def get_player_sessions(
     player_id: str,
-    request: Request,
+    auth: AuthCtx = Depends(get_auth_ctx),
     limit: int = 100,
     service: SessionService = Depends(get_session_service),
 ):
@@ -189,14 +194,14 @@ def get_player_sessions(
 
     Args:
         player_id (str): ID del jugador.
-        request (Request): Request de FastAPI.
+        auth (AuthCtx): Contexto de autenticación del request.
         limit (int): Máximo número de sesiones.
         service (SessionService): Servicio inyectado.
 
     Returns:
         List[SessionResponse]: Lista de sesiones ordenadas por fecha (más reciente primero).
     """
-    check_player_access(request, player_id)
+    check_player_access(auth, player_id)
 
     sessions = service.get_player_sessions(player_id, limit)
     return [session_to_response(s) for s in sessions]
@@ -205,7 +210,7 @@ def get_player_sessions(
 @router.get("/game/{game_id}", response_model=List[SessionResponse])
 def get_game_sessions(
     game_id: str,
-    request: Request,
+    auth: AuthCtx = Depends(get_auth_ctx),
     limit: int = 100,
     service: SessionService = Depends(get_session_service),
 ):
@@ -215,14 +220,14 @@ def get_game_sessions(
 
     Args:
         game_id (str): ID de la partida.
-        request (Request): Request de FastAPI.
+        auth (AuthCtx): Contexto de autenticación del request.
         limit (int): Máximo número de sesiones.
         service (SessionService): Servicio inyectado.
 
     Returns:
         List[SessionResponse]: Lista de sesiones de la partida.
     """
-    check_game_access(request, game_id)
+    check_game_access(auth, game_id)
 
     sessions = service.get_game_sessions(game_id, limit)
     return [session_to_response(s) for s in sessions]
@@ -50,7 +50,7 @@ class SessionRepository:
         doc_ref = self.collection.document(session.session_id)
         doc_ref.set(session.to_dict())
 
-        logger.info(f"Sesion creada: {session.session_id} para jugador {player_id}")
+        logger.info("Sesion creada: %s para jugador %s", session.session_id, player_id)
         return session
 
     def get_by_id(self, session_id: str) -> Optional[GameSession]:
@@ -150,7 +150,7 @@ class SessionRepository:
         ended_at = datetime.now(timezone.utc)
         doc_ref.update({"ended_at": ended_at})
 
-        logger.info(f"Sesion finalizada: {session_id}")
+        logger.info("Sesion finalizada: %s", session_id)
         return self.get_by_id(session_id)
 
     def close_stale_sessions(self, player_id: str) -> int:
@@ -175,6 +175,6 @@ class SessionRepository:
             closed_count += 1
 
         if closed_count > 0:
-            logger.warning(f"Cerradas {closed_count} sesiones huerfanas del jugador {player_id}")
+            logger.warning("Cerradas %s sesiones huerfanas del jugador %s", closed_count, player_id)
 
         return closed_count
@@ -71,7 +71,7 @@ class SessionService:
         # Cerrar sesiones huerfanas
         closed = self.repository.close_stale_sessions(player_id)
         if closed > 0:
-            logger.warning(f"Se cerraron {closed} sesiones huerfanas")
+            logger.warning("Se cerraron %s sesiones huerfanas", closed)
 
         # Crear nueva sesion
         return self.repository.create(player_id, session_data)
@@ -174,12 +174,13 @@ def _create_export_audit_log(
         )
 
         session.close()
-        logger.debug(f"Audit log registrado: export_{data_type}_csv")
+        logger.debug("Audit log registrado: export_%s_csv", data_type)
 
     except Exception as e:
         # Si falla el audit log, solo logear pero no fallar la exportación
         logger.error(
-            f"Error al registrar audit log de exportación: {e}",
+            "Error al registrar audit log de exportación: %s",
+            e,
             extra={"action": f"export_{data_type}_csv", "user": username},
         )
 
@@ -243,12 +244,13 @@ def _create_migration_audit_log(
         )
 
         session.close()
-        logger.debug(f"Audit log registrado: {action}")
+        logger.debug("Audit log registrado: %s", action)
 
     except Exception as e:
         # Si falla el audit log, solo logear pero no fallar la operación
         logger.error(
-            f"Error al registrar audit log de migración: {e}",
+            "Error al registrar audit log de migración: %s",
+            e,
             extra={"action": action, "user": username},
         )
 
@@ -469,7 +471,7 @@ def export_download():
                 headers={"Content-Disposition": f"attachment; filename={filename}"},
             )
 
-        logger.info(f"Datos exportados: {data_type} ({export_format})", filename=filename)
+        logger.info("Datos exportados: %s (%s)", data_type, export_format, filename=filename)
 
         # Registrar en audit log
         _create_export_audit_log(
@@ -586,7 +588,8 @@ def migrations_upgrade():
 
     current_user = getattr(g, "current_user", {})
     logger.info(
-        f"Upgrade de migraciones iniciado por {current_user.get('username')}",
+        "Upgrade de migraciones iniciado por %s",
+        current_user.get("username"),
         revision=revision,
     )
 
@@ -630,7 +633,8 @@ def migrations_downgrade():
 
     current_user = getattr(g, "current_user", {})
     logger.info(
-        f"Downgrade de migraciones iniciado por {current_user.get('username')}",
+        "Downgrade de migraciones iniciado por %s",
+        current_user.get("username"),
         revision=revision,
     )
 
@@ -675,7 +679,8 @@ def migrations_download_sql():
 
     current_user = getattr(g, "current_user", {})
     logger.info(
-        f"Generación de SQL iniciada por {current_user.get('username')}",
+        "Generación de SQL iniciada por %s",
+        current_user.get("username"),
         revision=revision,
         direction=direction,
     )
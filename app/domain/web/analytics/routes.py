@@ -220,7 +220,7 @@ def api_chart_events():
         chart_html = analytics_service.create_events_by_type_chart(all_events)
         return jsonify({"html": chart_html, "total": len(all_events)})
     except Exception as e:
-        logger.error(f"/api/charts/events failed: {e}")
+        logger.error("/api/charts/events failed: %s", e)
         import traceback
 
         traceback.print_exc()
@@ -235,7 +235,7 @@ def api_chart_events_timeline():
         chart_html = analytics_service.create_events_timeline_chart(all_events)
         return jsonify({"html": chart_html})
     except Exception as e:
-        logger.error(f"/api/charts/events/timeline failed: {e}")
+        logger.error("/api/charts/events/timeline failed: %s", e)
         import traceback
 
         traceback.print_exc()
@@ -250,7 +250,7 @@ def api_chart_events_deaths():
         chart_html = analytics_service.create_deaths_event_chart(all_events)
         return jsonify({"html": chart_html})
     except Exception as e:
-        logger.error(f"/api/charts/events/deaths failed: {e}")
+        logger.error("/api/charts/events/deaths failed: %s", e)
         import traceback
 
         traceback.print_exc()
@@ -65,9 +65,9 @@ class AnalyticsService:
 
         # DEBUG: Log de inicialización
         logger.info("[Analytics] Initializing service:")
-        logger.debug(f"API Base URL: {api_base_url}")
-        logger.debug(f"API Key: {'SET' if api_key else 'NOT SET'}")
-        logger.debug(f"Mock Mode: {use_mock_data}")
+        logger.debug("API Base URL: %s", api_base_url)
+        logger.debug("API Key: %s", "SET" if api_key else "NOT SET")
+        logger.debug("Mock Mode: %s", use_mock_data)
 
         if ANALYTICS_AVAILABLE:
             headers = {}
@@ -120,17 +120,17 @@ class AnalyticsService:
             cleared_keys = list(self._cache.keys())
             self._cache.clear()
             self._cache_timestamp.clear()
-            logger.info(f"[Analytics] Cache completamente limpiado ({len(cleared_keys)} claves)")
+            logger.info("[Analytics] Cache completamente limpiado (%s claves)", len(cleared_keys))
             return {"cleared": "all", "keys": cleared_keys}
         else:
             # Limpiar una clave específica
             if cache_key in self._cache:
                 del self._cache[cache_key]
                 del self._cache_timestamp[cache_key]
-                logger.info(f"[Analytics] Cache limpiado: {cache_key}")
+                logger.info("[Analytics] Cache limpiado: %s", cache_key)
                 return {"cleared": cache_key}
             else:
-                logger.warning(f"[Analytics] Clave de cache no encontrada: {cache_key}")
+                logger.warning("[Analytics] Clave de cache no encontrada: %s", cache_key)
                 return {"cleared": None, "error": "Cache key not found"}
 
     def _generate_mock_players(self) -> List[Dict[str, Any]]:
@@ -358,7 +358,7 @@ class AnalyticsService:
         # Verificar si hay cache válido
         if self._is_cache_valid(cache_key):
             age = time.time() - self._cache_timestamp[cache_key]
-            logger.info(f"[Analytics] Using cached players (age: {age:.1f}s)")
+            logger.info("[Analytics] Using cached players (age: %.1fs)", age)
             return self._get_from_cache(cache_key)
 
         if not self.client:
@@ -372,12 +372,14 @@ class AnalyticsService:
             # Guardar en cache
             self._set_cache(cache_key, players)
             logger.debug(
-                f"[Analytics] Fetched {len(players)} players from API (cached for {self._cache_ttl}s)"
+                "[Analytics] Fetched %s players from API (cached for %ss)",
+                len(players),
+                self._cache_ttl,
             )
 
             return players
         except Exception as e:
-            logger.error(f"Error obteniendo jugadores: {e}")
+            logger.error("Error obteniendo jugadores: %s", e)
             return []
 
     def get_all_games(self) -> List[Dict[str, Any]]:
@@ -403,7 +405,7 @@ class AnalyticsService:
             age = time.time() - self._cache_timestamp[cache_key]
             cached_games = self._get_from_cache(cache_key)
             logger.info(
-                f"[Analytics] Using cached games (age: {age:.1f}s, {len(cached_games)} games)"
+                "[Analytics] Using cached games (age: %.1fs, %s games)", age, len(cached_games)
             )
             return cached_games
 
@@ -415,13 +417,13 @@ class AnalyticsService:
         try:
             # OPTIMIZACIÓN: Llamar endpoint admin directo en lugar de iterar jugadores
             logger.info("[Analytics] Calling GET /v1/games with limit=500")
-            logger.info(f"[Analytics] Client headers: {dict(self.client.headers)}")
+            logger.info("[Analytics] Client headers: %s", dict(self.client.headers))
 
             response = self.client.get("/v1/games", params={"limit": 500})
 
-            logger.info(f"[Analytics] Response status: {response.status_code}")
+            logger.info("[Analytics] Response status: %s", response.status_code)
             logger.info(
-                f"[Analytics] Response content-type: {response.headers.get('content-type')}"
+                "[Analytics] Response content-type: %s", response.headers.get("content-type")
             )
 
             response.raise_for_status()
@@ -429,25 +431,25 @@ class AnalyticsService:
 
             elapsed = time.time() - start_time
             logger.info(
-                f"[Analytics] ✅ Fetched {len(all_games)} games in {elapsed:.2f}s (1 HTTP call)"
+                "[Analytics] ✅ Fetched %s games in %.2fs (1 HTTP call)", len(all_games), elapsed
             )
 
             # Guardar en cache
             self._set_cache(cache_key, all_games)
-            logger.info(f"[Analytics] Cached {len(all_games)} games for {self._cache_ttl}s")
+            logger.info("[Analytics] Cached %s games for %ss", len(all_games), self._cache_ttl)
 
             return all_games
 
         except httpx.HTTPStatusError as e:
-            logger.info(f"[Analytics] ❌ HTTP Error {e.response.status_code}")
-            logger.info(f"[Analytics] Response preview: {e.response.text[:500]}")
+            logger.info("[Analytics] ❌ HTTP Error %s", e.response.status_code)
+            logger.info("[Analytics] Response preview: %s", e.response.text[:500])
             if e.response.status_code == 403:
                 logger.info(
                     "[Analytics] ERROR: Endpoint requires admin auth. Make sure API Key is set."
                 )
             return []
         except Exception as e:
-            logger.info(f"[Analytics] ❌ Error fetching games: {type(e).__name__}: {e}")
+            logger.info("[Analytics] ❌ Error fetching games: %s: %s", type(e).__name__, e)
             return []
 
     def get_all_events(self) -> List[Dict[str, Any]]:
@@ -473,7 +475,7 @@ class AnalyticsService:
             age = time.time() - self._cache_timestamp[cache_key]
             cached_events = self._get_from_cache(cache_key)
             logger.info(
-                f"[Analytics] Using cached events (age: {age:.1f}s, {len(cached_events)} events)"
+                "[Analytics] Using cached events (age: %.1fs, %s events)", age, len(cached_events)
             )
             return cached_events
 
@@ -488,9 +490,9 @@ class AnalyticsService:
 
             response = self.client.get("/v1/events", params={"limit": 500, "days": 30})
 
-            logger.info(f"[Analytics] Response status: {response.status_code}")
+            logger.info("[Analytics] Response status: %s", response.status_code)
             logger.info(
-                f"[Analytics] Response content-type: {response.headers.get('content-type')}"
+                "[Analytics] Response content-type: %s", response.headers.get("content-type")
             )
 
             response.raise_for_status()
@@ -505,25 +507,25 @@ class AnalyticsService:
 
             elapsed = time.time() - start_time
             logger.debug(
-                f"[Analytics] ✅ Fetched {len(all_events)} events in {elapsed:.2f}s (1 HTTP call)"
+                "[Analytics] ✅ Fetched %s events in %.2fs (1 HTTP call)", len(all_events), elapsed
             )
 
             # Guardar en cache
             self._set_cache(cache_key, all_events)
-            logger.info(f"[Analytics] Cached {len(all_events)} events for {self._cache_ttl}s")
+            logger.info("[Analytics] Cached %s events for %ss", len(all_events), self._cache_ttl)
 
             return all_events
 
         except httpx.HTTPStatusError as e:
-            logger.info(f"[Analytics] ❌ HTTP Error {e.response.status_code}")
-            logger.info(f"[Analytics] Response preview: {e.response.text[:500]}")
+            logger.info("[Analytics] ❌ HTTP Error %s", e.response.status_code)
+            logger.info("[Analytics] Response preview: %s", e.response.text[:500])
             if e.response.status_code == 403:
                 logger.info(
                     "[Analytics] ERROR: Endpoint requires admin auth. Make sure API Key is set."
                 )
             return []
         except Exception as e:
-            logger.info(f"[Analytics] ❌ Error fetching events: {type(e).__name__}: {e}")
+            logger.info("[Analytics] ❌ Error fetching events: %s: %s", type(e).__name__, e)
             return []
 
     def calculate_global_metrics(self, players: List[Dict], games: List[Dict]) -> Dict[str, Any]:
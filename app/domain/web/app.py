@@ -70,7 +70,7 @@ def create_flask_app():
             metrics = analytics_service.calculate_global_metrics(players, games)
             chart_active_players = analytics_service.create_active_players_chart(events)
         except Exception as e:
-            logger.error(f"Error obteniendo métricas para landing page: {e}")
+            logger.error("Error obteniendo métricas para landing page: %s", e)
             metrics = {
                 "total_players": 0,
                 "total_games": 0,
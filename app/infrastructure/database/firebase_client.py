@@ -11,7 +11,7 @@ import os
 from typing import Optional
 
 import firebase_admin
-from firebase_admin import credentials, firestore
+from firebase_admin import credentials, firestore, firestore_async
 
 from app.config.settings import settings
 from app.core.logger import logger
@@ -27,6 +27,7 @@ class FirebaseManager:
 
     _instance: Optional["FirebaseManager"] = None
     _db: Optional[firestore.Client] = None
+    _async_db: Optional[firestore_async.AsyncClient] = None
     _initialized: bool = False
 
     def __new__(cls):
@@ -63,7 +64,8 @@ class FirebaseManager:
             # Opción 3: Credenciales desde archivo (Local/Desarrollo)
             elif os.path.exists(settings.firebase_credentials_path):
                 logger.info(
-                    f"Cargando credenciales de Firebase desde archivo: {settings.firebase_credentials_path}"
+                    "Cargando credenciales de Firebase desde archivo: %s",
+                    settings.firebase_credentials_path,
                 )
                 cred = credentials.Certificate(settings.firebase_credentials_path)
 
@@ -83,7 +85,7 @@ class FirebaseManager:
             logger.info("Firebase conectado correctamente")
 
         except Exception as e:
-            logger.error(f"Error conectando a Firebase: {e}")
+            logger.error("Error conectando a Firebase: %s", e)
             raise
 
     def get_db(self) -> firestore.Client:
@@ -95,6 +97,17 @@ class FirebaseManager:
             self.initialize()
         return self._db
 
+    def get_async_db(self) -> firestore_async.AsyncClient:
+        """
+        Retorna el cliente asíncrono de Firestore (misma app de Firebase).
+        Se crea la primera vez que se pide.
+        """
+        if not self._initialized:
+            self.initialize()
+        if self._async_db is None:
+            self._async_db = firestore_async.client()
+        return self._async_db
+
 
 # Instancia única compartida por toda la app
 firebase_manager = FirebaseManager()
@@ -109,3 +122,14 @@ def get_firestore_client() -> firestore.Client:
         players = db.collection('players').stream()
     """
     return firebase_manager.get_db()
+
+
+def get_async_firestore_client() -> firestore_async.AsyncClient:
+    """
+    Función simple para obtener el cliente asíncrono de Firestore.
+
+    Ejemplo de uso:
+        db = get_async_firestore_client()
+        doc = await db.collection('players').document(player_id).get()
+    """
+    return firebase_manager.get_async_db()
@@ -74,7 +74,7 @@ class SQLManager:
             logger.info("Base de datos SQL conectada correctamente")
 
         except Exception as e:
-            logger.error(f"Error conectando a la base de datos SQL: {e}")
+            logger.error("Error conectando a la base de datos SQL: %s", e)
             raise
 
     def get_session(self) -> Optional[Session]:
@@ -135,7 +135,7 @@ class SQLManager:
                 conn.execute(text("SELECT 1"))
             return True
         except Exception as e:
-            logger.error(f"Health check de SQL falló: {e}")
+            logger.error("Health check de SQL falló: %s", e)
             return False
 
 
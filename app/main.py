@@ -6,6 +6,7 @@ Integra FastAPI para la API REST del juego + Flask para el dashboard web.
 Autor: Mandrágora
 """
 
+import anyio.to_thread
 import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -157,6 +158,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],  # Paginación por cursor en GET /v1/games
 )
 
 # Middleware de autenticación
@@ -169,6 +171,9 @@ def startup_event():
     """Inicializa servicios al arrancar la aplicación."""
     logger.info("Iniciando Triskel API", version="2.0.0")
 
+    # Los endpoints son síncronos y bloquean en Firestore: ampliar el threadpool
+    anyio.to_thread.current_default_thread_limiter().total_tokens = settings.threadpool_size
+
     # Inicializar Firebase
     firebase_manager.initialize()
 
@@ -177,13 +182,13 @@ def startup_event():
         sql_manager.initialize()
         sql_manager.create_tables()
     except Exception as e:
-        logger.warning(f"Base de datos SQL no disponible (opcional): {e}")
+        logger.warning("Base de datos SQL no disponible (opcional): %s", e)
 
     # Inicializar Scheduler de Leaderboards
     try:
         start_scheduler()
     except Exception as e:
-        logger.warning(f"Scheduler no disponible: {e}")
+        logger.warning("Scheduler no disponible: %s", e)
 
     logger.info("Triskel API lista")
 
@@ -197,13 +202,13 @@ def shutdown_event():
     try:
         shutdown_scheduler()
     except Exception as e:
-        logger.warning(f"Error deteniendo scheduler: {e}")
+        logger.warning("Error deteniendo scheduler: %s", e)
 
     # Cerrar connection pool de SQL
     try:
         sql_manager.dispose()
     except Exception as e:
-        logger.warning(f"Error cerrando SQL pool: {e}")
+        logger.warning("Error cerrando SQL pool: %s", e)
 
     logger.info("Triskel API cerrada")
 
@@ -7,6 +7,6 @@ Middleware y utilidades de autenticación/autorización:
 Autor: Mandrágora
 """
 
-from .auth import auth_middleware
+from .auth import AuthCtx, auth_middleware, get_auth_ctx, require_admin
 
-__all__ = ["auth_middleware"]
+__all__ = ["AuthCtx", "auth_middleware", "get_auth_ctx", "require_admin"]
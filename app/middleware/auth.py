@@ -8,7 +8,10 @@ Soporta TRES tipos de autenticación:
 Autor: Mandrágora
 """
 
-from fastapi import Request
+from dataclasses import dataclass
+from typing import Optional
+
+from fastapi import Depends, HTTPException, Request
 from fastapi.responses import JSONResponse
 from jose import JWTError, jwt
 
@@ -155,3 +158,56 @@ async def auth_middleware(request: Request, call_next):
             )
 
     return await call_next(request)
+
+
+@dataclass(slots=True)
+class AuthCtx:
+    """Contexto de autenticación que el middleware deja en request.state.
+
+    Attributes:
+        is_admin (bool): True si se autenticó con JWT de admin o API Key.
+        player_id (Optional[str]): ID del jugador autenticado (None si es admin).
+    """
+
+    is_admin: bool
+    player_id: Optional[str]
+
+
+def get_auth_ctx(request: Request) -> AuthCtx:
+    """Dependency que lee el estado de autenticación una sola vez por request.
+
+    FastAPI cachea el resultado de la dependency durante el request, así que
+    los endpoints y helpers comparten el mismo AuthCtx.
+
+    Lee el dict que hay detrás de request.state (scope["state"]) con .get():
+    en rutas públicas el middleware no deja nada y getattr(state, ..., default)
+    pasaría por __getattr__, KeyError y AttributeError en cada lectura.
+
+    Args:
+        request (Request): Request de FastAPI con estado de autenticación.
+
+    Returns:
+        AuthCtx: Contexto con is_admin y player_id.
+    """
+    state = request.scope.get("state") or {}
+    return AuthCtx(state.get("is_admin", False), state.get("player_id"))
+
+
+def require_admin(auth: AuthCtx = Depends(get_auth_ctx)) -> None:
+    """Dependency que exige permisos de administrador.
+
+    Se declara en dependencies=[...] del endpoint: FastAPI la resuelve antes de
+    validar los parámetros de query, así que un no-admin recibe el 403 sin
+    que se procese el resto de la petición.
+
+    Args:
+        auth (AuthCtx): Contexto de autenticación del request.
+
+    Raises:
+        HTTPException: Si no es admin (403).
+    """
+    if not auth.is_admin:
+        raise HTTPException(
+            status_code=403,
+            detail="Este endpoint requiere permisos de administrador. Usa API Key o JWT token de admin.",
+        )
@@ -60,7 +60,7 @@ def get_storage_uri():
     # 1. Intentar usar REDIS_URL de entorno (producción)
     redis_url = os.getenv("REDIS_URL")
     if redis_url:
-        logger.info(f"Rate limiting usando Redis: {redis_url.split('@')[0]}@***")
+        logger.info("Rate limiting usando Redis: %s@***", redis_url.split("@")[0])
         return redis_url
 
     # 2. Intentar conectar a Redis local (desarrollo)
@@ -92,6 +92,8 @@ limiter = Limiter(
 
 
 # ==================== Límites por Endpoint ====================
+# slowapi parsea cada límite una sola vez al decorar el endpoint: las cadenas
+# no se vuelven a interpretar en cada request (no usar lambdas, esas sí se parsean siempre).
 
 # Autenticación (crítico - prevenir brute force)
 AUTH_LOGIN_LIMIT = "5/minute"  # 5 intentos de login por minuto por IP
@@ -141,6 +143,28 @@ def get_user_id_from_request(request):
     return get_remote_address(request)
 
 
+def get_player_key(request):
+    """
+    Clave de rate limiting por jugador autenticado.
+
+    El auth middleware ya dejó el player_id en request.state, así que se usa
+    directamente sin mirar cabeceras. Admins (sin player_id) se limitan por IP.
+
+    Args:
+        request: Request de FastAPI
+
+    Returns:
+        str: player_id o IP address
+    """
+    # Mismo dict que request.state, sin la excepción interna de getattr si no hay player_id
+    player_id = (request.scope.get("state") or {}).get("player_id")
+    if player_id:
+        return f"player:{player_id}"
+
+    # Fallback a IP
+    return get_remote_address(request)
+
+
 # ==================== Error Handler Personalizado ====================
 
 
@@ -41,7 +41,7 @@ def refresh_leaderboards_job():
             # Ejecutar recalculo
             updated = service.refresh_all_leaderboards()
 
-            logger.info(f"=== Scheduler: Leaderboards actualizados exitosamente: {updated} ===")
+            logger.info("=== Scheduler: Leaderboards actualizados exitosamente: %s ===", updated)
             return  # Éxito - salir del loop
 
         except Exception as e:
@@ -49,14 +49,19 @@ def refresh_leaderboards_job():
                 # Falló pero quedan intentos - esperar y reintentar
                 delay = RETRY_DELAYS[attempt - 1]
                 logger.warning(
-                    f"=== Scheduler: Intento {attempt}/{MAX_RETRIES} falló: {e}. "
-                    f"Reintentando en {delay}s... ==="
+                    "=== Scheduler: Intento %s/%s falló: %s. Reintentando en %ss... ===",
+                    attempt,
+                    MAX_RETRIES,
+                    e,
+                    delay,
                 )
                 time.sleep(delay)
             else:
                 # Último intento falló - loguear error final
                 logger.error(
-                    f"=== Scheduler: Error FINAL recalculando leaderboards después de {MAX_RETRIES} intentos: {e} ==="
+                    "=== Scheduler: Error FINAL recalculando leaderboards después de %s intentos: %s ===",
+                    MAX_RETRIES,
+                    e,
                 )
 
 
@@ -349,7 +349,7 @@ def mock_game_repository():
     # Los repositorios son síncronos, no async
     mock_repo.create.return_value = None
     mock_repo.get_by_id.return_value = None
-    mock_repo.get_by_player.return_value = []
+    mock_repo.stream_by_player.return_value = []
     mock_repo.get_active_game.return_value = None
     mock_repo.update.return_value = None
     mock_repo.delete.return_value = False
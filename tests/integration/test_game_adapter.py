@@ -0,0 +1,515 @@
+"""
+Tests de integración para el adapter de Games con Firestore.
+
+Prueba la interacción entre el adapter y el mock de Firestore.
+"""
+
+from unittest.mock import MagicMock, call, patch
+
+import pytest
+from google.api_core.exceptions import NotFound
+from google.cloud.firestore_v1 import ArrayUnion, Increment
+
+from app.core.exceptions import AuthorizationException
+from app.domain.games.adapters import AsyncFirestoreGameRepository, FirestoreGameRepository
+from app.domain.games.schemas import GameCreate, GameUpdate, LevelComplete, LevelStart
+
+
+@pytest.mark.integration
+@pytest.mark.requires_firebase
+class TestFirestoreGameRepository:
+    """Tests para el repositorio de Games con Firestore"""
+
+    @pytest.fixture
+    def repository(self, mock_firestore_client):
+        """Repositorio con mock de Firestore"""
+        with patch(
+            "app.domain.games.adapters.firestore_repository.get_firestore_client",
+            return_value=mock_firestore_client,
+        ):
+            repo = FirestoreGameRepository()
+        # Las consultas que __init__ deja preparadas no cuentan en los asserts de los tests
+        mock_firestore_client.reset_mock()
+        # La caché de dueños es compartida a nivel de clase
+        FirestoreGameRepository._owner_cache.clear()
+        return repo
+
+    @pytest.fixture
+    def mock_transaction(self, mock_firestore_client):
+        """Transacción de Firestore (un solo intento)"""
+        transaction = MagicMock(_max_attempts=1, _read_only=False)
+        mock_firestore_client.transaction.return_value = transaction
+        return transaction
+
+    @pytest.fixture
+    def mock_doc_ref(self, mock_firestore_client, game_dict):
+        """Documento de partida existente en Firestore"""
+        mock_doc = MagicMock()
+        mock_doc.exists = True
+        mock_doc.to_dict.return_value = game_dict
+
+        doc_ref = mock_firestore_client.collection.return_value.document.return_value
+        doc_ref.get.return_value = mock_doc
+        return doc_ref
+
+    def test_complete_level_sends_partial_update(
+        self, repository, mock_doc_ref, mock_transaction, game_id
+    ):
+        """Completar nivel envía solo los campos modificados, sin sobrescribir el documento"""
+        level_data = LevelComplete(
+            level="aquelarre_sombras", time_seconds=600, deaths=2, choice="revelar", relic="manto"
+        )
+
+        result = repository.complete_level(game_id, level_data)
+
+        mock_doc_ref.get.assert_called_once_with(transaction=mock_transaction)
+        mock_doc_ref.set.assert_not_called()
+        mock_transaction.update.assert_called_once()
+        mock_transaction._commit.assert_called_once()
+        doc_ref, updates = mock_transaction.update.call_args[0]
+        assert doc_ref is mock_doc_ref
+
+        assert updates["levels_completed"] == ArrayUnion(["aquelarre_sombras"])
+        assert updates["metrics.time_per_level.aquelarre_sombras"] == 600
+        assert updates["metrics.deaths_per_level.aquelarre_sombras"] == 2
+        assert updates["metrics.total_deaths"] == Increment(2)
+        assert updates["total_time_seconds"] == Increment(600)
+        assert updates["choices.aquelarre_sombras"] == "revelar"
+        assert updates["relics"] == ArrayUnion(["manto"])
+        assert updates["completion_percentage"] == 60.0
+
+        # La partida devuelta refleja los cambios sin releer de Firestore
+        assert result.levels_completed == ["senda_ebano", "fortaleza_gigantes", "aquelarre_sombras"]
+        assert result.relics == ["lirio", "hacha", "manto"]
+        assert result.metrics.total_deaths == 10
+        assert result.metrics.time_per_level["aquelarre_sombras"] == 600
+        assert result.metrics.time_per_level["senda_ebano"] == 1200
+        assert result.choices.aquelarre_sombras == "revelar"
+        assert result.total_time_seconds == 3300
+
+    def test_complete_level_already_completed(
+        self, repository, mock_doc_ref, mock_transaction, game_id
+    ):
+        """Repetir un nivel no lo duplica ni reescribe la lista de niveles"""
+        level_data = LevelComplete(level="senda_ebano", time_seconds=100, deaths=0, choice="sanar")
+
+        result = repository.complete_level(game_id, level_data)
+
+        updates = mock_transaction.update.call_args[0][1]
+        assert "levels_completed" not in updates
+        assert "relics" not in updates
+        assert result.levels_completed == ["senda_ebano", "fortaleza_gigantes"]
+
+    def test_complete_level_with_extra_update(
+        self, repository, mock_doc_ref, mock_transaction, game_id
+    ):
+        """Los campos extra se escriben en el mismo update que el nivel"""
+        level_data = LevelComplete(level="claro_almas", time_seconds=300, deaths=1)
+
+        result = repository.complete_level(game_id, level_data, GameUpdate(boss_defeated=True))
+
+        mock_transaction.update.assert_called_once()
+        updates = mock_transaction.update.call_args[0][1]
+        assert updates["boss_defeated"] is True
+        assert result.boss_defeated is True
+
+    def test_complete_level_other_owner_rejected(
+        self, repository, mock_doc_ref, mock_transaction, game_id
+    ):
+        """El dueño se comprueba dentro de la transacción y no se escribe nada"""
+        level_data = LevelComplete(level="senda_ebano", time_seconds=60, deaths=0)
+
+        with pytest.raises(AuthorizationException):
+            repository.complete_level(game_id, level_data, owner_id="otro-jugador")
+
+        mock_doc_ref.get.assert_called_once_with(transaction=mock_transaction)
+        mock_transaction.update.assert_not_called()
+
+    def test_complete_level_game_not_active(
+        self, repository, mock_doc_ref, mock_transaction, game_id, game_dict
+    ):
+        """Una partida terminada no acepta más niveles"""
+        mock_doc_ref.get.return_value.to_dict.return_value = {**game_dict, "status": "completed"}
+        level_data = LevelComplete(level="senda_ebano", time_seconds=60, deaths=0)
+
+        with pytest.raises(ValueError, match="no está activa"):
+            repository.complete_level(game_id, level_data, owner_id=game_dict["player_id"])
+
+        mock_transaction.update.assert_not_called()
+
+    def test_complete_level_not_found(self, repository, mock_firestore_client, mock_transaction):
+        """Completar nivel de una partida que no existe"""
+        mock_doc = MagicMock()
+        mock_doc.exists = False
+        doc_ref = mock_firestore_client.collection.return_value.document.return_value
+        doc_ref.get.return_value = mock_doc
+
+        result = repository.complete_level(
+            "nonexistent-id", LevelComplete(level="senda_ebano", time_seconds=60, deaths=0)
+        )
+
+        assert result is None
+        mock_transaction.update.assert_not_called()
+
+    def test_get_by_player_summary_uses_projection(
+        self, repository, mock_firestore_client, game_dict, player_id
+    ):
+        """El resumen solo pide los campos necesarios a Firestore"""
+        mock_doc = MagicMock()
+        mock_doc.to_dict.return_value = game_dict
+        query = mock_firestore_client.collection.return_value.where.return_value
+        query.select.return_value.order_by.return_value.limit.return_value.get.return_value = [
+            mock_doc
+        ]
+
+        result = repository.get_by_player_summary(player_id, limit=10)
+
+        query.select.assert_called_once_with(FirestoreGameRepository.SUMMARY_FIELDS)
+        assert result == [
+            {
+                "game_id": game_dict["game_id"],
+                "player_id": player_id,
+                "status": "in_progress",
+                "completion_percentage": 66.67,
+                "started_at": game_dict["started_at"],
+            }
+        ]
+
+    def test_update_without_owner_in_transaction(
+        self, repository, mock_doc_ref, mock_transaction, game_dict
+    ):
+        """Sin owner_id (admin) también se lee y escribe en una transacción, sin releer"""
+        game, previous_status = repository.update_with_previous_status(
+            game_dict["game_id"], GameUpdate(status="completed")
+        )
+
+        mock_doc_ref.get.assert_called_once_with(transaction=mock_transaction)
+        mock_transaction.update.assert_called_once_with(mock_doc_ref, {"status": "completed"})
+        mock_doc_ref.update.assert_not_called()
+        assert game.status == "completed"
+        assert previous_status == "in_progress"
+
+    def test_update_not_found(self, repository, mock_firestore_client, mock_transaction):
+        """Actualizar una partida inexistente devuelve None sin escribir"""
+        doc_ref = mock_firestore_client.collection.return_value.document.return_value
+        doc_ref.get.return_value.exists = False
+
+        result = repository.update("nonexistent-id", GameUpdate(status="completed"))
+
+        assert result is None
+        mock_transaction.update.assert_not_called()
+
+    def test_empty_update_does_not_write(self, repository, mock_doc_ref, game_dict):
+        """Una actualización vacía solo lee la partida, sin escribir"""
+        result = repository.update(game_dict["game_id"], GameUpdate())
+
+        mock_doc_ref.update.assert_not_called()
+        assert mock_doc_ref.get.call_count == 1
+        assert result.game_id == game_dict["game_id"]
+
+    def test_delete_uses_exists_precondition(self, repository, mock_firestore_client, game_id):
+        """Borrar usa una precondición en lugar de leer el documento"""
+        doc_ref = mock_firestore_client.collection.return_value.document.return_value
+
+        assert repository.delete(game_id) is True
+
+        mock_firestore_client.write_option.assert_called_once_with(exists=True)
+        doc_ref.delete.assert_called_once_with(
+            option=mock_firestore_client.write_option.return_value
+        )
+        doc_ref.get.assert_not_called()
+
+    def test_delete_not_found(self, repository, mock_firestore_client):
+        """Borrar una partida inexistente devuelve False"""
+        doc_ref = mock_firestore_client.collection.return_value.document.return_value
+        doc_ref.delete.side_effect = NotFound("no existe")
+
+        assert repository.delete("nonexistent-id") is False
+
+    def test_get_by_id_not_cached(self, repository, mock_firestore_client, game_dict, game_id):
+        """get_by_id siempre lee de Firestore; solo el dueño queda en caché"""
+        doc_ref = mock_firestore_client.collection.return_value.document.return_value
+        mock_doc = MagicMock()
+        mock_doc.exists = True
+        mock_doc.to_dict.return_value = game_dict
+        doc_ref.get.return_value = mock_doc
+
+        repository.get_by_id(game_id)
+        repository.get_by_id(game_id)
+        owner = repository.get_owner(game_id)
+
+        assert doc_ref.get.call_count == 2
+        assert owner == game_dict["player_id"]
+
+    def test_write_invalidates_cache(self, repository, mock_firestore_client, game_dict, game_id):
+        """Escribir una partida invalida su dueño en caché"""
+        doc_ref = mock_firestore_client.collection.return_value.document.return_value
+        mock_doc = MagicMock()
+        mock_doc.exists = True
+        mock_doc.get.return_value = game_dict["player_id"]
+        doc_ref.get.return_value = mock_doc
+
+        repository.get_owner(game_id)
+        repository.delete(game_id)
+        repository.get_owner(game_id)
+
+        assert doc_ref.get.call_count == 2
+
+    def test_transactional_write_invalidates_cache(
+        self, repository, mock_doc_ref, mock_transaction, game_dict
+    ):
+        """Una escritura transaccional invalida la caché en lugar de rellenarla"""
+        game_id = game_dict["game_id"]
+        mock_doc_ref.get.return_value.get.return_value = game_dict["player_id"]
+        repository.get_owner(game_id)
+
+        repository.start_level(game_id, LevelStart(level="claro_almas"))
+        owner = repository.get_owner(game_id)
+
+        assert mock_doc_ref.get.call_args_list[-1] == call(field_paths=["player_id"])
+        assert owner == game_dict["player_id"]
+
+    def test_get_all_summary_page_applies_filters_and_projection(
+        self, repository, mock_firestore_client, game_dict, player_id
+    ):
+        """El resumen global aplica filtros, proyección y devuelve el cursor"""
+        mock_doc = MagicMock()
+        mock_doc.to_dict.return_value = game_dict
+        collection = mock_firestore_client.collection.return_value
+        query = collection.where.return_value
+        ordered = query.select.return_value.order_by.return_value.order_by.return_value
+        ordered.limit.return_value.get.return_value = [mock_doc]
+
+        result, next_cursor = repository.get_all_summary_page(limit=1, days=7)
+
+        collection.where.assert_called_once()
+        query.select.assert_called_once_with(FirestoreGameRepository.SUMMARY_FIELDS)
+        ordered.limit.assert_called_once_with(1)
+        assert result[0]["player_id"] == player_id
+        assert "metrics" not in result[0]
+        assert next_cursor == {
+            "started_at": game_dict["started_at"],
+            "__name__": game_dict["game_id"],
+        }
+
+    def test_get_all_page_returns_next_cursor(self, repository, mock_firestore_client, game_dict):
+        """Una página completa devuelve el cursor de la última partida"""
+        mock_doc = MagicMock()
+        mock_doc.to_dict.return_value = game_dict
+        ordered = mock_firestore_client.collection.return_value.order_by.return_value.order_by
+        ordered.return_value.limit.return_value.get.return_value = [mock_doc]
+
+        games, next_cursor = repository.get_all_page(limit=1)
+
+        assert len(games) == 1
+        assert next_cursor == {
+            "started_at": game_dict["started_at"],
+            "__name__": game_dict["game_id"],
+        }
+
+    def test_get_all_page_starts_after_cursor(self, repository, mock_firestore_client, game_dict):
+        """Con cursor la consulta continúa tras el último documento y sin más páginas"""
+        cursor = {"started_at": game_dict["started_at"], "__name__": game_dict["game_id"]}
+        ordered = mock_firestore_client.collection.return_value.order_by.return_value.order_by
+        after = ordered.return_value.start_after
+        after.return_value.limit.return_value.get.return_value = []
+
+        games, next_cursor = repository.get_all_page(limit=10, cursor=cursor)
+
+        after.assert_called_once_with(cursor)
+        assert games == []
+        assert next_cursor is None
+
+    def test_get_by_player_page_single_query(self, repository, mock_firestore_client, game_dict):
+        """Las partidas de un jugador se piden con una sola consulta paginada"""
+        mock_doc = MagicMock()
+        mock_doc.to_dict.return_value = game_dict
+        where = mock_firestore_client.collection.return_value.where
+        ordered = where.return_value.order_by.return_value.order_by
+        ordered.return_value.limit.return_value.get.return_value = [mock_doc]
+
+        games, next_cursor = repository.get_by_player_page(game_dict["player_id"], limit=1)
+
+        where.assert_called_once()
+        ordered.return_value.limit.assert_called_once_with(1)
+        assert games[0].player_id == game_dict["player_id"]
+        assert next_cursor == {
+            "started_at": game_dict["started_at"],
+            "__name__": game_dict["game_id"],
+        }
+
+    def test_stream_by_player_builds_games_lazily(
+        self, repository, mock_firestore_client, game_dict
+    ):
+        """stream_by_player no construye más partidas de las que se consumen"""
+        mock_doc = MagicMock()
+        mock_doc.to_dict.return_value = game_dict
+        query = mock_firestore_client.collection.return_value.where.return_value
+        query.order_by.return_value.limit.return_value.stream.return_value = iter(
+            [mock_doc, mock_doc, mock_doc]
+        )
+
+        first = next(repository.stream_by_player(game_dict["player_id"]))
+
+        assert first.game_id == game_dict["game_id"]
+        assert mock_doc.to_dict.call_count == 1
+
+    def test_get_owner_reads_only_player_id(self, repository, mock_firestore_client, game_dict):
+        """get_owner pide a Firestore solo el campo player_id"""
+        doc_ref = mock_firestore_client.collection.return_value.document.return_value
+        snap = MagicMock(exists=True)
+        snap.get.return_value = game_dict["player_id"]
+        doc_ref.get.return_value = snap
+
+        assert repository.get_owner(game_dict["game_id"]) == game_dict["player_id"]
+        doc_ref.get.assert_called_once_with(field_paths=["player_id"])
+
+        snap.exists = False
+        assert repository.get_owner("nonexistent-id") is None
+
+    def test_start_level_partial_update(
+        self, repository, mock_doc_ref, mock_transaction, game_dict
+    ):
+        """Iniciar nivel solo envía el timestamp de inicio y el nivel actual, sin releer"""
+        result = repository.start_level(game_dict["game_id"], LevelStart(level="claro_almas"))
+
+        mock_doc_ref.get.assert_called_once_with(transaction=mock_transaction)
+        mock_doc_ref.set.assert_not_called()
+        updates = mock_transaction.update.call_args[0][1]
+        assert set(updates) == {"metrics.level_start_times.claro_almas", "current_level"}
+        assert updates["current_level"] == "claro_almas"
+        assert result.current_level == "claro_almas"
+
+    def test_start_level_not_found(self, repository, mock_firestore_client, mock_transaction):
+        """Iniciar nivel en una partida inexistente devuelve None"""
+        mock_doc = MagicMock()
+        mock_doc.exists = False
+        doc_ref = mock_firestore_client.collection.return_value.document.return_value
+        doc_ref.get.return_value = mock_doc
+
+        assert repository.start_level("nonexistent-id", LevelStart(level="senda_ebano")) is None
+        mock_transaction.update.assert_not_called()
+
+    def test_start_level_game_not_active(
+        self, repository, mock_doc_ref, mock_transaction, game_dict
+    ):
+        """Una partida terminada no puede iniciar niveles"""
+        mock_doc_ref.get.return_value.to_dict.return_value = {**game_dict, "status": "completed"}
+
+        with pytest.raises(ValueError, match="no está activa"):
+            repository.start_level(game_dict["game_id"], LevelStart(level="senda_ebano"))
+
+        mock_transaction.update.assert_not_called()
+
+    def test_update_owned_checked_in_transaction(
+        self, repository, mock_doc_ref, mock_transaction, game_dict
+    ):
+        """Con owner_id se lee y escribe en una transacción; otro dueño no escribe nada"""
+        with pytest.raises(AuthorizationException):
+            repository.update(
+                game_dict["game_id"], GameUpdate(status="completed"), owner_id="otro-jugador"
+            )
+        mock_transaction.update.assert_not_called()
+
+        result = repository.update(
+            game_dict["game_id"], GameUpdate(status="completed"), owner_id=game_dict["player_id"]
+        )
+
+        mock_transaction.update.assert_called_once_with(mock_doc_ref, {"status": "completed"})
+        mock_doc_ref.update.assert_not_called()
+        assert result.status == "completed"
+
+    def test_count_fallback_does_not_load_games(self, repository, mock_firestore_client):
+        """Si falla la agregación se cuentan IDs con los mismos filtros, sin cargar partidas"""
+        collection = mock_firestore_client.collection.return_value
+        query = collection.where.return_value
+        query.count.side_effect = Exception("aggregation no disponible")
+        query.select.return_value.limit.return_value.stream.return_value = iter([1, 2, 3])
+
+        assert repository.count(player_id="player-1") == 3
+
+        query.select.assert_called_once_with([])
+        query.select.return_value.limit.assert_called_once_with(10000)
+        collection.order_by.assert_not_called()
+
+    def test_create_replacing_active_closes_in_transaction(
+        self, repository, mock_firestore_client, mock_transaction, game_dict
+    ):
+        """La partida en curso se cierra y la nueva se crea en la misma transacción"""
+        active_snap = MagicMock()
+        active_snap.to_dict.return_value = game_dict
+        mock_transaction.get.return_value = iter([active_snap])
+
+        game, closed = repository.create_replacing_active(
+            GameCreate(player_id=game_dict["player_id"])
+        )
+
+        close_data = mock_transaction.update.call_args[0][1]
+        assert mock_transaction.update.call_args[0][0] is active_snap.reference
+        assert close_data["status"] == "abandoned"
+        mock_transaction.create.assert_called_once()
+        assert closed.game_id == game_dict["game_id"]
+        assert closed.status == "abandoned"
+        assert game.player_id == game_dict["player_id"]
+        assert game.status == "in_progress"
+
+    def test_create_replacing_active_without_active_game(
+        self, repository, mock_firestore_client, mock_transaction, game_dict
+    ):
+        """Sin partida en curso solo se crea la nueva"""
+        mock_transaction.get.return_value = iter([])
+
+        _, closed = repository.create_replacing_active(GameCreate(player_id="player-1"))
+
+        assert closed is None
+        mock_transaction.update.assert_not_called()
+        mock_transaction.create.assert_called_once()
+
+    def test_get_active_game_uses_single_get(self, repository, mock_firestore_client, game_dict):
+        """get_active_game resuelve con get() y devuelve la primera partida o None"""
+        in_progress = mock_firestore_client.collection.return_value.where.return_value
+        query = in_progress.where.return_value.limit.return_value
+        snap = MagicMock()
+        snap.to_dict.return_value = game_dict
+        query.get.return_value = [snap]
+
+        assert repository.get_active_game("player-1").game_id == game_dict["game_id"]
+        query.stream.assert_not_called()
+        # La parte fija (status == in_progress) se construye una vez, no en cada llamada
+        mock_firestore_client.collection.return_value.where.assert_not_called()
+        in_progress.where.assert_called_once()
+
+        query.get.return_value = []
+        assert repository.get_active_game("player-1") is None
+
+
+@pytest.mark.integration
+@pytest.mark.requires_firebase
+class TestAsyncFirestoreGameRepository:
+    """Tests para el repositorio asíncrono de Games"""
+
+    @pytest.fixture
+    def repository(self, mock_firestore_client):
+        """Repositorio con mock del cliente asíncrono"""
+        return AsyncFirestoreGameRepository(db=mock_firestore_client)
+
+    @staticmethod
+    def _snap(data):
+        snap = MagicMock()
+        snap.exists = data is not None
+        snap.to_dict.return_value = data
+        return snap
+
+    async def test_stream_all_yields_games(self, repository, mock_firestore_client, game_dict):
+        """stream_all entrega las partidas una a una desde query.stream()"""
+
+        async def stream():
+            for data in (game_dict, {**game_dict, "game_id": "game-2"}):
+                yield self._snap(data)
+
+        query = mock_firestore_client.collection.return_value.order_by.return_value
+        query.stream = stream
+
+        games = [game.game_id async for game in repository.stream_all()]
+
+        assert games == [game_dict["game_id"], "game-2"]
@@ -0,0 +1,55 @@
+"""
+Tests de integración para el repositorio de Leaderboard con Firestore.
+
+Prueba la interacción entre el repositorio y el mock de Firestore.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.domain.leaderboard.models import LeaderboardType
+from app.domain.leaderboard.repository import LeaderboardRepository
+
+
+@pytest.mark.integration
+@pytest.mark.requires_firebase
+class TestLeaderboardRepository:
+    """Tests para el repositorio de Leaderboard con Firestore"""
+
+    @pytest.fixture
+    def repository(self, mock_firestore_client):
+        """Repositorio con mock de Firestore"""
+        with patch(
+            "app.domain.leaderboard.repository.get_firestore_client",
+            return_value=mock_firestore_client,
+        ):
+            repo = LeaderboardRepository()
+        # La caché de get_by_type es compartida a nivel de clase
+        LeaderboardRepository._cache.clear()
+        return repo
+
+    def test_get_by_type_cached(self, repository, mock_firestore_client, sample_leaderboard):
+        """Lecturas repetidas del mismo leaderboard no vuelven a Firestore"""
+        doc_ref = mock_firestore_client.collection.return_value.document.return_value
+        mock_doc = MagicMock()
+        mock_doc.exists = True
+        mock_doc.to_dict.return_value = sample_leaderboard.to_dict()
+        doc_ref.get.return_value = mock_doc
+
+        first = repository.get_by_type(LeaderboardType.SPEEDRUN)
+        second = repository.get_by_type(LeaderboardType.SPEEDRUN)
+
+        assert doc_ref.get.call_count == 1
+        assert second.entries == first.entries
+
+    def test_save_updates_cache(self, repository, mock_firestore_client, sample_leaderboard):
+        """Tras guardar un leaderboard, leerlo no va a Firestore"""
+        doc_ref = mock_firestore_client.collection.return_value.document.return_value
+
+        repository.save(sample_leaderboard)
+        result = repository.get_by_type(LeaderboardType.SPEEDRUN)
+
+        doc_ref.set.assert_called_once()
+        doc_ref.get.assert_not_called()
+        assert result.entries == sample_leaderboard.entries
@@ -114,3 +114,25 @@ class TestFirestorePlayerRepository:
         # Verificar
         assert result is True
         mock_doc_ref.delete.assert_called_once()
+
+    def test_get_many(self, repository, mock_firestore_client, sample_player):
+        """Obtener varios jugadores en una sola llamada"""
+        mock_doc = MagicMock()
+        mock_doc.exists = True
+        mock_doc.id = sample_player.player_id
+        mock_doc.to_dict.return_value = sample_player.to_dict()
+        mock_firestore_client.get_all.return_value = [mock_doc]
+
+        result = repository.get_many([sample_player.player_id, "nonexistent-id"])
+
+        mock_firestore_client.get_all.assert_called_once()
+        assert result[0].username == sample_player.username
+        assert result[1] is None
+
+    def test_exists_reads_only_player_id(self, repository, mock_firestore_client):
+        """Comprobar si existe un jugador no descarga el documento completo"""
+        doc_ref = mock_firestore_client.collection.return_value.document.return_value
+        doc_ref.get.return_value.exists = True
+
+        assert repository.exists("player-123") is True
+        doc_ref.get.assert_called_once_with(field_paths=["player_id"])
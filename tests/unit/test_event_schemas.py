@@ -0,0 +1,70 @@
+"""
+Tests unitarios para schemas de Events.
+
+Prueba la validación de datos de entrada/salida de la API.
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from app.domain.events.schemas import EventBatchCreate, EventCreate
+
+
+@pytest.mark.unit
+class TestEventCreate:
+    """Tests para el schema EventCreate"""
+
+    def _event(self, **overrides):
+        data = {
+            "game_id": "abc-123",
+            "player_id": "xyz-789",
+            "event_type": "player_death",
+            "level": "senda_ebano",
+        }
+        data.update(overrides)
+        return data
+
+    def test_data_defaults_to_empty_dict(self):
+        """data es opcional y por defecto es un dict vacío"""
+        event = EventCreate(**self._event())
+        assert event.data == {}
+
+    def test_data_passed_through_unchanged(self):
+        """El payload de data se guarda tal cual, sin copiarlo"""
+        payload = {"position": {"x": 150.5, "y": 200.3}, "cause": "fall"}
+        event = EventCreate(**self._event(data=payload))
+        assert event.data is payload
+
+    @pytest.mark.edge_case
+    def test_data_must_be_object(self):
+        """Rechazar data que no sea un objeto JSON"""
+        for invalid in ([1, 2, 3], "texto", 42):
+            with pytest.raises(ValidationError) as exc_info:
+                EventCreate(**self._event(data=invalid))
+            assert "objeto json" in str(exc_info.value).lower()
+
+    @pytest.mark.edge_case
+    def test_invalid_event_type_rejected(self):
+        """Rechazar tipo de evento inválido"""
+        with pytest.raises(ValidationError):
+            EventCreate(**self._event(event_type="invalid_type"))
+
+
+@pytest.mark.unit
+class TestEventBatchCreate:
+    """Tests para el schema EventBatchCreate"""
+
+    def test_batch_from_json_payload(self):
+        """Crear batch desde el JSON que envía Unity"""
+        batch = EventBatchCreate.model_validate_json(
+            '{"events": [{"game_id": "abc-123", "player_id": "xyz-789", '
+            '"event_type": "checkpoint_reached", "level": "senda_ebano", '
+            '"data": {"checkpoint_id": "checkpoint_1"}}]}'
+        )
+        assert batch.events[0].data == {"checkpoint_id": "checkpoint_1"}
+
+    @pytest.mark.edge_case
+    def test_batch_size_limits(self):
+        """El batch debe tener entre 1 y 100 eventos"""
+        with pytest.raises(ValidationError):
+            EventBatchCreate(events=[])
@@ -4,7 +4,7 @@ Tests unitarios para el servicio de Events.
 Prueba la lógica de negocio del EventService.
 """
 
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -157,6 +157,35 @@ class TestEventServiceBatch:
         # Debe validar el jugador solo 1 vez (no 3)
         assert service.player_repo.get_by_id.call_count == 1
 
+    @pytest.mark.edge_case
+    def test_create_batch_multiple_players_single_lookup(
+        self, mock_event_repository, sample_player
+    ):
+        """Con varios jugadores se validan todos en una sola lectura batch"""
+        mock_player_repo = MagicMock()
+        mock_player_repo.get_many.return_value = [sample_player, None]
+
+        service = EventService(mock_event_repository, MagicMock(), mock_player_repo)
+
+        batch_data = EventBatchCreate(
+            events=[
+                EventCreate(
+                    game_id="game-1",
+                    player_id=player,
+                    event_type="player_death",
+                    level="senda_ebano",
+                )
+                for player in ("player-a", "player-b", "player-a")
+            ]
+        )
+
+        with pytest.raises(ValueError, match="player-b no encontrado"):
+            service.create_batch(batch_data)
+
+        mock_player_repo.get_many.assert_called_once_with(["player-a", "player-b"])
+        mock_player_repo.get_by_id.assert_not_called()
+        mock_event_repository.create_batch.assert_not_called()
+
 
 @pytest.mark.unit
 class TestEventServiceQuery:
@@ -193,6 +222,22 @@ class TestEventServiceQuery:
             player_id, 200, None, None, None
         )
 
+    def test_read_only_does_not_create_default_repositories(
+        self, mock_event_repository, sample_event, game_id
+    ):
+        """Las consultas no instancian los repositorios de games/players por defecto"""
+        mock_event_repository.get_by_game.return_value = [sample_event]
+
+        with (
+            patch("app.domain.events.service.FirestoreGameRepository") as game_repo_cls,
+            patch("app.domain.events.service.FirestorePlayerRepository") as player_repo_cls,
+        ):
+            service = EventService(mock_event_repository)
+            service.get_game_events(game_id)
+
+        game_repo_cls.assert_not_called()
+        player_repo_cls.assert_not_called()
+
     def test_query_events_with_filters(
         self, mock_event_repository, sample_event, player_id, game_id
     ):
@@ -0,0 +1,51 @@
+"""
+Tests unitarios para modelos de Games.
+
+Prueba la conversión entre el modelo y los documentos de Firestore.
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from app.domain.games.models import Game
+
+
+@pytest.mark.unit
+class TestGame:
+    """Tests para el modelo Game"""
+
+    def test_to_dict_matches_model_dump(self):
+        """to_dict produce el mismo documento que model_dump, con todos los campos"""
+        game = Game(
+            player_id="player-1",
+            ended_at=datetime(2026, 1, 2, tzinfo=timezone.utc),
+            levels_completed=["senda_ebano"],
+            relics=["lirio"],
+        )
+        game.choices.senda_ebano = "sanar"
+        game.metrics.time_per_level["senda_ebano"] = 600
+
+        data = game.to_dict()
+
+        assert data == game.model_dump()
+        assert set(data) == set(Game.model_fields)
+        assert data["started_at"] is game.started_at
+
+    def test_to_dict_round_trip(self):
+        """Un Game reconstruido desde to_dict es igual al original"""
+        game = Game(player_id="player-1", current_level="senda_ebano")
+
+        assert Game.from_dict(game.to_dict()) == game
+
+    def test_to_dict_copies_containers(self):
+        """Modificar el dict de to_dict no cambia la partida"""
+        game = Game(player_id="player-1", relics=["lirio"])
+        game.metrics.time_per_level["senda_ebano"] = 600
+
+        data = game.to_dict()
+        data["relics"].append("hacha")
+        data["metrics"]["time_per_level"]["senda_ebano"] = 0
+
+        assert game.relics == ["lirio"]
+        assert game.metrics.time_per_level == {"senda_ebano": 600}
@@ -21,6 +21,12 @@ class TestGameUpdate:
             GameUpdate(status="invalid_status")
         assert "no válido" in str(exc_info.value).lower()
 
+    def test_update_is_frozen(self):
+        """GameUpdate es inmutable para poder reutilizar instancias"""
+        update = GameUpdate(status="completed")
+        with pytest.raises(ValidationError):
+            update.status = "abandoned"
+
     def test_valid_statuses_accepted(self):
         """Aceptar statuses válidos"""
         for status in ["in_progress", "completed", "abandoned"]:
@@ -69,6 +75,18 @@ class TestLevelComplete:
         assert data.choice == "sanar"
         assert data.relic == "lirio"
 
+    @pytest.mark.edge_case
+    def test_choice_must_match_level(self):
+        """La decisión moral debe ser una de las del nivel completado"""
+        with pytest.raises(ValidationError) as exc_info:
+            LevelComplete(level="senda_ebano", deaths=0, choice="revelar")
+        assert "revelar" in str(exc_info.value)
+        # El error se reporta en el campo choice
+        assert exc_info.value.errors()[0]["loc"] == ("choice",)
+
+        # Niveles sin decisión moral no validan choice
+        LevelComplete(level="hub_central", deaths=0, choice="revelar")
+
     @pytest.mark.edge_case
     def test_time_boundaries(self):
         """Validar límites de tiempo"""
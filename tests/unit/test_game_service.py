@@ -8,6 +8,7 @@ from datetime import datetime
 
 import pytest
 
+from app.core.exceptions import AuthorizationException, NotFoundException
 from app.domain.games.schemas import GameCreate, GameUpdate, LevelComplete, LevelStart
 from app.domain.games.service import GameService
 
@@ -26,9 +27,9 @@ class TestGameServiceCreate:
     ):
         """Crear partida exitosamente"""
         # Configurar mocks
-        mock_player_repository.get_by_id.return_value = sample_player
-        mock_game_repository.get_active_game.return_value = None  # Sin partida activa
-        mock_game_repository.create.return_value = new_game
+        mock_player_repository.exists.return_value = True
+        # Sin partida activa que cerrar
+        mock_game_repository.create_replacing_active.return_value = (new_game, None)
 
         # Ejecutar
         service = GameService(mock_game_repository, mock_player_repository, mock_player_service)
@@ -37,9 +38,10 @@ class TestGameServiceCreate:
 
         # Verificar
         assert result == new_game
-        mock_player_repository.get_by_id.assert_called_once()
-        mock_game_repository.get_active_game.assert_called_once()
-        mock_game_repository.create.assert_called_once()
+        mock_player_repository.exists.assert_called_once_with(sample_player.player_id)
+        mock_player_repository.get_by_id.assert_not_called()
+        mock_game_repository.create_replacing_active.assert_called_once_with(game_data)
+        mock_player_service.update_player_stats_after_game.assert_not_called()
 
     @pytest.mark.edge_case
     def test_create_game_player_not_found(
@@ -47,17 +49,18 @@ class TestGameServiceCreate:
     ):
         """Rechazar crear partida si jugador no existe"""
         # Configurar mock: jugador no existe
-        mock_player_repository.get_by_id.return_value = None
+        mock_player_repository.exists.return_value = False
 
         # Ejecutar y verificar
         service = GameService(mock_game_repository, mock_player_repository, mock_player_service)
         game_data = GameCreate(player_id="nonexistent-player")
 
-        with pytest.raises(ValueError) as exc_info:
+        with pytest.raises(NotFoundException) as exc_info:
             service.create_game(game_data)
 
-        assert "no encontrado" in str(exc_info.value).lower()
-        mock_game_repository.create.assert_not_called()
+        assert exc_info.value.status_code == 404
+        assert "nonexistent-player" in exc_info.value.message
+        mock_game_repository.create_replacing_active.assert_not_called()
 
     @pytest.mark.edge_case
     def test_create_game_already_has_active_game(
@@ -71,25 +74,24 @@ class TestGameServiceCreate:
     ):
         """Auto-cierra partida anterior si jugador ya tiene una activa"""
         # Configurar mocks
-        mock_player_repository.get_by_id.return_value = sample_player
-        mock_game_repository.get_active_game.return_value = active_game
-        mock_game_repository.update.return_value = active_game
-        mock_game_repository.create.return_value = new_game
+        abandoned = active_game.model_copy(update={"status": "abandoned"})
+        mock_player_repository.exists.return_value = True
+        mock_game_repository.create_replacing_active.return_value = (new_game, abandoned)
 
         # Ejecutar
         service = GameService(mock_game_repository, mock_player_repository, mock_player_service)
         game_data = GameCreate(player_id=sample_player.player_id)
         result = service.create_game(game_data)
 
-        # Verificar que se cerró la partida anterior automáticamente
-        mock_game_repository.update.assert_called_once()
-        update_call = mock_game_repository.update.call_args[0]
-        assert update_call[0] == active_game.game_id  # ID de partida a actualizar
-        assert update_call[1].status == "abandoned"  # Estado de cierre
+        # Verificar que la partida cerrada cuenta en las stats del jugador
+        mock_player_service.update_player_stats_after_game.assert_called_once_with(
+            sample_player.player_id, abandoned
+        )
 
-        # Verificar que se creó la nueva partida
+        # Verificar que se creó la nueva partida (cierre y creación en una sola llamada)
         assert result == new_game
-        mock_game_repository.create.assert_called_once()
+        mock_game_repository.update.assert_not_called()
+        mock_game_repository.create_replacing_active.assert_called_once_with(game_data)
 
 
 @pytest.mark.unit
@@ -105,7 +107,6 @@ class TestGameServiceLevels:
     ):
         """Iniciar nivel exitosamente"""
         # Configurar mocks
-        mock_game_repository.get_by_id.return_value = active_game
         mock_game_repository.start_level.return_value = active_game
 
         # Ejecutar
@@ -113,9 +114,12 @@ class TestGameServiceLevels:
         level_data = LevelStart(level="aquelarre_sombras")
         result = service.start_level(active_game.game_id, level_data)
 
-        # Verificar
+        # Verificar: el repositorio comprueba dueño y estado, sin lectura previa
         assert result == active_game
-        mock_game_repository.start_level.assert_called_once()
+        mock_game_repository.get_by_id.assert_not_called()
+        mock_game_repository.start_level.assert_called_once_with(
+            active_game.game_id, level_data, owner_id=None
+        )
 
     @pytest.mark.edge_case
     def test_start_level_game_not_active(
@@ -126,8 +130,8 @@ class TestGameServiceLevels:
         completed_game,
     ):
         """Rechazar iniciar nivel si partida no está activa"""
-        # Configurar mock: partida completada (no activa)
-        mock_game_repository.get_by_id.return_value = completed_game
+        # Configurar mock: el repositorio rechaza la partida completada (no activa)
+        mock_game_repository.start_level.side_effect = ValueError("La partida no está activa")
 
         # Ejecutar y verificar
         service = GameService(mock_game_repository, mock_player_repository, mock_player_service)
@@ -137,7 +141,6 @@ class TestGameServiceLevels:
             service.start_level(completed_game.game_id, level_data)
 
         assert "no está activa" in str(exc_info.value).lower()
-        mock_game_repository.start_level.assert_not_called()
 
     def test_complete_level_success(
         self,
@@ -181,12 +184,9 @@ class TestGameServiceLevels:
         )
         service.complete_level(active_game.game_id, level_data)
 
-        # Verificar que se actualizó boss_defeated
-        update_calls = mock_game_repository.update.call_args_list
-        assert len(update_calls) > 0
-
-        # Verificar que el update incluye boss_defeated=True
-        boss_update = update_calls[0][0][1]
+        # boss_defeated=True viaja en la misma escritura que el nivel
+        mock_game_repository.update.assert_not_called()
+        boss_update = mock_game_repository.complete_level.call_args[0][2]
         assert boss_update.boss_defeated is True
 
 
@@ -261,8 +261,10 @@ class TestGameServiceFinish:
         completed = active_game.model_copy()
         completed.status = "completed"
 
-        mock_game_repository.get_by_id.return_value = active_game
-        mock_game_repository.update.return_value = completed
+        mock_game_repository.update_with_previous_status.return_value = (
+            completed,
+            "in_progress",
+        )
 
         # Ejecutar
         service = GameService(mock_game_repository, mock_player_repository, mock_player_service)
@@ -272,6 +274,27 @@ class TestGameServiceFinish:
         # Verificar que se actualizaron las stats del jugador
         mock_player_service.update_player_stats_after_game.assert_called_once()
 
+    def test_update_game_retry_does_not_repeat_stats(
+        self,
+        mock_game_repository,
+        mock_player_repository,
+        mock_player_service,
+        active_game,
+    ):
+        """Repetir la misma finalización (reintento del cliente) no vuelve a sumar stats"""
+        completed = active_game.model_copy()
+        completed.status = "completed"
+
+        # El repositorio lee en su transacción que la partida ya estaba completada
+        mock_game_repository.update_with_previous_status.return_value = (completed, "completed")
+
+        service = GameService(mock_game_repository, mock_player_repository, mock_player_service)
+        result = service.update_game(active_game.game_id, GameUpdate(status="completed"))
+
+        assert result == completed
+        mock_game_repository.get_by_id.assert_not_called()
+        mock_player_service.update_player_stats_after_game.assert_not_called()
+
     def test_update_game_no_stats_update_if_in_progress(
         self,
         mock_game_repository,
@@ -281,8 +304,10 @@ class TestGameServiceFinish:
     ):
         """Actualizar partida sin cambiar status NO actualiza stats"""
         # Configurar mocks
-        mock_game_repository.get_by_id.return_value = active_game
-        mock_game_repository.update.return_value = active_game
+        mock_game_repository.update_with_previous_status.return_value = (
+            active_game,
+            "in_progress",
+        )
 
         # Ejecutar (actualizar completion_percentage, NO status)
         service = GameService(mock_game_repository, mock_player_repository, mock_player_service)
@@ -313,26 +338,52 @@ class TestGameServiceGet:
 
         assert result == active_game
 
-    def test_get_player_games(
+    def test_get_player_games_page(
         self,
         mock_game_repository,
         mock_player_repository,
         mock_player_service,
         active_game,
-        completed_game,
         player_id,
     ):
-        """Obtener todas las partidas de un jugador"""
-        mock_game_repository.get_by_player.return_value = [active_game, completed_game]
+        """La página de partidas de un jugador pasa el cursor al repositorio"""
+        cursor = {"started_at": active_game.started_at, "__name__": active_game.game_id}
+        mock_game_repository.get_by_player_page.return_value = ([active_game], None)
 
         service = GameService(mock_game_repository, mock_player_repository, mock_player_service)
-        result = service.get_player_games(player_id)
+        games, next_cursor = service.get_player_games_page(player_id, limit=10, cursor=cursor)
 
-        assert len(result) == 2
-        mock_game_repository.get_by_player.assert_called_once_with(
-            player_id, limit=100, days=None, since=None, until=None
+        assert games == [active_game]
+        assert next_cursor is None
+        mock_game_repository.get_by_player_page.assert_called_once_with(
+            player_id, limit=10, cursor=cursor, days=None, since=None, until=None
         )
 
+    def test_get_player_games_summary(
+        self,
+        mock_game_repository,
+        mock_player_repository,
+        mock_player_service,
+        active_game,
+        player_id,
+    ):
+        """El resumen de partidas usa la proyección ligera del repositorio"""
+        summary = {
+            "game_id": active_game.game_id,
+            "player_id": active_game.player_id,
+            "status": active_game.status,
+            "completion_percentage": active_game.completion_percentage,
+            "started_at": active_game.started_at,
+        }
+        mock_game_repository.get_by_player_summary.return_value = [summary]
+
+        service = GameService(mock_game_repository, mock_player_repository, mock_player_service)
+        result = service.get_player_games_summary(player_id, limit=20)
+
+        assert result == [summary]
+        mock_game_repository.get_by_player_summary.assert_called_once_with(player_id, limit=20)
+        mock_game_repository.get_by_player_page.assert_not_called()
+
 
 @pytest.mark.unit
 class TestGameServiceDelete:
@@ -351,6 +402,71 @@ class TestGameServiceDelete:
         mock_game_repository.delete.assert_called_once_with("game-123")
 
 
+@pytest.mark.unit
+class TestGameServiceOwnership:
+    """Tests para la verificación de dueño en las operaciones de escritura"""
+
+    def test_update_game_other_owner_rejected(
+        self, mock_game_repository, mock_player_repository, mock_player_service, active_game
+    ):
+        """Modificar la partida de otro jugador lanza AuthorizationException sin tocar stats"""
+        mock_game_repository.update_with_previous_status.side_effect = AuthorizationException(
+            "No tienes permisos para acceder a esta partida"
+        )
+
+        service = GameService(mock_game_repository, mock_player_repository, mock_player_service)
+        with pytest.raises(AuthorizationException):
+            service.update_game(
+                active_game.game_id, GameUpdate(status="completed"), owner_id="otro-jugador"
+            )
+
+        mock_game_repository.get_by_id.assert_not_called()
+        mock_player_service.update_player_stats_after_game.assert_not_called()
+
+    def test_complete_level_owner_checked_in_transaction(
+        self, mock_game_repository, mock_player_repository, mock_player_service, active_game
+    ):
+        """El dueño se delega a la transacción del repositorio, sin lectura previa"""
+        mock_game_repository.complete_level.return_value = active_game
+
+        service = GameService(mock_game_repository, mock_player_repository, mock_player_service)
+        level_data = LevelComplete(level="senda_ebano", time_seconds=100, deaths=0)
+        result = service.complete_level(
+            active_game.game_id, level_data, owner_id=active_game.player_id
+        )
+
+        assert result == active_game
+        mock_game_repository.get_by_id.assert_not_called()
+        mock_game_repository.complete_level.assert_called_once_with(
+            active_game.game_id, level_data, None, owner_id=active_game.player_id
+        )
+
+    def test_delete_game_other_owner_rejected(
+        self, mock_game_repository, mock_player_repository, mock_player_service, active_game
+    ):
+        """Borrar la partida de otro jugador no llega a borrar (solo lee el dueño)"""
+        mock_game_repository.get_owner.return_value = active_game.player_id
+
+        service = GameService(mock_game_repository, mock_player_repository, mock_player_service)
+        with pytest.raises(AuthorizationException):
+            service.delete_game(active_game.game_id, owner_id="otro-jugador")
+
+        mock_game_repository.get_by_id.assert_not_called()
+        mock_game_repository.delete.assert_not_called()
+
+    def test_delete_game_as_admin_skips_read(
+        self, mock_game_repository, mock_player_repository, mock_player_service
+    ):
+        """Sin dueño que comprobar (admin) se borra sin leer la partida"""
+        mock_game_repository.delete.return_value = True
+
+        service = GameService(mock_game_repository, mock_player_repository, mock_player_service)
+
+        assert service.delete_game("game-123") is True
+        mock_game_repository.get_by_id.assert_not_called()
+        mock_game_repository.get_owner.assert_not_called()
+
+
 @pytest.mark.unit
 class TestGameServiceCount:
     """Tests para contar partidas"""
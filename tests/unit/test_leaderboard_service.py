@@ -127,7 +127,7 @@ class TestLeaderboardServiceRefresh:
         """Recalcular leaderboards con jugadores elegibles"""
         # Jugador con partida completada
         mock_player_repository.get_all.return_value = [sample_player]
-        mock_game_repository.get_by_player.return_value = [completed_game]
+        mock_game_repository.stream_by_player.return_value = [completed_game]
 
         service = LeaderboardService(
             repository=mock_leaderboard_repository,
@@ -153,7 +153,7 @@ class TestLeaderboardServiceRefresh:
         """Solo incluir jugadores con games_completed > 0"""
         # sample_player tiene games_completed=6, new_player tiene 0
         mock_player_repository.get_all.return_value = [sample_player, new_player]
-        mock_game_repository.get_by_player.return_value = []
+        mock_game_repository.stream_by_player.return_value = []
 
         service = LeaderboardService(
             repository=mock_leaderboard_repository,
@@ -162,9 +162,9 @@ class TestLeaderboardServiceRefresh:
         )
         service.refresh_all_leaderboards()
 
-        # Verificar que get_by_player solo se llamó para sample_player
+        # Verificar que stream_by_player solo se llamó para sample_player
         # (se llama 4 veces por los 4 tipos de leaderboard)
-        calls = mock_game_repository.get_by_player.call_args_list
+        calls = mock_game_repository.stream_by_player.call_args_list
         player_ids_called = [call[0][0] for call in calls]
 
         # Solo sample_player tiene games_completed > 0